@@ -2,6 +2,7 @@ import asyncio
 import random
 import string
 import time
+from typing import Optional
 
 import nest_asyncio
 import ormar
@@ -47,6 +48,56 @@ class Book(ormar.Model):
     year: int = ormar.Integer(nullable=True)
 
 
+class Contact(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="contacts")
+
+    id: int = ormar.Integer(primary_key=True)
+    email: str = ormar.String(
+        max_length=100,
+        encrypt_secret="email-secret",
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+    phone: str = ormar.String(
+        max_length=100,
+        encrypt_secret="phone-secret",
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+    address: str = ormar.String(
+        max_length=100,
+        encrypt_secret=lambda: "address-secret",
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+
+
+class Document(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="documents")
+
+    id: int = ormar.Integer(primary_key=True)
+    payload: dict = ormar.JSON()
+
+
+class Attachment(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="attachments")
+
+    id: int = ormar.Integer(primary_key=True)
+    content: bytes = ormar.LargeBinary(max_length=10**7, represent_as_base64_str=True)
+
+
+class Article(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="articles")
+
+    id: int = ormar.Integer(primary_key=True)
+    body: str = ormar.Text(compress=True)
+
+
+class Note(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="notes")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    body: Optional[str] = ormar.Text(nullable=True)
+
+
 create_test_database = init_tests(base_ormar_config, scope="function")
 
 
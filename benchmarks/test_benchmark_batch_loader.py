@@ -0,0 +1,56 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from benchmarks.conftest import Author
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_concurrent_get_by_pk(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def get_concurrently():
+        return await asyncio.gather(
+            *(Author.objects.get(id=author.id) for author in authors_in_db)
+        )
+
+    authors = get_concurrently()
+    assert [author.id for author in authors] == [a.id for a in authors_in_db]
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_concurrent_get_batched(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def get_batched_concurrently():
+        return await asyncio.gather(
+            *(Author.objects.get_batched(author.id) for author in authors_in_db)
+        )
+
+    authors = get_batched_concurrently()
+    assert [author.id for author in authors] == [a.id for a in authors_in_db]
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_in_bulk(aio_benchmark, num_models: int, authors_in_db: List[Author]):
+    @aio_benchmark
+    async def in_bulk():
+        return await Author.objects.in_bulk([author.id for author in authors_in_db])
+
+    authors = in_bulk()
+    assert len(authors) == num_models
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_exists_many(aio_benchmark, num_models: int, authors_in_db: List[Author]):
+    @aio_benchmark
+    async def exists_many():
+        return await Author.objects.exists_many([author.id for author in authors_in_db])
+
+    existing = exists_many()
+    assert len(existing) == num_models
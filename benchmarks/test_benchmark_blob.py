@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from benchmarks.conftest import Attachment
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_dumping_models_with_base64_blobs(aio_benchmark, num_models: int):
+    attachments = [
+        Attachment(id=i, content=os.urandom(1024 * 1024)) for i in range(num_models)
+    ]
+
+    @aio_benchmark
+    async def dump_models():
+        for _ in range(5):
+            dumped = [attachment.model_dump() for attachment in attachments]
+        return dumped
+
+    dumped = dump_models()
+    assert len(dumped) == num_models
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_streaming_blobs(aio_benchmark, num_models: int):
+    content = os.urandom(1024 * 1024)
+    attachment = await Attachment.objects.create(content=content)
+
+    @aio_benchmark
+    async def stream_blobs():
+        for _ in range(num_models):
+            chunks = [
+                chunk
+                async for chunk in Attachment.objects.stream_blob(
+                    "content", attachment.pk, chunk_size=256 * 1024
+                )
+            ]
+        return chunks
+
+    chunks = stream_blobs()
+    assert b"".join(chunks) == content
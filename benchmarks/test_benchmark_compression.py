@@ -0,0 +1,61 @@
+import random
+import string
+from typing import List
+
+import pytest
+import pytest_asyncio
+
+from benchmarks.conftest import Article
+
+pytestmark = pytest.mark.asyncio
+
+
+def random_body() -> str:
+    words = ["".join(random.sample(string.ascii_lowercase, 6)) for _ in range(50)]
+    return " ".join(random.choice(words) for _ in range(2000))
+
+
+@pytest_asyncio.fixture()
+async def articles_in_db(num_models: int):
+    articles = [Article(body=random_body()) for _ in range(0, num_models)]
+    await Article.objects.bulk_create(articles)
+    return await Article.objects.all()
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_get_all_with_compressed_fields(
+    aio_benchmark, num_models: int, articles_in_db: List[Article]
+):
+    @aio_benchmark
+    async def get_all():
+        return await Article.objects.all()
+
+    articles = get_all()
+    assert [article.body for article in articles] == [
+        article.body for article in articles_in_db
+    ]
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_get_all_with_offloaded_decompression(
+    aio_benchmark, num_models: int, articles_in_db: List[Article]
+):
+    @aio_benchmark
+    async def get_all():
+        return await Article.objects.offload_decompression().all()
+
+    articles = get_all()
+    assert [article.body for article in articles] == [
+        article.body for article in articles_in_db
+    ]
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_bulk_create_with_compressed_fields(aio_benchmark, num_models: int):
+    articles = [Article(body=random_body()) for _ in range(0, num_models)]
+
+    @aio_benchmark
+    async def bulk_create():
+        await Article.objects.bulk_create(articles)
+
+    bulk_create()
@@ -0,0 +1,63 @@
+import random
+import string
+from typing import List
+
+import pytest
+import pytest_asyncio
+
+from benchmarks.conftest import Note
+
+pytestmark = pytest.mark.asyncio
+
+
+def random_body() -> str:
+    return "".join(random.choices(string.ascii_letters, k=20000))
+
+
+@pytest_asyncio.fixture()
+async def notes_in_db(num_models: int):
+    notes = [Note(title=f"Note {i}", body=random_body()) for i in range(num_models)]
+    await Note.objects.bulk_create(notes)
+    return await Note.objects.all()
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_get_all_with_deferred_fields(
+    aio_benchmark, num_models: int, notes_in_db: List[Note]
+):
+    @aio_benchmark
+    async def get_all():
+        return await Note.objects.defer("body").all()
+
+    notes = get_all()
+    assert all(note.body is None for note in notes)
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_load_deferred_fields_in_batch(
+    aio_benchmark, num_models: int, notes_in_db: List[Note]
+):
+    @aio_benchmark
+    async def get_all_and_load_deferred():
+        notes = await Note.objects.defer("body").all()
+        for note in notes:
+            await note.load_deferred()
+        return notes
+
+    notes = get_all_and_load_deferred()
+    assert [note.body for note in notes] == [note.body for note in notes_in_db]
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_load_excluded_fields_per_model(
+    aio_benchmark, num_models: int, notes_in_db: List[Note]
+):
+    @aio_benchmark
+    async def get_all_and_load():
+        notes = await Note.objects.exclude_fields("body").all()
+        for note in notes:
+            await note.load()
+        return notes
+
+    notes = get_all_and_load()
+    assert [note.body for note in notes] == [note.body for note in notes_in_db]
@@ -0,0 +1,79 @@
+import random
+import string
+
+import ormar
+import pytest
+
+from benchmarks.conftest import Author, Book, Publisher
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_dumping_models_with_relations(
+    aio_benchmark, num_models: int, author: Author, publisher: Publisher
+):
+    books = [
+        Book(
+            id=i,
+            author=author,
+            publisher=publisher,
+            title="".join(random.sample(string.ascii_letters, 5)),
+            year=random.randint(0, 2000),
+        )
+        for i in range(0, num_models)
+    ]
+
+    @aio_benchmark
+    async def dump(books):
+        return [
+            book.model_dump(exclude={"author": {"score"}, "publisher": {"prestige"}})
+            for book in books
+        ]
+
+    dumped = dump(books)
+    assert len(dumped) == num_models
+    assert dumped[0]["author"] == {"id": author.id, "name": author.name}
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_dumping_models_to_json(
+    aio_benchmark, num_models: int, author: Author, publisher: Publisher
+):
+    books = [
+        Book(
+            id=i,
+            author=author,
+            publisher=publisher,
+            title="".join(random.sample(string.ascii_letters, 5)),
+            year=random.randint(0, 2000),
+        )
+        for i in range(0, num_models)
+    ]
+
+    @aio_benchmark
+    async def dump_json(books):
+        return ormar.dump_json_many(books, exclude={"publisher": {"prestige"}})
+
+    dumped = dump_json(books)
+    assert dumped.startswith(b'[{"id":0,')
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_getting_pydantic_models(aio_benchmark, num_models: int):
+    variants = [
+        {"include": {"name", "books__title"}},
+        {"include": {"name": ..., "books": {"title"}}},
+        {"exclude": {"books"}},
+    ]
+    ormar.warm_pydantic_cache([(Publisher, variant) for variant in variants])
+
+    @aio_benchmark
+    async def get_pydantic(num_models: int):
+        return [
+            Publisher.get_pydantic(**variants[i % len(variants)])
+            for i in range(0, num_models)
+        ]
+
+    models = get_pydantic(num_models)
+    assert models[0] is models[1]
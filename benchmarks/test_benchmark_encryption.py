@@ -0,0 +1,65 @@
+import random
+import string
+from typing import List
+
+import pytest
+import pytest_asyncio
+
+from benchmarks.conftest import Contact
+
+pytestmark = pytest.mark.asyncio
+
+
+def random_string() -> str:
+    return "".join(random.sample(string.ascii_letters, 10))
+
+
+@pytest_asyncio.fixture()
+async def contacts_in_db(num_models: int):
+    contacts = [
+        Contact(email=random_string(), phone=random_string(), address=random_string())
+        for _ in range(0, num_models)
+    ]
+    await Contact.objects.bulk_create(contacts)
+    return await Contact.objects.all()
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_get_all_with_encrypted_fields(
+    aio_benchmark, num_models: int, contacts_in_db: List[Contact]
+):
+    @aio_benchmark
+    async def get_all():
+        return await Contact.objects.all()
+
+    contacts = get_all()
+    assert [contact.email for contact in contacts] == [
+        contact.email for contact in contacts_in_db
+    ]
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_get_all_with_offloaded_decryption(
+    aio_benchmark, num_models: int, contacts_in_db: List[Contact]
+):
+    @aio_benchmark
+    async def get_all():
+        return await Contact.objects.offload_decryption().all()
+
+    contacts = get_all()
+    assert [contact.email for contact in contacts] == [
+        contact.email for contact in contacts_in_db
+    ]
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_bulk_create_with_encrypted_fields(aio_benchmark, num_models: int):
+    @aio_benchmark
+    async def bulk_create(contacts: List[Contact]):
+        await Contact.objects.bulk_create(contacts)
+
+    contacts = [
+        Contact(email=random_string(), phone=random_string(), address=random_string())
+        for _ in range(0, num_models)
+    ]
+    bulk_create(contacts)
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+DEFINE_MODELS = """
+from typing import ForwardRef
+
+import ormar
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+num_models = {num_models}
+models = []
+for i in range(num_models):
+    model = type(ormar.Model)(
+        f"Model{{i}}",
+        (ormar.Model,),
+        {{
+            "__module__": __name__,
+            "__annotations__": {{"id": int, "name": str}},
+            "ormar_config": base_ormar_config.copy(tablename=f"models_{{i}}"),
+            "id": ormar.Integer(primary_key=True),
+            "name": ormar.String(max_length=100),
+            "parent": ormar.ForeignKey(
+                ForwardRef(f"Model{{(i + 1) % num_models}}"), related_name="children"
+            ),
+        }},
+    )
+    globals()[model.__name__] = model
+    models.append(model)
+
+ormar.update_forward_refs(models)
+"""
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_importing_ormar(benchmark):
+    benchmark(run_python, "import ormar")
+
+
+def test_importing_ormar_does_not_import_optional_dependencies():
+    imported = run_python(
+        "import sys, ormar; print(' '.join(sorted(sys.modules)))"
+    ).split()
+    assert "cryptography" not in imported
+
+
+@pytest.mark.parametrize("num_models", [5, 10, 20])
+def test_defining_models(benchmark, num_models: int):
+    benchmark(run_python, DEFINE_MODELS.format(num_models=num_models))
@@ -19,3 +19,18 @@ async def test_iterate(aio_benchmark, num_models: int, authors_in_db: List[Autho
     authors = iterate_over_all(authors_in_db)
     for idx, author in enumerate(authors_in_db):
         assert authors[idx].id == author.id
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_parallel_iterate(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def parallel_iterate_over_all(authors: List[Author]):
+        authors = []
+        async for author in Author.objects.parallel_iterate(partitions=4):
+            authors.append(author)
+        return authors
+
+    authors = parallel_iterate_over_all(authors_in_db)
+    assert sorted(author.id for author in authors) == [a.id for a in authors_in_db]
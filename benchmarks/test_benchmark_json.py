@@ -0,0 +1,49 @@
+from typing import List
+
+import pytest
+import pytest_asyncio
+
+from benchmarks.conftest import Document
+
+pytestmark = pytest.mark.asyncio
+
+
+def sample_payload(index: int) -> dict:
+    return {
+        "index": index,
+        "tags": [f"tag-{tag}" for tag in range(20)],
+        "items": [{"id": item, "price": item * 1.5} for item in range(50)],
+    }
+
+
+@pytest_asyncio.fixture()
+async def documents_in_db(num_models: int):
+    documents = [Document(payload=sample_payload(i)) for i in range(num_models)]
+    await Document.objects.bulk_create(documents)
+    return await Document.objects.all()
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_initializing_models_with_json_field(aio_benchmark, num_models: int):
+    payloads = [sample_payload(i) for i in range(num_models)]
+
+    @aio_benchmark
+    async def initialize_models():
+        return [Document(payload=payload) for payload in payloads]
+
+    documents = initialize_models()
+    assert documents[-1].payload == payloads[-1]
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_get_all_with_json_field(
+    aio_benchmark, num_models: int, documents_in_db: List[Document]
+):
+    @aio_benchmark
+    async def get_all():
+        return await Document.objects.all()
+
+    documents = get_all()
+    assert [document.payload for document in documents] == [
+        document.payload for document in documents_in_db
+    ]
@@ -0,0 +1,58 @@
+from typing import List
+
+import ormar
+import pytest
+import pytest_asyncio
+
+from benchmarks.conftest import Author, Book, Publisher
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def books_in_db(authors_in_db: List[Author], publisher: Publisher):
+    books = [
+        Book(author=author, publisher=publisher, title=f"Book {i}")
+        for i, author in enumerate(authors_in_db)
+    ]
+    await Book.objects.bulk_create(books)
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_load_related_in_batch(aio_benchmark, num_models: int, books_in_db):
+    @aio_benchmark
+    async def get_all_and_load_related():
+        books = await Book.objects.all()
+        await ormar.load_related(books, ["author", "publisher"])
+        return books
+
+    books = get_all_and_load_related()
+    assert all(book.author.name is not None for book in books)
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_fetch_related_from_result_set(
+    aio_benchmark, num_models: int, books_in_db
+):
+    @aio_benchmark
+    async def get_all_and_fetch():
+        books = await Book.objects.all()
+        for book in books:
+            await book.author.fetch()
+        return books
+
+    books = get_all_and_fetch()
+    assert all(book.author.name is not None for book in books)
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_load_related_per_model(aio_benchmark, num_models: int, books_in_db):
+    @aio_benchmark
+    async def get_all_and_load():
+        books = await Book.objects.all()
+        for book in books:
+            await book.author.load()
+        return books
+
+    books = get_all_and_load()
+    assert all(book.author.name is not None for book in books)
@@ -0,0 +1,88 @@
+import random
+import string
+import tracemalloc
+from typing import List, Optional
+
+import ormar
+import pytest
+
+from benchmarks.conftest import Author, base_ormar_config
+
+pytestmark = pytest.mark.asyncio
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Article(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="articles")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(
+        Category, related_name="articles"
+    )
+    reviewed_in: Optional[Category] = ormar.ForeignKey(
+        Category, related_name="reviewed_articles"
+    )
+    featured_in: Optional[Category] = ormar.ForeignKey(
+        Category, related_name="featured_articles"
+    )
+    archived_in: Optional[Category] = ormar.ForeignKey(
+        Category, related_name="archived_articles"
+    )
+    tags: Optional[List[Category]] = ormar.ManyToMany(
+        Category, related_name="tagged_articles"
+    )
+
+
+def _touch_all_relations(categories: List[Category]) -> None:
+    for category in categories:
+        for relation_name in Category.extract_related_names():
+            getattr(category, relation_name).queryset_proxy
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_memory_of_models_with_many_relations(aio_benchmark, num_models: int):
+    @aio_benchmark
+    async def initialize_models(num_models: int):
+        tracemalloc.start()
+        categories = [
+            Category(name="".join(random.sample(string.ascii_letters, 5)))
+            for i in range(0, num_models)
+        ]
+        not_touched_size, _ = tracemalloc.get_traced_memory()
+        _touch_all_relations(categories)
+        touched_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return not_touched_size, touched_size
+
+    not_touched_size, touched_size = initialize_models(num_models)
+    # relations, relation proxies and queryset proxies are allocated only on access
+    assert not_touched_size * 3 < touched_size - not_touched_size
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_memory_of_readonly_records(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def load_models(num_models: int):
+        tracemalloc.start()
+        authors = await Author.objects.all()
+        models_size, _ = tracemalloc.get_traced_memory()
+        del authors
+        tracemalloc.stop()
+        tracemalloc.start()
+        records = await Author.objects.readonly().all()
+        records_size, _ = tracemalloc.get_traced_memory()
+        del records
+        tracemalloc.stop()
+        return models_size, records_size
+
+    models_size, records_size = load_models(num_models)
+    assert records_size * 3 < models_size
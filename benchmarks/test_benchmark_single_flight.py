@@ -0,0 +1,34 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from benchmarks.conftest import Author
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_concurrent_identical_queries(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def get_all_concurrently():
+        return await asyncio.gather(*(Author.objects.all() for _ in range(20)))
+
+    results = get_all_concurrently()
+    assert all(len(authors) == num_models for authors in results)
+
+
+@pytest.mark.parametrize("num_models", [50, 100, 200])
+async def test_concurrent_identical_queries_with_single_flight(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def get_all_concurrently():
+        return await asyncio.gather(
+            *(Author.objects.single_flight().all() for _ in range(20))
+        )
+
+    results = get_all_concurrently()
+    assert all(len(authors) == num_models for authors in results)
@@ -25,3 +25,38 @@ async def test_updating_models_individually(
     update(authors_in_db)
     author = await Author.objects.get(id=authors_in_db[0].id)
     assert author.name != starting_first_name
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_setting_fields_of_saved_models(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    hashes = [hash(author) for author in authors_in_db]
+
+    @aio_benchmark
+    async def set_fields(authors: List[Author]):
+        for author in authors:
+            for _ in range(0, 10):
+                author.name = "".join(random.sample(string.ascii_letters, 5))
+                author.score = random.randint(0, 100)
+
+    set_fields(authors_in_db)
+    assert [hash(author) for author in authors_in_db] == hashes
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_updating_models_from_dict(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    @aio_benchmark
+    async def update_from_dict(authors: List[Author]):
+        for author in authors:
+            author.update_from_dict(
+                {
+                    "name": "".join(random.sample(string.ascii_letters, 5)),
+                    "score": random.randint(0, 100),
+                }
+            )
+
+    update_from_dict(authors_in_db)
+    assert len({hash(author) for author in authors_in_db}) == num_models
@@ -2,7 +2,7 @@ from typing import List
 
 import pytest
 
-from benchmarks.conftest import Author
+from benchmarks.conftest import Author, Book
 
 pytestmark = pytest.mark.asyncio
 
@@ -27,3 +27,36 @@ async def test_values_list(aio_benchmark, num_models: int, authors_in_db: List[A
     authors_list = get_all_values_list(authors_in_db)
     for idx, author in enumerate(authors_in_db):
         assert authors_list[idx][0] == author.id
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_nested_values(
+    aio_benchmark, num_models: int, authors_in_db: List[Author]
+):
+    books = [
+        Book(author=author, title=f"Book {i}", year=2000 + i)
+        for author in authors_in_db
+        for i in range(0, 10)
+    ]
+    await Book.objects.bulk_create(books)
+
+    @aio_benchmark
+    async def get_nested_values(authors: List[Author]):
+        return await Author.objects.select_related("books").values(nested=True)
+
+    authors_list = get_nested_values(authors_in_db)
+    assert len(authors_list) == num_models
+    assert all(len(author["books"]) == 10 for author in authors_list)
+
+
+@pytest.mark.parametrize("num_models", [250, 500, 1000])
+async def test_as_model(aio_benchmark, num_models: int, authors_in_db: List[Author]):
+    AuthorOut = Author.get_pydantic(include={"id", "name"})
+
+    @aio_benchmark
+    async def get_pydantic_models(authors: List[Author]):
+        return await Author.objects.as_model(AuthorOut)
+
+    authors_list = get_pydantic_models(authors_in_db)
+    for idx, author in enumerate(authors_in_db):
+        assert authors_list[idx].name == author.name
@@ -0,0 +1,48 @@
+import asyncio
+import random
+import string
+
+import ormar
+import pytest
+
+from benchmarks.conftest import Author
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_creating_models_concurrently(aio_benchmark, num_models: int):
+    @aio_benchmark
+    async def create_concurrently(num_models: int):
+        return await asyncio.gather(
+            *(
+                Author.objects.create(
+                    name="".join(random.sample(string.ascii_letters, 5)),
+                    score=int(random.random() * 100),
+                )
+                for _ in range(num_models)
+            )
+        )
+
+    authors = create_concurrently(num_models)
+    assert all(author.id is not None for author in authors)
+
+
+@pytest.mark.parametrize("num_models", [10, 20, 40])
+async def test_creating_models_with_write_buffer(aio_benchmark, num_models: int):
+    buffer = ormar.WriteBuffer(Author, max_delay_ms=1)
+
+    @aio_benchmark
+    async def create_with_buffer(num_models: int):
+        return await asyncio.gather(
+            *(
+                buffer.create(
+                    name="".join(random.sample(string.ascii_letters, 5)),
+                    score=int(random.random() * 100),
+                )
+                for _ in range(num_models)
+            )
+        )
+
+    authors = create_with_buffer(num_models)
+    assert all(author.id is not None for author in authors)
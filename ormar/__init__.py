@@ -21,7 +21,7 @@ And what's a better name for python ORM than snakes cabinet :)
 """
 
 from ormar.protocols import QuerySetProtocol, RelationProtocol  # noqa: I001
-from importlib.metadata import version
+from typing import Any
 
 from ormar.decorators import (  # noqa: I100
     post_bulk_update,
@@ -51,6 +51,8 @@ from ormar.fields import (
     BigInteger,
     Boolean,
     CheckColumns,
+    CompressBackend,
+    CompressBackends,
     Date,
     DateTime,
     Decimal,
@@ -73,8 +75,25 @@ from ormar.fields import (
 )
 
 # noqa: I100
-from ormar.models import ExcludableItems, Extra, Model, OrmarConfig
-from ormar.queryset import OrderAction, QuerySet, and_, or_
+from ormar.models import (
+    ExcludableItems,
+    Extra,
+    Model,
+    OrmarConfig,
+    ReadOnlyRecord,
+    dump_json_many,
+    prepare_models,
+    update_forward_refs,
+    warm_pydantic_cache,
+)
+from ormar.queryset import (
+    OrderAction,
+    QuerySet,
+    WriteBuffer,
+    and_,
+    load_related,
+    or_,
+)
 from ormar.relations import RelationType
 from ormar.signals import Signal
 
@@ -86,7 +105,20 @@ class UndefinedType:  # pragma no cover
 
 Undefined = UndefinedType()
 
-__version__ = version("ormar")
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves the version of ormar on first access, so the installed packages
+    metadata is not scanned on each import of ormar.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = version("ormar")
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Integer",
     "BigInteger",
@@ -136,7 +168,16 @@ __all__ = [
     "ExcludableItems",
     "and_",
     "or_",
+    "dump_json_many",
+    "ReadOnlyRecord",
+    "warm_pydantic_cache",
+    "prepare_models",
+    "update_forward_refs",
+    "load_related",
+    "WriteBuffer",
     "EncryptBackends",
+    "CompressBackends",
+    "CompressBackend",
     "ENCODERS_MAP",
     "SQL_ENCODERS_MAP",
     "DECODERS_MAP",
@@ -28,6 +28,7 @@ from ormar.fields.model_fields import (
 )
 from ormar.fields.parsers import DECODERS_MAP, ENCODERS_MAP, SQL_ENCODERS_MAP
 from ormar.fields.referential_actions import ReferentialAction
+from ormar.fields.sqlalchemy_compressed import CompressBackend, CompressBackends
 from ormar.fields.sqlalchemy_encrypted import EncryptBackend, EncryptBackends
 from ormar.fields.through_field import Through, ThroughField
 
@@ -55,6 +56,8 @@ __all__ = [
     "Through",
     "EncryptBackends",
     "EncryptBackend",
+    "CompressBackends",
+    "CompressBackend",
     "DECODERS_MAP",
     "ENCODERS_MAP",
     "SQL_ENCODERS_MAP",
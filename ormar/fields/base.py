@@ -5,6 +5,11 @@ from pydantic.fields import FieldInfo, _Unset
 
 import ormar  # noqa I101
 from ormar import ModelDefinitionError
+from ormar.fields.sqlalchemy_compressed import (
+    CompressBackend,
+    CompressBackends,
+    CompressedType,
+)
 from ormar.fields.sqlalchemy_encrypted import (
     EncryptBackend,
     EncryptBackends,
@@ -82,6 +87,14 @@ class BaseField(FieldInfo):
             "encrypt_custom_backend", None
         )
 
+        self.compress_backend: CompressBackends = kwargs.pop(
+            "compress_backend", CompressBackends.NONE
+        )
+        self.compress_custom_backend: Optional[Type[CompressBackend]] = kwargs.pop(
+            "compress_custom_backend", None
+        )
+        self.compress_min_size: int = kwargs.pop("compress_min_size", 512)
+
         self.ormar_default: Any = kwargs.pop("default", None)
         self.server_default: Any = kwargs.pop("server_default", None)
 
@@ -265,7 +278,9 @@ class BaseField(FieldInfo):
         :return: actual definition of the database column as sqlalchemy requires.
         :rtype: sqlalchemy.Column
         """
-        if self.encrypt_backend == EncryptBackends.NONE:
+        if self.compress_backend != CompressBackends.NONE:
+            column = self._get_compressed_column(name=name)
+        elif self.encrypt_backend == EncryptBackends.NONE:
             column = sqlalchemy.Column(
                 self.db_alias or name,
                 self.column_type,
@@ -311,11 +326,50 @@ class BaseField(FieldInfo):
         )
         return column
 
+    def _get_compressed_column(self, name: str) -> sqlalchemy.Column:
+        """
+        Returns CompressedType column type instead of actual column.
+
+        :param name: column name
+        :type name: str
+        :return: newly defined column
+        :rtype:  sqlalchemy.Column
+        """
+        column = sqlalchemy.Column(
+            self.db_alias or name,
+            CompressedType(
+                _field_type=self,
+                compress_backend=self.compress_backend,
+                compress_custom_backend=self.compress_custom_backend,
+                compress_min_size=self.compress_min_size,
+            ),
+            nullable=self.sql_nullable,
+            index=self.index,
+            unique=self.unique,
+            default=self.ormar_default,
+            server_default=self.server_default,
+            comment=self.comment,
+        )
+        return column
+
+    def is_raw_pk_value(self, value: Any) -> bool:
+        """
+        Function overwritten for relations, in basic field value is never
+        a raw pk value of related model.
+
+        :param value: value of the field
+        :type value: Any
+        :return: result of the check
+        :rtype: bool
+        """
+        return False
+
     def expand_relationship(
         self,
         value: Any,
         child: Union["Model", "NewBaseModel"],
         to_register: bool = True,
+        keep_pk: bool = False,
     ) -> Any:
         """
         Function overwritten for relations, in basic field the value is returned as is.
@@ -330,6 +384,8 @@ class BaseField(FieldInfo):
         :type child: Union["Model", "NewBaseModel"]
         :param to_register: flag if the relation should be set in RelationshipManager
         :type to_register: bool
+        :param keep_pk: flag if raw pk values of relations should be kept as is
+        :type keep_pk: bool
         :return: returns untouched value for normal fields, expands only for relations
         :rtype: Any
         """
@@ -560,6 +560,24 @@ class ForeignKeyField(BaseField):
         :return: (if needed) registered Model
         :rtype: Model
         """
+        value = self._validate_pk_value(value)
+        model = create_dummy_instance(fk=self.to, pk=value)
+        if to_register:
+            self.register_relation(model=model, child=child)
+        return model
+
+    def _validate_pk_value(self, value: Any) -> Any:
+        """
+        Verifies if passed value is of type of the related model pk.
+        Uuid strings are converted to uuid and pk values are extracted from pk only
+        pydantic models.
+
+        :raises RelationshipInstanceError: if value is of not matching type
+        :param value: value of a related pk / fk column
+        :type value: Any
+        :return: value of related pk
+        :rtype: Any
+        """
         if self.to.pk_type() == uuid.UUID and isinstance(value, str):  # pragma: nocover
             value = uuid.UUID(value)
         if not isinstance(value, self.to.pk_type()):
@@ -571,10 +589,26 @@ class ForeignKeyField(BaseField):
                     f"is of type {self.to.pk_type()} "
                     f"while {type(value)} passed as a parameter."
                 )
-        model = create_dummy_instance(fk=self.to, pk=value)
-        if to_register:
-            self.register_relation(model=model, child=child)
-        return model
+        return value
+
+    def is_raw_pk_value(self, value: Any) -> bool:
+        """
+        Checks if the value of the relation is a raw pk value kept instead of the
+        related model. Only ForeignKey fields that store fk column in own table
+        can hold such a value, the related model is constructed on first access.
+
+        :param value: value of the relation field
+        :type value: Any
+        :return: result of the check
+        :rtype: bool
+        """
+        return (
+            value is not None
+            and not self.virtual
+            and not self.is_multi
+            and not self.is_through
+            and not isinstance(value, (BaseModel, dict, list))
+        )
 
     def register_relation(self, model: "Model", child: "Model") -> None:
         """
@@ -606,7 +640,8 @@ class ForeignKeyField(BaseField):
         value: Any,
         child: Union["Model", "NewBaseModel"],
         to_register: bool = True,
-    ) -> Optional[Union["Model", List["Model"]]]:
+        keep_pk: bool = False,
+    ) -> Optional[Union["Model", List["Model"], Any]]:
         """
         For relations the child model is first constructed (if needed),
         registered in relation and returned.
@@ -615,17 +650,24 @@ class ForeignKeyField(BaseField):
 
         Selects the appropriate constructor based on a passed value.
 
+        If keep_pk is set, raw pk values are only validated and returned as is,
+        the dummy model is constructed and registered on first access to relation.
+
         :param value: a Model field value, returned untouched for non relation fields.
         :type value: Any
         :param child: a child Model to register
         :type child: Union["Model", "NewBaseModel"]
         :param to_register: flag if the relation should be set in RelationshipManager
         :type to_register: bool
-        :return: returns a Model or a list of Models
-        :rtype: Optional[Union["Model", List["Model"]]]
+        :param keep_pk: flag if raw pk values should be kept instead of dummy models
+        :type keep_pk: bool
+        :return: returns a Model or a list of Models (or raw pk value if kept)
+        :rtype: Optional[Union["Model", List["Model"], Any]]
         """
         if value is None:
             return None if not self.virtual else []
+        if keep_pk and self.is_raw_pk_value(value):
+            return self._validate_pk_value(value)
         constructors = {
             f"{self.to.__name__}": self._register_existing_model,
             "dict": self._construct_model_from_dict,
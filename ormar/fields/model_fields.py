@@ -12,13 +12,15 @@ import ormar  # noqa I101
 from ormar import ModelDefinitionError  # noqa I101
 from ormar.fields import sqlalchemy_uuid
 from ormar.fields.base import BaseField  # noqa I101
+from ormar.fields.parsers import DecodedJson
+from ormar.fields.sqlalchemy_compressed import CompressBackends
 from ormar.fields.sqlalchemy_encrypted import EncryptBackends
 
 try:
     from typing import Literal  # type: ignore
 except ImportError:  # pragma: no cover
     from typing_extensions import Literal  # type: ignore
-    
+
 try:
     from typing import Self  # type: ignore
 except ImportError:  # pragma: no cover
@@ -68,7 +70,9 @@ class ModelFieldFactory:
 
     _bases: Any = (BaseField,)
     _type: Any = None
+    _pydantic_type: Any = None
     _sample: Any = None
+    _compressible: bool = False
 
     def __new__(cls, *args: Any, **kwargs: Any) -> Self:  # type: ignore
         cls.validate(**kwargs)
@@ -85,6 +89,18 @@ class ModelFieldFactory:
         encrypt_backend = kwargs.pop("encrypt_backend", EncryptBackends.NONE)
         encrypt_custom_backend = kwargs.pop("encrypt_custom_backend", None)
 
+        compress_backend = kwargs.pop("compress_backend", CompressBackends.NONE)
+        if kwargs.pop("compress", False) and compress_backend == CompressBackends.NONE:
+            compress_backend = CompressBackends.ZLIB
+        compress_custom_backend = kwargs.pop("compress_custom_backend", None)
+        compress_min_size = kwargs.pop("compress_min_size", 512)
+        if compress_backend != CompressBackends.NONE:
+            cls.validate_compression(
+                primary_key=primary_key,
+                encrypt_backend=encrypt_backend,
+                encrypt_secret=encrypt_secret,
+            )
+
         overwrite_pydantic_type = kwargs.pop("overwrite_pydantic_type", None)
 
         nullable = is_field_nullable(
@@ -98,13 +114,16 @@ class ModelFieldFactory:
 
         enum_class = kwargs.pop("enum_class", None)
         field_type = cls._type if enum_class is None else enum_class
+        pydantic_type = cls._pydantic_type
+        if pydantic_type is not None and nullable:
+            pydantic_type = Optional[pydantic_type]
 
         namespace = dict(
             __type__=field_type,
             __pydantic_type__=(
                 overwrite_pydantic_type
                 if overwrite_pydantic_type is not None
-                else field_type
+                else pydantic_type or field_type
             ),
             __sample__=cls._sample,
             alias=kwargs.pop("name", None),
@@ -124,6 +143,9 @@ class ModelFieldFactory:
             encrypt_secret=encrypt_secret,
             encrypt_backend=encrypt_backend,
             encrypt_custom_backend=encrypt_custom_backend,
+            compress_backend=compress_backend,
+            compress_custom_backend=compress_custom_backend,
+            compress_min_size=compress_min_size,
             **kwargs
         )
         Field = type(cls.__name__, cls._bases, {})
@@ -150,6 +172,29 @@ class ModelFieldFactory:
         :type kwargs: Any
         """
 
+    @classmethod
+    def validate_compression(
+        cls, primary_key: bool, encrypt_backend: EncryptBackends, encrypt_secret: Any
+    ) -> None:
+        """
+        Validates if the field can be compressed. Only Text, JSON and LargeBinary
+        fields that are not primary keys and are not encrypted can be compressed.
+
+        :raises ModelDefinitionError: if field cannot be compressed
+        :param primary_key: flag if field is a primary key
+        :type primary_key: bool
+        :param encrypt_backend: encrypt backend of the field
+        :type encrypt_backend: EncryptBackends
+        :param encrypt_secret: encrypt secret of the field
+        :type encrypt_secret: Any
+        """
+        if not cls._compressible or primary_key:
+            raise ModelDefinitionError(
+                "Only Text, JSON and LargeBinary fields can be compressed!"
+            )
+        if encrypt_secret or encrypt_backend != EncryptBackends.NONE:
+            raise ModelDefinitionError("Encrypted fields cannot be compressed!")
+
 
 class String(ModelFieldFactory, str):
     """
@@ -259,6 +304,7 @@ class Text(ModelFieldFactory, str):
 
     _type = str
     _sample = "text"
+    _compressible = True
 
     def __new__(cls, **kwargs: Any) -> Self:  # type: ignore
         kwargs = {
@@ -454,7 +500,9 @@ class JSON(ModelFieldFactory, pydantic.Json):
     """
 
     _type = pydantic.Json
+    _pydantic_type = DecodedJson
     _sample = '{"json": "json"}'
+    _compressible = True
 
     @classmethod
     def get_column_type(cls, **kwargs: Any) -> Any:
@@ -501,6 +549,7 @@ else:
         """
 
         _type = bytes
+        _compressible = True
         _sample = "bytes"
 
         def __new__(  # type: ignore # noqa CFQ002
@@ -6,6 +6,7 @@ from typing import Any, Callable, Dict, Optional, Union
 
 import pydantic
 from pydantic_core import SchemaValidator, core_schema
+from typing_extensions import Annotated
 
 try:
     import orjson as json
@@ -37,7 +38,11 @@ def encode_bytes(value: Union[str, bytes], represent_as_string: bool = False) ->
     return value
 
 
-def decode_bytes(value: str, represent_as_string: bool = False) -> bytes:
+def decode_bytes(
+    value: Union[str, bytes, bytearray, memoryview], represent_as_string: bool = False
+) -> bytes:
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
     if represent_as_string:
         return value if isinstance(value, bytes) else base64.b64decode(value)
     return value if isinstance(value, bytes) else value.encode("utf-8")
@@ -66,6 +71,33 @@ def re_dump_value(value: str) -> Union[str, bytes]:
     return result
 
 
+def parse_json(value: Any) -> Any:
+    """
+    Loads json documents passed as strings or bytes, already decoded values
+    (i.e. loaded by the database column) are returned as they are.
+
+    :param value: json document or decoded value
+    :type value: Any
+    :return: decoded value
+    :rtype: Any
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return json.loads(value)
+    return value
+
+
+# pydantic type of JSON fields, keeps decoded values instead of json strings,
+# json schema of input is the same as of pydantic.Json
+DecodedJson = Annotated[
+    Any,
+    pydantic.BeforeValidator(parse_json),
+    pydantic.WithJsonSchema(
+        {"type": "string", "contentMediaType": "application/json", "contentSchema": {}},
+        mode="validation",
+    ),
+]
+
+
 ENCODERS_MAP: Dict[type, Callable] = {
     datetime.datetime: lambda x: x.isoformat(),
     datetime.date: lambda x: x.isoformat(),
@@ -0,0 +1,254 @@
+import abc
+import importlib.util
+import zlib
+from contextvars import ContextVar
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+import pydantic
+import sqlalchemy.types as types
+from sqlalchemy.engine import Dialect
+
+from ormar import ModelDefinitionError  # noqa: I202, I100
+
+try:
+    import orjson as json
+except ImportError:  # pragma: no cover
+    import json  # type: ignore
+
+# zstandard is optional and imported only when zstd compressed column is used
+zstandard = importlib.util.find_spec("zstandard")
+
+if TYPE_CHECKING:  # pragma: nocover
+    from ormar import BaseField
+
+# when set compressed columns return CompressedValue placeholders instead of
+# decompressing the values, so the values can be decompressed later in batches
+# outside the event loop
+deferred_decompression: ContextVar[bool] = ContextVar(
+    "deferred_decompression", default=False
+)
+
+# marker of values stored without compression (below the size threshold
+# or not compressible)
+RAW_MARKER = b"\x00"
+
+
+class CompressBackend(abc.ABC):
+    """
+    Base class of compression backends.
+
+    Each backend has a unique one byte marker stored in front of the compressed
+    value, so values compressed with other built in backend (i.e. before the backend
+    of the field was changed) can still be read.
+    """
+
+    marker: bytes
+
+    @abc.abstractmethod
+    def compress(self, value: bytes) -> bytes:  # pragma: nocover
+        pass
+
+    @abc.abstractmethod
+    def decompress(self, value: bytes) -> bytes:  # pragma: nocover
+        pass
+
+
+class ZlibBackend(CompressBackend):
+    """
+    Compression with zlib from standard library.
+    """
+
+    marker = b"\x01"
+
+    def compress(self, value: bytes) -> bytes:
+        return zlib.compress(value)
+
+    def decompress(self, value: bytes) -> bytes:
+        return zlib.decompress(value)
+
+
+class ZstdBackend(CompressBackend):
+    """
+    Compression with zstandard, faster than zlib with similar compression ratio.
+    """
+
+    marker = b"\x02"
+
+    def __init__(self) -> None:
+        import zstandard as zstd
+
+        self._compressor = zstd.ZstdCompressor()
+        self._decompressor = zstd.ZstdDecompressor()
+
+    def compress(self, value: bytes) -> bytes:
+        return self._compressor.compress(value)
+
+    def decompress(self, value: bytes) -> bytes:
+        return self._decompressor.decompress(value)
+
+
+class CompressBackends(Enum):
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+    CUSTOM = 3
+
+
+BACKENDS_MAP: Dict[CompressBackends, Type[CompressBackend]] = {
+    CompressBackends.ZLIB: ZlibBackend,
+    CompressBackends.ZSTD: ZstdBackend,
+}
+
+BACKENDS_BY_MARKER: Dict[bytes, Type[CompressBackend]] = {
+    backend.marker: backend for backend in BACKENDS_MAP.values()
+}
+
+
+class CompressedValue:
+    """
+    Placeholder of not yet decompressed value returned by compressed column
+    when decompression is deferred.
+    """
+
+    __slots__ = ("value", "column_type", "dialect")
+
+    def __init__(
+        self, value: bytes, column_type: "CompressedType", dialect: Dialect
+    ) -> None:
+        self.value = value
+        self.column_type = column_type
+        self.dialect = dialect
+
+
+class CompressedType(types.TypeDecorator):
+    """
+    Used to store compressed values of Text, JSON and LargeBinary fields
+    in a binary column of a database.
+    """
+
+    impl = types.LargeBinary
+
+    def __init__(
+        self,
+        compress_backend: CompressBackends = CompressBackends.ZLIB,
+        compress_custom_backend: Optional[Type[CompressBackend]] = None,
+        compress_min_size: int = 512,
+        **kwargs: Any,
+    ) -> None:
+        _field_type: "BaseField" = kwargs.pop("_field_type")
+        super().__init__()
+        backend = BACKENDS_MAP.get(compress_backend, compress_custom_backend)
+        if (
+            not backend
+            or not isinstance(backend, type)
+            or not issubclass(backend, CompressBackend)
+        ):
+            raise ModelDefinitionError("Wrong or no compress backend provided!")
+        if backend is ZstdBackend and not zstandard:  # pragma: nocover
+            raise ModelDefinitionError(
+                "In order to use zstd compression 'zstandard' is required!"
+            )
+        marker = getattr(backend, "marker", None)
+        if (
+            not isinstance(marker, bytes)
+            or len(marker) != 1
+            or marker == RAW_MARKER
+            or BACKENDS_BY_MARKER.get(marker, backend) is not backend
+        ):
+            raise ModelDefinitionError(
+                f"Compress backend {backend.__name__} has to define unique "
+                f"one byte marker!"
+            )
+        self.backend: CompressBackend = backend()
+        self._backends: Dict[bytes, CompressBackend] = {marker: self.backend}
+        self._field_type: "BaseField" = _field_type
+        self.min_size = compress_min_size
+        self.type_: Any = _field_type.__type__
+
+    def __repr__(self) -> str:  # pragma: nocover
+        return "BLOB()"
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[bytes]:
+        if value is None:
+            return value
+        data = self._dump(value)
+        if len(data) >= self.min_size:
+            compressed = self.backend.compress(data)
+            if len(compressed) < len(data):
+                return self.backend.marker + compressed
+        return RAW_MARKER + data
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return value
+        if deferred_decompression.get():
+            return CompressedValue(value=value, column_type=self, dialect=dialect)
+        return self._decompress(value)
+
+    def decompress_values(self, values: List[bytes], dialect: Dialect) -> List[Any]:
+        """
+        Decompresses many values at once, called outside of the event loop,
+        in executor.
+
+        :param values: compressed values from the database
+        :type values: List[bytes]
+        :param dialect: dialect of the database
+        :type dialect: Dialect
+        :return: decompressed values parsed to python type of the field
+        :rtype: List[Any]
+        """
+        return [self._decompress(value) for value in values]
+
+    def _dump(self, value: Any) -> bytes:
+        """
+        Converts value of the field into bytes.
+
+        :param value: value of the field
+        :type value: Any
+        :return: value as bytes
+        :rtype: bytes
+        """
+        if self.type_ == pydantic.Json:
+            dumped = json.dumps(value)
+            return dumped if isinstance(dumped, bytes) else dumped.encode("utf-8")
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return bytes(value)
+
+    def _decompress(self, value: bytes) -> Any:
+        """
+        Decompresses the value from database and parses it to python type
+        of the field.
+
+        :param value: value stored in database
+        :type value: bytes
+        :return: value of the field
+        :rtype: Any
+        """
+        value = bytes(value)
+        marker, data = value[:1], value[1:]
+        if marker != RAW_MARKER:
+            data = self._get_backend(marker).decompress(data)
+        if self.type_ == pydantic.Json:
+            return json.loads(data)
+        if self.type_ is str:
+            return data.decode("utf-8")
+        return data
+
+    def _get_backend(self, marker: bytes) -> CompressBackend:
+        """
+        Returns backend that compressed the value with given marker.
+
+        :param marker: marker stored in front of the value
+        :type marker: bytes
+        :return: backend able to decompress the value
+        :rtype: CompressBackend
+        """
+        backend = self._backends.get(marker)
+        if backend is None:
+            backend_class = BACKENDS_BY_MARKER.get(marker)
+            if backend_class is None:
+                raise ValueError(f"Unknown compression marker {marker!r}")
+            backend = self._backends[marker] = backend_class()
+        return backend
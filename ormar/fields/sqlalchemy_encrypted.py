@@ -1,8 +1,22 @@
 # inspired by sqlalchemy-utils (https://github.com/kvesteri/sqlalchemy-utils)
 import abc
 import base64
+import hashlib
+import importlib.util
+from contextvars import ContextVar
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import sqlalchemy.types as types
 from sqlalchemy.engine import Dialect
@@ -11,32 +25,77 @@ import ormar  # noqa: I100, I202
 from ormar import ModelDefinitionError  # noqa: I202, I100
 from ormar.fields.parsers import ADDITIONAL_PARAMETERS_MAP
 
-cryptography = None
-try:  # pragma: nocover
-    import cryptography  # type: ignore
-    from cryptography.fernet import Fernet
-    from cryptography.hazmat.backends import default_backend
-    from cryptography.hazmat.primitives import hashes
-except ImportError:  # pragma: nocover
-    pass
+# cryptography is imported only when encrypted column is used to not slow down
+# the import of ormar itself
+cryptography = importlib.util.find_spec("cryptography")
 
 if TYPE_CHECKING:  # pragma: nocover
     from ormar import BaseField
 
+# when set encrypted columns return EncryptedValue placeholders instead of decrypting
+# the values, so the values can be decrypted later in batches outside the event loop
+deferred_decryption: ContextVar[bool] = ContextVar("deferred_decryption", default=False)
+
+
+Secret = Union[str, bytes]
+
+
+def derive_key(key: Secret) -> bytes:
+    """
+    Derives the secret key of the backend from the encrypt_secret.
+
+    :param key: secret provided in field definition
+    :type key: Union[str, bytes]
+    :return: derived key
+    :rtype: bytes
+    """
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+
+    if isinstance(key, str):
+        key = key.encode()
+    digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
+    digest.update(key)
+    return digest.finalize()
+
 
 class EncryptBackend(abc.ABC):
-    def _refresh(self, key: Union[str, bytes]) -> None:
-        if isinstance(key, str):
-            key = key.encode()
-        digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
-        digest.update(key)
-        engine_key = digest.finalize()
-        self._initialize_backend(engine_key)
+    def _refresh(self, key: Union[Secret, Sequence[Secret]]) -> None:
+        """
+        Initializes the backend with keys derived from given secret.
+
+        If sequence of secrets is passed the first one is used to encrypt
+        the values and the remaining (older) ones only to decrypt the values
+        encrypted before the keys were rotated.
+
+        :param key: secret or sequence of secrets, the newest first
+        :type key: Union[str, bytes, Sequence[Union[str, bytes]]]
+        """
+        if isinstance(key, (str, bytes)):
+            self._initialize_backend(derive_key(key))
+            return
+        secret_keys = [derive_key(secret) for secret in key]
+        if not secret_keys:
+            raise ModelDefinitionError("At least one encrypt secret is required!")
+        self._initialize_backend(secret_keys[0])
+        if len(secret_keys) > 1:
+            self._initialize_rotation(secret_keys[1:])
 
     @abc.abstractmethod
     def _initialize_backend(self, secret_key: bytes) -> None:  # pragma: nocover
         pass
 
+    def _initialize_rotation(self, old_secret_keys: List[bytes]) -> None:
+        """
+        Allows the backend to decrypt the values encrypted with older keys.
+
+        :param old_secret_keys: derived keys used before rotation, newest first
+        :type old_secret_keys: List[bytes]
+        """
+        raise ModelDefinitionError(
+            f"{self.__class__.__name__} does not support rotation of keys!"
+        )
+
     @abc.abstractmethod
     def encrypt(self, value: Any) -> str:  # pragma: nocover
         pass
@@ -55,6 +114,9 @@ class HashBackend(EncryptBackend):
         self.secret_key = base64.urlsafe_b64encode(secret_key)
 
     def encrypt(self, value: Any) -> str:
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import hashes
+
         if not isinstance(value, str):  # pragma: nocover
             value = repr(value)
         value = value.encode()
@@ -76,8 +138,18 @@ class FernetBackend(EncryptBackend):
     """
 
     def _initialize_backend(self, secret_key: bytes) -> None:
+        from cryptography.fernet import Fernet, MultiFernet
+
         self.secret_key = base64.urlsafe_b64encode(secret_key)
-        self.fernet = Fernet(self.secret_key)
+        self.fernet: Union[Fernet, MultiFernet] = Fernet(self.secret_key)
+
+    def _initialize_rotation(self, old_secret_keys: List[bytes]) -> None:
+        from cryptography.fernet import Fernet, MultiFernet
+
+        keys = [self.secret_key] + [
+            base64.urlsafe_b64encode(key) for key in old_secret_keys
+        ]
+        self.fernet = MultiFernet([Fernet(key) for key in keys])
 
     def encrypt(self, value: Any) -> str:
         if not isinstance(value, str):
@@ -108,6 +180,59 @@ BACKENDS_MAP = {
 }
 
 
+def get_backend(
+    backend: Callable[[], EncryptBackend], key: Union[Secret, Tuple[Secret, ...]]
+) -> EncryptBackend:
+    """
+    Returns backend initialized with given key.
+
+    :param backend: backend class
+    :type backend: Callable[[], EncryptBackend]
+    :param key: secret or tuple of secrets, the newest first
+    :type key: Union[str, bytes, Tuple[Union[str, bytes], ...]]
+    :return: initialized backend
+    :rtype: EncryptBackend
+    """
+    initialized_backend = backend()
+    initialized_backend._refresh(key)
+    return initialized_backend
+
+
+def get_key_digest(key: Union[Secret, Tuple[Secret, ...]]) -> bytes:
+    """
+    Returns sha256 digest of the secret (or secrets), used to recognize the change
+    of the secret without keeping the secret itself.
+
+    :param key: secret or tuple of secrets, the newest first
+    :type key: Union[str, bytes, Tuple[Union[str, bytes], ...]]
+    :return: digest of the secrets
+    :rtype: bytes
+    """
+    secrets = (key,) if isinstance(key, (str, bytes)) else key
+    digest = hashlib.sha256()
+    for secret in secrets:
+        value = secret.encode("utf-8") if isinstance(secret, str) else secret
+        digest.update(len(value).to_bytes(8, "big"))
+        digest.update(value)
+    return digest.digest()
+
+
+class EncryptedValue:
+    """
+    Placeholder of not yet decrypted value returned by encrypted column
+    when decryption is deferred.
+    """
+
+    __slots__ = ("value", "column_type", "dialect")
+
+    def __init__(
+        self, value: str, column_type: "EncryptedString", dialect: Dialect
+    ) -> None:
+        self.value = value
+        self.column_type = column_type
+        self.dialect = dialect
+
+
 class EncryptedString(types.TypeDecorator):
     """
     Used to store encrypted values in a database
@@ -117,7 +242,7 @@ class EncryptedString(types.TypeDecorator):
 
     def __init__(
         self,
-        encrypt_secret: Union[str, Callable],
+        encrypt_secret: Union[Secret, Sequence[Secret], Callable],
         encrypt_backend: EncryptBackends = EncryptBackends.FERNET,
         encrypt_custom_backend: Optional[Type[EncryptBackend]] = None,
         **kwargs: Any,
@@ -136,10 +261,12 @@ class EncryptedString(types.TypeDecorator):
         ):
             raise ModelDefinitionError("Wrong or no encrypt backend provided!")
 
-        self.backend: EncryptBackend = backend()
+        self._backend_class = backend
+        self.backend: EncryptBackend
+        self._backend_digest: Optional[bytes] = None
         self._field_type: "BaseField" = _field_type
         self._underlying_type: Any = _field_type.column_type
-        self._key: Union[str, Callable] = encrypt_secret
+        self._key: Union[Secret, Sequence[Secret], Callable] = encrypt_secret
         type_ = self._field_type.__type__
         if type_ is None:  # pragma: nocover
             raise ModelDefinitionError(
@@ -154,8 +281,20 @@ class EncryptedString(types.TypeDecorator):
         return dialect.type_descriptor(types.TEXT())
 
     def _refresh(self) -> None:
+        """
+        Sets the backend initialized with current secret. For callable secrets
+        the backend is changed only if the callable returns different secret,
+        only the digest of the secret is kept to recognize the change.
+        """
+        if self._backend_digest is not None and not callable(self._key):
+            return
         key = self._key() if callable(self._key) else self._key
-        self.backend._refresh(key)
+        if not isinstance(key, (str, bytes)):
+            key = tuple(key)
+        digest = get_key_digest(key)
+        if digest != self._backend_digest:
+            self.backend = get_backend(self._backend_class, key)
+            self._backend_digest = digest
 
     def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[str]:
         if value is None:
@@ -179,7 +318,26 @@ class EncryptedString(types.TypeDecorator):
     def process_result_value(self, value: Any, dialect: Dialect) -> Any:
         if value is None:
             return value
+        if deferred_decryption.get():
+            return EncryptedValue(value=value, column_type=self, dialect=dialect)
         self._refresh()
+        return self._decrypt(value=value, dialect=dialect)
+
+    def decrypt_values(self, values: List[str], dialect: Dialect) -> List[Any]:
+        """
+        Decrypts many values at once. The backend has to be already refreshed,
+        as it's called outside of the event loop, in executor.
+
+        :param values: encrypted values from the database
+        :type values: List[str]
+        :param dialect: dialect of the database
+        :type dialect: Dialect
+        :return: decrypted values parsed to python type of the field
+        :rtype: List[Any]
+        """
+        return [self._decrypt(value=value, dialect=dialect) for value in values]
+
+    def _decrypt(self, value: Any, dialect: Dialect) -> Any:
         decrypted_value = self.backend.decrypt(value)
         try:
             return self._underlying_type.process_result_value(decrypted_value, dialect)
@@ -10,6 +10,13 @@ from ormar.models.model import Model, T  # noqa I100
 from ormar.models.excludable import ExcludableItems  # noqa I100
 from ormar.models.utils import Extra  # noqa I100
 from ormar.models.ormar_config import OrmarConfig  # noqa I100
+from ormar.models.json_dump import dump_json_many  # noqa I100
+from ormar.models.readonly import ReadOnlyRecord  # noqa I100
+from ormar.models.warmup import (  # noqa I100
+    prepare_models,
+    update_forward_refs,
+    warm_pydantic_cache,
+)
 
 __all__ = [
     "NewBaseModel",
@@ -19,4 +26,9 @@ __all__ = [
     "T",
     "Extra",
     "OrmarConfig",
+    "dump_json_many",
+    "ReadOnlyRecord",
+    "warm_pydantic_cache",
+    "prepare_models",
+    "update_forward_refs",
 ]
@@ -1,4 +1,3 @@
-import base64
 from typing import TYPE_CHECKING, Any, Type
 
 from ormar.fields.parsers import decode_bytes, encode_json
@@ -21,7 +20,7 @@ class PydanticDescriptor:
 
     def __set__(self, instance: "Model", value: Any) -> None:
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance._mark_as_changed(self.name)
 
 
 class JsonDescriptor:
@@ -39,13 +38,14 @@ class JsonDescriptor:
     def __set__(self, instance: "Model", value: Any) -> None:
         value = encode_json(value)
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance._mark_as_changed(self.name)
 
 
 class BytesDescriptor:
     """
-    Bytes descriptor converts strings to bytes on write and converts bytes to str
-    if represent_as_base64_str flag is set, so the value can be dumped to json
+    Bytes descriptor converts strings (and buffers) to bytes on write and converts
+    bytes to str if represent_as_base64_str flag is set, so the value can be dumped
+    to json. The str representation is cached until the value changes.
     """
 
     def __init__(self, name: str) -> None:
@@ -59,17 +59,17 @@ class BytesDescriptor:
             and field.represent_as_base64_str
             and not isinstance(value, str)
         ):
-            value = base64.b64encode(value).decode()
+            value = instance._encode_base64(name=self.name, value=value)
         return value
 
     def __set__(self, instance: "Model", value: Any) -> None:
         field = instance.ormar_config.model_fields[self.name]
-        if isinstance(value, str):
+        if isinstance(value, (str, bytearray, memoryview)):
             value = decode_bytes(
                 value=value, represent_as_string=field.represent_as_base64_str
             )
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance._mark_as_changed(self.name)
 
 
 class PkDescriptor:
@@ -87,7 +87,7 @@ class PkDescriptor:
 
     def __set__(self, instance: "Model", value: Any) -> None:
         instance._internal_set(self.name, value)
-        instance.set_save_status(False)
+        instance._mark_as_changed(self.name)
 
 
 class RelationDescriptor:
@@ -95,20 +95,30 @@ class RelationDescriptor:
     Relation descriptor expands the relation to initialize the related model
     before setting it to __dict__. Note that expanding also registers the
     related model in RelationManager.
+
+    Raw fk values (i.e. loaded from database) are kept in __dict__ and expanded
+    into pk only models on first access.
     """
 
     def __init__(self, name: str) -> None:
         self.name = name
 
     def __get__(self, instance: "Model", owner: Type["Model"]) -> Any:
+        value = instance.__dict__.get(self.name, None)
+        if value is not None:
+            field = instance.ormar_config.model_fields[self.name]
+            if field.is_raw_pk_value(value):
+                field.expand_relationship(value=value, child=instance)
         if self.name in instance._orm:
             return instance._orm.get(self.name)  # type: ignore
         return None  # pragma no cover
 
     def __set__(self, instance: "Model", value: Any) -> None:
-        instance.ormar_config.model_fields[self.name].expand_relationship(
-            value=value, child=instance
-        )
+        field = instance.ormar_config.model_fields[self.name]
+        field.expand_relationship(value=value, child=instance)
 
         if not isinstance(instance.__dict__.get(self.name), list):
-            instance.set_save_status(False)
+            if field.is_valid_uni_relation():
+                instance._mark_as_changed(self.name)
+            else:
+                instance.set_save_status(False)
@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import ForeignKeyField, Model
+
+# plans are cached per set of parameters, limit prevents unbounded growth
+# of the cache if include/exclude are generated dynamically
+MAX_DUMP_PLANS = 256
+
+
+@dataclass
+class DumpPlan:
+    """
+    Structural part of model_dump() for given model class and set of
+    include/exclude/relation_map and flags, so it can be reused by each instance
+    that is dumped with the same parameters.
+    """
+
+    include: Union[Set, Dict, None]
+    exclude: Set
+    bytes_fields: List[str]
+    relations: List["RelationDumpPlan"]
+    through_fields: List[str]
+    exclude_primary_keys: bool
+    exclude_through_models: bool
+    exclude_list: bool
+
+
+@dataclass
+class RelationDumpPlan:
+    """
+    Plan of dumping a single relation of a model, keeps the key of the plans
+    of related models, so nested models do not recalculate it.
+    """
+
+    name: str
+    relation_field: "ForeignKeyField"
+    include: Union[Set, Dict, None]
+    exclude: Union[Set, Dict, None]
+    relation_map: Dict
+    pk_name: Optional[str]
+    is_list: bool
+    exclude_primary_keys: bool
+    exclude_through_models: bool
+    key: Optional[Hashable] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.key = get_plan_key(
+            include=self.include,
+            exclude=self.exclude,
+            relation_map=self.relation_map,
+            flags=(self.exclude_primary_keys, self.exclude_through_models, False),
+        )
+
+    def get_plan(self, model_cls: Type["Model"]) -> DumpPlan:
+        """
+        Returns the plan of dumping related model of given class from the plans
+        cached on that class, so plans of related models are invalidated together
+        with their class cache.
+
+        :param model_cls: class of related model
+        :type model_cls: Type[Model]
+        :return: plan of dumping related model
+        :rtype: DumpPlan
+        """
+        return model_cls._get_dump_plan(
+            include=self.include,
+            exclude=self.exclude,
+            relation_map=self.relation_map,
+            exclude_primary_keys=self.exclude_primary_keys,
+            exclude_through_models=self.exclude_through_models,
+            exclude_list=False,
+            key=self.key,
+        )
+
+
+def get_plan_key(
+    include: Union[Set, Dict, None],
+    exclude: Union[Set, Dict, None],
+    relation_map: Optional[Dict],
+    flags: Tuple[bool, ...],
+) -> Optional[Hashable]:
+    """
+    Returns the key of the plans cache for given parameters of model_dump().
+
+    :param include: fields to include
+    :type include: Union[Set, Dict, None]
+    :param exclude: fields to exclude
+    :type exclude: Union[Set, Dict, None]
+    :param relation_map: map of the relations to follow
+    :type relation_map: Optional[Dict]
+    :param flags: exclude_primary_keys, exclude_through_models, exclude_list flags
+    :type flags: Tuple[bool, ...]
+    :return: key of the plan or None if parameters are not hashable
+    :rtype: Optional[Hashable]
+    """
+    try:
+        return (
+            freeze_items(include),
+            freeze_items(exclude),
+            freeze_items(relation_map),
+            flags,
+        )
+    except TypeError:  # pragma: no cover
+        return None
+
+
+def freeze_items(items: Any) -> Hashable:
+    """
+    Converts (nested) include/exclude/relation_map structure into hashable value
+    that can be used as a key of the plans cache.
+
+    :raises TypeError: if structure contains unhashable values
+    :param items: set/dict of items to freeze
+    :type items: Any
+    :return: hashable representation of the items
+    :rtype: Hashable
+    """
+    if isinstance(items, dict):
+        return (
+            dict,
+            frozenset((key, freeze_items(value)) for key, value in items.items()),
+        )
+    if isinstance(items, (set, frozenset, list, tuple)):
+        return type(items), frozenset(items)
+    hash(items)
+    return items
@@ -1,10 +1,11 @@
 import itertools
 import sqlite3
-from typing import TYPE_CHECKING, Any, Dict, ForwardRef, List, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, ForwardRef, List, Optional, Tuple, Type
 
 import pydantic
 
 import ormar  # noqa: I100
+from ormar.fields.parsers import DecodedJson
 from ormar.models.helpers.pydantic import populate_pydantic_default_values
 
 if TYPE_CHECKING:  # pragma no cover
@@ -52,6 +53,12 @@ def populate_default_options_values(  # noqa: CCR001
     new_model._json_fields = {
         name for name, field in model_fields.items() if field.__type__ == pydantic.Json
     }
+    new_model._json_string_fields = {
+        name
+        for name in new_model._json_fields
+        if model_fields[name].__pydantic_type__
+        not in (DecodedJson, Optional[DecodedJson])
+    }
     new_model._bytes_fields = {
         name for name, field in model_fields.items() if field.__type__ is bytes
     }
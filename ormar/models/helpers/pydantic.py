@@ -1,5 +1,6 @@
+from contextlib import contextmanager
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple, Type, Union
 
 import pydantic
 from pydantic import ConfigDict
@@ -12,6 +13,9 @@ if TYPE_CHECKING:  # pragma no cover
     from ormar import Model
     from ormar.fields import ManyToManyField
 
+# models with postponed rebuild of pydantic schema, None if rebuilds are not batched
+postponed_rebuilds: Optional[Dict[Type[pydantic.BaseModel], None]] = None
+
 
 def create_pydantic_field(
     field_name: str, model: Type["Model"], model_field: "ManyToManyField"
@@ -32,7 +36,43 @@ def create_pydantic_field(
     model_field.through.model_fields[field_name] = FieldInfo.from_annotated_attribute(
         annotation=Optional[model], default=None  # type: ignore
     )
-    model_field.through.model_rebuild(force=True)
+    rebuild_model(model=model_field.through)
+
+
+def rebuild_model(model: Type[pydantic.BaseModel]) -> None:
+    """
+    Rebuilds pydantic schema of the model after its fields changed.
+
+    Inside batched_model_rebuilds() the model is only registered
+    and rebuilt once at the end of the batch.
+
+    :param model: model with changed pydantic fields
+    :type model: Model class
+    """
+    if postponed_rebuilds is None:
+        model.model_rebuild(force=True)
+        return
+    postponed_rebuilds[model] = None
+
+
+@contextmanager
+def batched_model_rebuilds() -> Iterator[None]:
+    """
+    Postpones the rebuilds of pydantic schemas of models changed inside the block,
+    so each model is rebuilt only once at the end, no matter how many of its
+    relations were updated.
+    """
+    global postponed_rebuilds
+    if postponed_rebuilds is not None:
+        yield
+        return
+    postponed_rebuilds = dict()
+    try:
+        yield
+    finally:
+        models, postponed_rebuilds = postponed_rebuilds, None
+    for model in models:
+        model.model_rebuild(force=True)
 
 
 def populate_pydantic_default_values(attrs: Dict) -> Tuple[Dict, Dict]:
@@ -11,6 +11,7 @@ import ormar
 from ormar import ForeignKey, ManyToMany
 from ormar.fields import Through
 from ormar.models.descriptors import RelationDescriptor
+from ormar.models.helpers.pydantic import rebuild_model
 from ormar.models.helpers.sqlalchemy import adjust_through_many_to_many_model
 from ormar.relations import AliasManager
 
@@ -156,7 +157,9 @@ def register_reverse_model_fields(model_field: "ForeignKeyField") -> None:
         add_field_serializer_for_reverse_relations(
             to_model=model_field.to, related_name=related_name
         )
-        model_field.to.model_rebuild(force=True)
+        rebuild_model(model=model_field.to)
+        model_field.to._dump_plans = {}
+        model_field.to._field_accessors = {}
         setattr(model_field.to, related_name, RelationDescriptor(name=related_name))
 
 
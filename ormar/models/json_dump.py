@@ -0,0 +1,127 @@
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Set, Type, Union
+
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+
+def get_json_encoder(model_cls: Type["Model"]) -> Callable[[Any], Any]:
+    """
+    Returns function converting values not natively supported by orjson
+    (like Decimal, bytes, timedelta) to json compatible python objects.
+
+    Encoder respects the serialization settings of the pydantic config of the model
+    (bytes and timedelta modes) so the output matches model_dump_json().
+    Encoder is created once and cached on the model class.
+
+    :param model_cls: class of the model that is dumped
+    :type model_cls: Type[Model]
+    :return: function used as default in orjson.dumps
+    :rtype: Callable[[Any], Any]
+    """
+    encoder = model_cls._json_encoder
+    if encoder is None:
+        encoder = partial(
+            pydantic_core.to_jsonable_python,
+            timedelta_mode=model_cls.model_config.get("ser_json_timedelta", "iso8601"),
+            bytes_mode=model_cls.model_config.get("ser_json_bytes", "utf8"),
+        )
+        model_cls._json_encoder = encoder
+    return encoder
+
+
+def dumps(data: Any, model_cls: Type["Model"]) -> bytes:
+    """
+    Serializes already dumped (dict/list) data of given model class to json bytes.
+
+    Uses orjson if installed, falls back to pydantic_core serializer for values
+    orjson cannot handle (i.e. integers exceeding 64 bits) or if it's not installed.
+
+    :param data: result of model_dump() or list of those
+    :type data: Any
+    :param model_cls: class of the dumped model
+    :type model_cls: Type[Model]
+    :return: json representation of data
+    :rtype: bytes
+    """
+    encoder = get_json_encoder(model_cls)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=encoder,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return pydantic_core.to_json(encoder(data))
+
+
+def dump_json_many(
+    models: Iterable["Model"],
+    *,
+    include: Union[Set, Dict, None] = None,
+    exclude: Union[Set, Dict, None] = None,
+    by_alias: bool = False,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+    exclude_primary_keys: bool = False,
+    exclude_through_models: bool = False,
+) -> bytes:
+    """
+    Serializes list of models into json array in one go.
+
+    Each model is dumped with the same parameters as in model_dump_json() (so it
+    reuses the cached dump plans) and the whole list is encoded at once, which is
+    much faster than joining results of model_dump_json() of each model.
+
+    Models are expected to be of the same class, the json encoder of the first one
+    is used for the whole list.
+
+    :param models: models to serialize
+    :type models: Iterable[Model]
+    :param include: fields to include
+    :type include: Union[Set, Dict, None]
+    :param exclude: fields to exclude
+    :type exclude: Union[Set, Dict, None]
+    :param by_alias: flag to get values by alias - passed to pydantic
+    :type by_alias: bool
+    :param exclude_unset: flag to exclude not set values - passed to pydantic
+    :type exclude_unset: bool
+    :param exclude_defaults: flag to exclude default values - passed to pydantic
+    :type exclude_defaults: bool
+    :param exclude_none: flag to exclude None values - passed to pydantic
+    :type exclude_none: bool
+    :param exclude_primary_keys: flag to exclude primary keys from dict
+    :type exclude_primary_keys: bool
+    :param exclude_through_models: flag to exclude through models from dict
+    :type exclude_through_models: bool
+    :return: json array with dumped models
+    :rtype: bytes
+    """
+    if not isinstance(models, (list, tuple)):
+        models = list(models)
+    if not models:
+        return b"[]"
+    data = [
+        model.model_dump(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            exclude_primary_keys=exclude_primary_keys,
+            exclude_through_models=exclude_through_models,
+        )
+        for model in models
+    ]
+    return dumps(data, model_cls=models[0].__class__)
@@ -66,6 +66,9 @@ if TYPE_CHECKING:  # pragma no cover
 CONFIG_KEY = "Config"
 PARSED_FIELDS_KEY = "__parsed_fields__"
 
+# number of models which pydantic classes are currently being constructed
+models_in_construction = 0
+
 
 def add_cached_properties(new_model: Type["Model"]) -> None:
     """
@@ -85,8 +88,16 @@ def add_cached_properties(new_model: Type["Model"]) -> None:
     new_model._related_names = None
     new_model._through_names = None
     new_model._related_fields = None
+    new_model._raw_pk_names = None
+    new_model._dump_plans = {}
     new_model._json_fields = set()
+    new_model._json_string_fields = set()
     new_model._bytes_fields = set()
+    new_model._json_encoder = None
+    new_model._pydantic_projections = {}
+    new_model._readonly_records = {}
+    new_model._field_accessors = {}
+    new_model._batch_loader = None
 
 
 def add_property_fields(new_model: Type["Model"], attrs: Dict) -> None:  # noqa: CCR001
@@ -542,7 +553,7 @@ def add_field_descriptor(
     """
     if field.is_relation:
         setattr(new_model, name, RelationDescriptor(name=name))
-    elif field.__type__ == pydantic.Json:
+    elif name in new_model._json_string_fields:
         setattr(new_model, name, JsonDescriptor(name=name))
     elif field.__type__ is bytes:
         setattr(new_model, name, BytesDescriptor(name=name))
@@ -550,7 +561,7 @@ def add_field_descriptor(
         setattr(new_model, name, PydanticDescriptor(name=name))
 
 
-def get_serializer() -> Callable:
+def get_serializer(field_name: str) -> Callable:
     def serialize(
         self: "Model",
         value: Optional["Model"],
@@ -558,8 +569,11 @@ def get_serializer() -> Callable:
     ) -> Any:
         """
         Serialize a value if it's not expired weak reference.
+        Raw fk values are expanded into related models before serialization.
         """
         try:
+            if self.ormar_config.model_fields[field_name].is_raw_pk_value(value):
+                value = getattr(self, field_name)
             with warnings.catch_warnings():
                 warnings.filterwarnings(
                     "ignore", message="Pydantic serializer warnings"
@@ -634,19 +648,26 @@ class ModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
                 if field.is_relation:
                     decorator = field_serializer(
                         field_name, mode="wrap", check_fields=False
-                    )(get_serializer())
+                    )(get_serializer(field_name))
                     attrs[f"serialize_{field_name}"] = decorator
 
-        new_model = super().__new__(
-            mcs,  # type: ignore
-            name,
-            bases,
-            attrs,
-            __pydantic_generic_metadata__=__pydantic_generic_metadata__,
-            __pydantic_reset_parent_namespace__=__pydantic_reset_parent_namespace__,
-            _create_model_module=_create_model_module,
-            **kwargs,
-        )
+        global models_in_construction
+        models_in_construction += 1
+        try:
+            new_model = super().__new__(
+                mcs,  # type: ignore
+                name,
+                bases,
+                attrs,
+                __pydantic_generic_metadata__=__pydantic_generic_metadata__,
+                __pydantic_reset_parent_namespace__=(
+                    __pydantic_reset_parent_namespace__
+                ),
+                _create_model_module=_create_model_module,
+                **kwargs,
+            )
+        finally:
+            models_in_construction -= 1
 
         add_cached_properties(new_model)
 
@@ -706,26 +727,37 @@ class ModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
         :return: FieldAccessor for given field
         :rtype: FieldAccessor
         """
-        # Ugly workaround for name shadowing warnings in pydantic
-        frame = sys._getframe(1)
-        file_name = Path(frame.f_code.co_filename)
-        if (
-            frame.f_code.co_name == "collect_model_fields"
-            and file_name.name == "_fields.py"
-            and file_name.parent.parent.name == "pydantic"
-        ):
-            raise AttributeError()
+        if models_in_construction:
+            # Ugly workaround for name shadowing warnings in pydantic,
+            # fields are collected by pydantic only when classes are constructed
+            frame = sys._getframe(1)
+            if frame.f_code.co_name == "collect_model_fields":
+                file_name = Path(frame.f_code.co_filename)
+                if (
+                    file_name.name == "_fields.py"
+                    and file_name.parent.parent.name == "pydantic"
+                ):
+                    raise AttributeError()
         if item == "pk":
             item = self.ormar_config.pkname
+        accessors = self.__dict__.get("_field_accessors")
+        if accessors is not None and item in accessors:
+            return accessors[item]
         if item in object.__getattribute__(self, "ormar_config").model_fields:
             field = self.ormar_config.model_fields.get(item)
             if field.is_relation:
-                return FieldAccessor(
+                accessor = FieldAccessor(
                     source_model=cast(Type["Model"], self),
                     model=field.to,
                     access_chain=item,
                 )
-            return FieldAccessor(
-                source_model=cast(Type["Model"], self), field=field, access_chain=item
-            )
+            else:
+                accessor = FieldAccessor(
+                    source_model=cast(Type["Model"], self),
+                    field=field,
+                    access_chain=item,
+                )
+            if accessors is not None:
+                accessors[item] = accessor
+            return accessor
         return object.__getattribute__(self, item)
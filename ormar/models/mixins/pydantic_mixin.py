@@ -6,6 +6,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Set,
@@ -21,12 +22,35 @@ from pydantic._internal._decorators import DecoratorInfos
 from pydantic.fields import FieldInfo
 
 from ormar.fields import BaseField, ForeignKeyField, ManyToManyField
+from ormar.models.dump_plan import freeze_items
 from ormar.models.mixins.relation_mixin import RelationMixin  # noqa: I100, I202
 from ormar.queryset.utils import translate_list_to_dict
 
 
+def canonicalize_items(items: Union[Set, Dict, None]) -> Union[Dict, None]:
+    """
+    Converts (nested) include/exclude structure into nested dictionaries,
+    so equivalent sets and dictionaries result in the same structure.
+
+    :param items: set/dict of fields to convert
+    :type items: Union[Set, Dict, None]
+    :return: nested dictionary of fields
+    :rtype: Union[Dict, None]
+    """
+    if not items:
+        return None
+    if isinstance(items, (set, frozenset, list, tuple)):
+        items = translate_list_to_dict(items)
+    if not isinstance(items, dict):
+        return items
+    return {
+        key: canonicalize_items(value) if value is not ... else ...
+        for key, value in items.items()
+    }
+
+
 class PydanticMixin(RelationMixin):
-    __cache__: Dict[str, Type[pydantic.BaseModel]] = {}
+    __cache__: Dict[Hashable, Type[pydantic.BaseModel]] = {}
 
     if TYPE_CHECKING:  # pragma: no cover
         __pydantic_decorators__: DecoratorInfos
@@ -53,16 +77,46 @@ class PydanticMixin(RelationMixin):
         :param exclude: fields of own and nested models to exclude
         :type exclude: Union[Set, Dict, None]
         """
-        relation_map = translate_list_to_dict(cls._iterate_related_models())
+        return cls._convert_ormar_to_pydantic(include=include, exclude=exclude)
 
-        return cls._convert_ormar_to_pydantic(
-            include=include, exclude=exclude, relation_map=relation_map
-        )
+    @classmethod
+    def _get_pydantic_cache_key(
+        cls,
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        relation_map: Optional[Dict[str, Any]],
+    ) -> Optional[Hashable]:
+        """
+        Returns key of generated pydantic model in the cache, with include and
+        exclude canonicalized, so i.e. set and dict with the same fields
+        are resolved to the same model.
+
+        Relation map is None for models generated directly by get_pydantic(),
+        that always use the full relation map of the model.
+
+        :param include: fields of own and nested models to include
+        :type include: Union[Set, Dict, None]
+        :param exclude: fields of own and nested models to exclude
+        :type exclude: Union[Set, Dict, None]
+        :param relation_map: map of relations to follow, None for the root model
+        :type relation_map: Optional[Dict[str, Any]]
+        :return: key of the cache or None if parameters are not hashable
+        :rtype: Optional[Hashable]
+        """
+        try:
+            return (
+                cls,
+                freeze_items(canonicalize_items(include)),
+                freeze_items(canonicalize_items(exclude)),
+                freeze_items(relation_map),
+            )
+        except TypeError:  # pragma: no cover
+            return None
 
     @classmethod
     def _convert_ormar_to_pydantic(
         cls,
-        relation_map: Dict[str, Any],
+        relation_map: Optional[Dict[str, Any]] = None,
         include: Union[Set, Dict, None] = None,
         exclude: Union[Set, Dict, None] = None,
     ) -> Type[pydantic.BaseModel]:
@@ -70,20 +124,26 @@ class PydanticMixin(RelationMixin):
             include = translate_list_to_dict(include)
         if exclude and isinstance(exclude, Set):
             exclude = translate_list_to_dict(exclude)
+        cache_key = cls._get_pydantic_cache_key(
+            include=include, exclude=exclude, relation_map=relation_map
+        )
+        if cache_key is not None and cache_key in cls.__cache__:
+            return cls.__cache__[cache_key]
+
+        if relation_map is None:
+            relation_map = translate_list_to_dict(cls._iterate_related_models())
         fields_dict: Dict[str, Any] = dict()
         defaults: Dict[str, Any] = dict()
-        fields_to_process = cls._get_not_excluded_fields(
-            fields={*cls.ormar_config.model_fields.keys()},
-            include=include,
-            exclude=exclude,
-        )
-        fields_to_process.sort(
-            key=lambda x: list(cls.ormar_config.model_fields.keys()).index(x)
+        not_excluded = set(
+            cls._get_not_excluded_fields(
+                fields={*cls.ormar_config.model_fields.keys()},
+                include=include,
+                exclude=exclude,
+            )
         )
-
-        cache_key = f"{cls.__name__}_{str(include)}_{str(exclude)}"
-        if cache_key in cls.__cache__:
-            return cls.__cache__[cache_key]
+        fields_to_process = [
+            name for name in cls.ormar_config.model_fields if name in not_excluded
+        ]
 
         for name in fields_to_process:
             field = cls._determine_pydantic_field_type(
@@ -102,7 +162,8 @@ class PydanticMixin(RelationMixin):
         )
         model = cast(Type[pydantic.BaseModel], model)
         cls._copy_field_validators(model=model)
-        cls.__cache__[cache_key] = model
+        if cache_key is not None:
+            cls.__cache__[cache_key] = model
         return model
 
     @classmethod
@@ -1,4 +1,14 @@
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    cast,
+    get_args,
+)
 
 from ormar import BaseField, ForeignKeyField
 from ormar.models.traversible import NodeList
@@ -17,6 +27,8 @@ class RelationMixin:
         _related_names: Optional[Set]
         _through_names: Optional[Set]
         _related_fields: Optional[List]
+        _raw_pk_names: Optional[Set]
+        model_fields: Dict
         get_name: Callable
 
     @classmethod
@@ -116,6 +128,52 @@ class RelationMixin:
         }
         return related_names
 
+    @classmethod
+    def _extract_raw_pk_names(cls) -> Set[str]:
+        """
+        Returns names of fk fields that can hold raw pk values of related models
+        instead of pk only models. Those are fields stored in own table for which
+        pydantic annotation accepts the pk type of related model (it's not the
+        case for through models and fields declared with ForwardRefs).
+        Set is cached in cls._raw_pk_names for quicker access.
+
+        :return: set of fk fields names that can keep raw pk values
+        :rtype: Set
+        """
+        if cls._raw_pk_names is not None:
+            return cls._raw_pk_names
+
+        raw_pk_names = set()
+        for name in cls._extract_db_related_names():
+            field = cls.ormar_config.model_fields[name]
+            pydantic_field = cls.model_fields.get(name)
+            if pydantic_field is not None and cls._annotation_accepts(
+                pydantic_field.annotation, field.to.pk_type()
+            ):
+                raw_pk_names.add(name)
+        cls._raw_pk_names = raw_pk_names
+
+        return raw_pk_names
+
+    @staticmethod
+    def _annotation_accepts(annotation: Any, type_: Any) -> bool:
+        """
+        Checks recursively if given type is one of the types of the annotation.
+
+        :param annotation: pydantic annotation of the field
+        :type annotation: Any
+        :param type_: type to look for
+        :type type_: Any
+        :return: result of the check
+        :rtype: bool
+        """
+        if annotation is type_:
+            return True
+        return any(
+            RelationMixin._annotation_accepts(arg, type_)
+            for arg in get_args(annotation)
+        )
+
     @classmethod
     def _iterate_related_models(  # noqa: CCR001
         cls,
@@ -21,7 +21,9 @@ from pydantic_core import CoreSchema, SchemaValidator
 
 import ormar  # noqa: I100, I202
 from ormar.exceptions import ModelPersistenceError
-from ormar.fields.parsers import encode_json
+from ormar.fields.parsers import encode_json, parse_json
+from ormar.fields.sqlalchemy_compressed import CompressBackends, CompressedType
+from ormar.fields.sqlalchemy_encrypted import EncryptedString
 from ormar.models.mixins import AliasMixin
 from ormar.models.mixins.relation_mixin import RelationMixin
 
@@ -37,6 +39,7 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
     if TYPE_CHECKING:  # pragma: nocover
         _skip_ellipsis: Callable
         _json_fields: Set[str]
+        _json_string_fields: Set[str]
         _bytes_fields: Set[str]
         __pydantic_core_schema__: CoreSchema
         __ormar_fields_validators__: Optional[
@@ -81,6 +84,7 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         new_kwargs = cls.dump_all_json_fields_to_str(new_kwargs)
         new_kwargs = cls.translate_columns_to_aliases(new_kwargs)
         new_kwargs = cls.translate_enum_columns(new_kwargs)
+        new_kwargs = cls.bind_custom_column_types(new_kwargs)
         return new_kwargs
 
     @classmethod
@@ -90,6 +94,29 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
                 new_kwargs[key] = value.name
         return new_kwargs
 
+    @classmethod
+    def bind_custom_column_types(cls, new_kwargs: dict) -> dict:
+        """
+        Encrypts and compresses values of encrypted and compressed columns.
+
+        Used in bulk_update that executes the query as text, so sqlalchemy
+        does not process the values with column types.
+
+        :param new_kwargs: dictionary of model that is about to be saved
+        :type new_kwargs: Dict[str, str]
+        :return: dictionary of model that is about to be saved
+        :rtype: Dict[str, str]
+        """
+        columns = cls.ormar_config.table.columns
+        dialect = cls.ormar_config.database._backend._dialect
+        for key, value in new_kwargs.items():
+            column = columns.get(key)
+            if column is not None and isinstance(
+                column.type, (EncryptedString, CompressedType)
+            ):
+                new_kwargs[key] = column.type.process_bind_param(value, dialect)
+        return new_kwargs
+
     @classmethod
     def _remove_not_ormar_fields(cls, new_kwargs: dict) -> dict:
         """
@@ -214,11 +241,32 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         :return: dictionary of model that is about to be saved
         :rtype: Dict
         """
+        fields = cls.ormar_config.model_fields
         for key, value in model_dict.items():
-            if key in cls._json_fields:
+            if (
+                key in cls._json_fields
+                and fields[key].compress_backend == CompressBackends.NONE
+            ):
                 model_dict[key] = encode_json(value)
         return model_dict
 
+    @classmethod
+    def load_json_fields(cls, model_dict: Dict) -> Dict:
+        """
+        Receives dictionary of values that are about to be saved and loads json
+        documents passed as strings to json fields that keep decoded values,
+        so those are encoded only once by the database column.
+
+        :param model_dict: dictionary of values that are about to be saved
+        :type model_dict: Dict
+        :return: dictionary of values that are about to be saved
+        :rtype: Dict
+        """
+        for key, value in model_dict.items():
+            if key in cls._json_fields and key not in cls._json_string_fields:
+                model_dict[key] = parse_json(value)
+        return model_dict
+
     @classmethod
     def populate_default_values(cls, new_kwargs: Dict) -> Dict:
         """
@@ -1,9 +1,21 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import ormar.queryset  # noqa I100
 from ormar.exceptions import ModelPersistenceError, NoMatch
 from ormar.models import NewBaseModel  # noqa I100
 from ormar.models.model_row import ModelRow
+from ormar.queryset.related_loader import load_pk_only_models
 from ormar.queryset.utils import subtract_dict, translate_list_to_dict
 
 T = TypeVar("T", bound="Model")
@@ -74,6 +86,32 @@ class Model(ModelRow):
         :rtype: Model
         """
         await self.signals.pre_save.send(sender=self.__class__, instance=self)
+        self_fields = self._prepare_insert_values()
+        expr = self.ormar_config.table.insert()
+        expr = expr.values(**self_fields)
+
+        pk = await self.ormar_config.database.execute(expr)
+        if pk and isinstance(pk, self.pk_type()):
+            setattr(self, self.ormar_config.pkname, pk)
+
+        self.set_save_status(True)
+        # refresh server side defaults
+        if self._has_missing_server_defaults(self_fields):
+            await self.load()
+
+        await self.signals.post_save.send(sender=self.__class__, instance=self)
+        return self
+
+    def _prepare_insert_values(self) -> Dict[str, Any]:
+        """
+        Prepares the values of the model to insert into the database.
+
+        Removes not set autoincrement primary key, populates default values
+        (also on the model itself) and translates the names into db aliases.
+
+        :return: dictionary of column aliases and values to insert
+        :rtype: Dict[str, Any]
+        """
         self_fields = self._extract_model_db_fields()
 
         if (
@@ -89,26 +127,24 @@ class Model(ModelRow):
                 if k not in self.extract_related_names()
             }
         )
+        return self.translate_columns_to_aliases(self_fields)
 
-        self_fields = self.translate_columns_to_aliases(self_fields)
-        expr = self.ormar_config.table.insert()
-        expr = expr.values(**self_fields)
-
-        pk = await self.ormar_config.database.execute(expr)
-        if pk and isinstance(pk, self.pk_type()):
-            setattr(self, self.ormar_config.pkname, pk)
+    @classmethod
+    def _has_missing_server_defaults(cls, self_fields: Dict[str, Any]) -> bool:
+        """
+        Checks if any of the fields with server_default were not inserted,
+        so model has to be refreshed to get the values populated server side.
 
-        self.set_save_status(True)
-        # refresh server side defaults
-        if any(
+        :param self_fields: dictionary of inserted values
+        :type self_fields: Dict[str, Any]
+        :return: result of the check
+        :rtype: bool
+        """
+        return any(
             field.server_default is not None
-            for name, field in self.ormar_config.model_fields.items()
+            for name, field in cls.ormar_config.model_fields.items()
             if name not in self_fields
-        ):
-            await self.load()
-
-        await self.signals.post_save.send(sender=self.__class__, instance=self)
-        return self
+        )
 
     async def save_related(  # noqa: CCR001, CFQ002
         self,
@@ -218,11 +254,14 @@ class Model(ModelRow):
         Performs update of Model instance in the database.
         Fields can be updated before or you can pass them as kwargs.
 
+        By default only changed fields (see `changed_fields`) are sent to the
+        database, if nothing changed no query is issued.
+
         Sends pre_update and post_update signals.
 
         Sets model save status to True.
 
-        :param _columns: list of columns to update, if None all are updated
+        :param _columns: list of columns to update, if None changed ones are updated
         :type _columns: List
         :raises ModelPersistenceError: If the pk column is not set
 
@@ -242,10 +281,11 @@ class Model(ModelRow):
         await self.signals.pre_update.send(
             sender=self.__class__, instance=self, passed_args=kwargs
         )
+        changed_fields = self.changed_fields
+        columns = _columns or changed_fields
         self_fields = self._extract_model_db_fields()
         self_fields.pop(self.get_column_name_from_alias(self.ormar_config.pkname))
-        if _columns:
-            self_fields = {k: v for k, v in self_fields.items() if k in _columns}
+        self_fields = {k: v for k, v in self_fields.items() if k in columns}
         if self_fields:
             self_fields = self.translate_columns_to_aliases(self_fields)
             expr = self.ormar_config.table.update().values(**self_fields)
@@ -253,6 +293,11 @@ class Model(ModelRow):
 
             await self.ormar_config.database.execute(expr)
         self.set_save_status(True)
+        if _columns:
+            # fields changed but not sent in this update are still out of sync
+            cast(Set[str], self._orm_changed).update(
+                changed_fields.difference(_columns)
+            )
         await self.signals.post_update.send(sender=self.__class__, instance=self)
         return self
 
@@ -297,9 +342,94 @@ class Model(ModelRow):
         kwargs = dict(row)
         kwargs = self.translate_aliases_to_columns(kwargs)
         self.update_from_dict(kwargs)
+        object.__setattr__(self, "__pk_only__", False)
         self.set_save_status(True)
         return self
 
+    async def fetch(self: T) -> T:
+        """
+        Loads the model if it's a not loaded related model (with only pk populated,
+        set on relation of a model loaded without select_related).
+
+        Not loaded related models set on the same relation of all models returned by
+        the query that returned the parent model are loaded together, with one
+        query, so fetching related models of listed models does not issue N queries.
+
+        If model is already loaded no query is issued.
+
+        :raises NoMatch: If given pk is not found in database.
+
+        :return: loaded Model
+        :rtype: Model
+        """
+        if not self.__pk_only__:
+            return self
+        for parent, relation_name in self._get_parents_relations():
+            result_set = parent._result_set
+            siblings = result_set.models if result_set is not None else [parent]
+            await ormar.queryset.load_related(siblings, relation_name)
+            if not self.__pk_only__:
+                return self
+        await load_pk_only_models(model_cls=self.__class__, models=[self])
+        if self.__pk_only__:
+            raise NoMatch("Instance was deleted from database and cannot be loaded")
+        return self
+
+    def _get_parents_relations(self) -> List[Tuple["Model", str]]:
+        """
+        Returns models that have this model set on ForeignKey relation,
+        with names of those relations.
+
+        :return: list of parent models and names of their relations
+        :rtype: List[Tuple[Model, str]]
+        """
+        parents_relations = []
+        for name in self.extract_related_names():
+            field = self.ormar_config.model_fields[name]
+            if not field.virtual or field.is_multi:
+                continue
+            parents = self._orm.get(name) or []
+            for parent in cast(List["Model"], parents):
+                parent_name = field.get_related_name()
+                if getattr(parent, parent_name, None) is self:
+                    parents_relations.append((parent, parent_name))
+        return parents_relations
+
+    async def load_deferred(self: T) -> T:
+        """
+        Loads fields deferred with `QuerySet.defer()`.
+
+        Deferred fields are loaded at once for all models returned by the same
+        query that still wait for them, with one query per batch of primary keys,
+        so accessing deferred fields of many models does not issue a query per model.
+
+        Loaded fields are not marked as changed, fields set on the model
+        before loading are not overwritten.
+        If model has no not loaded deferred fields no query is issued.
+
+        :return: model with loaded deferred fields
+        :rtype: Model
+        """
+        if self._deferred_loader is not None:
+            await self._deferred_loader.load()
+        return self
+
+    def _set_deferred_values(self, values: Dict[str, Any]) -> None:
+        """
+        Sets loaded values of deferred fields without changing the save status
+        of the model. Fields changed since the model was loaded are skipped.
+
+        :param values: loaded fields names and values
+        :type values: Dict[str, Any]
+        """
+        saved, changed = self._orm_saved, self._orm_changed
+        if changed is not None:
+            values = {k: v for k, v in values.items() if k not in changed}
+        self.update_from_dict(values)
+        object.__setattr__(self, "_orm_saved", saved)
+        if changed is not None:
+            changed.difference_update(values)
+
     async def load_all(
         self: T,
         follow: bool = False,
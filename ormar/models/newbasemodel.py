@@ -1,11 +1,14 @@
 import base64
+import copy
 import sys
 import warnings
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Any,
+    Callable,
     Dict,
+    Hashable,
     List,
     Literal,
     Mapping,
@@ -27,7 +30,14 @@ import ormar  # noqa I100
 from ormar.exceptions import ModelError, ModelPersistenceError
 from ormar.fields.foreign_key import ForeignKeyField
 from ormar.fields.parsers import decode_bytes, encode_json
+from ormar.models.dump_plan import (
+    MAX_DUMP_PLANS,
+    DumpPlan,
+    RelationDumpPlan,
+    get_plan_key,
+)
 from ormar.models.helpers import register_relation_in_alias_manager
+from ormar.models.helpers.pydantic import rebuild_model
 from ormar.models.helpers.relations import expand_reverse_relationship
 from ormar.models.helpers.sqlalchemy import (
     populate_config_sqlalchemy_table_if_required,
@@ -44,6 +54,10 @@ from ormar.warnings import OrmarDeprecatedSince020
 
 if TYPE_CHECKING:  # pragma no cover
     from ormar.models import Model, OrmarConfig
+    from ormar.queryset import FieldAccessor
+    from ormar.queryset.batch_loader import BatchLoader
+    from ormar.queryset.deferred import DeferredLoader
+    from ormar.queryset.related_loader import ResultSet
     from ormar.signals import SignalEmitter
 
     T = TypeVar("T", bound="NewBaseModel")
@@ -68,8 +82,12 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
     __slots__ = (
         "_orm_id",
         "_orm_saved",
+        "_orm_changed",
         "_orm",
         "_pk_column",
+        "_base64_values",
+        "_deferred_loader",
+        "_result_set",
         "__pk_only__",
         "__cached_hash__",
         "__pydantic_extra__",
@@ -84,12 +102,24 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         _orm: RelationsManager
         _orm_id: int
         _orm_saved: bool
+        _orm_changed: Optional[Set[str]]
+        _base64_values: Optional[Dict[str, Tuple[bytes, str]]]
+        _deferred_loader: Optional["DeferredLoader"]
+        _result_set: Optional["ResultSet"]
         _related_names: Optional[Set]
         _through_names: Optional[Set]
+        _raw_pk_names: Optional[Set]
+        _dump_plans: Dict[Any, DumpPlan]
         _related_names_hash: str
         _quick_access_fields: Set
         _json_fields: Set
+        _json_string_fields: Set
         _bytes_fields: Set
+        _json_encoder: Optional[Callable[[Any], Any]]
+        _pydantic_projections: Dict[Type[pydantic.BaseModel], Tuple]
+        _readonly_records: Dict[Tuple, Type]
+        _field_accessors: Dict[str, FieldAccessor]
+        _batch_loader: Optional["BatchLoader"]
         ormar_config: OrmarConfig
 
     # noinspection PyMissingConstructor
@@ -147,15 +177,24 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         new_kwargs.update(through_tmp_dict)
         model_fields = object.__getattribute__(self, "ormar_config").model_fields
         # register the columns models after initialization
+        # raw fk values are registered on first access to relation
+        raw_pk_names = self._extract_raw_pk_names()
         for related in self.extract_related_names().union(self.extract_through_names()):
             model_fields[related].expand_relationship(
-                new_kwargs.get(related), self, to_register=True
+                new_kwargs.get(related),
+                self,
+                to_register=True,
+                keep_pk=related in raw_pk_names,
             )
 
     def __setattr__(self, name: str, value: Any) -> None:  # noqa CCR001
         """
         Overwrites setattr in pydantic parent as otherwise descriptors are not called.
 
+        Hash of the model is recalculated (and relation caches updated) only if
+        it could have changed, that is when pk is set or model without pk is
+        modified, so setting plain columns of saved models skips hashing.
+
         :param name: name of the attribute to set
         :type name: str
         :param value: value of the attribute to set
@@ -163,16 +202,18 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         :return: None
         :rtype: None
         """
-        prev_hash = hash(self)
+        pkname = self.ormar_config.pkname
+        rehash = name == pkname or self.__dict__.get(pkname) is None
+        prev_hash = hash(self) if rehash else 0
 
-        if hasattr(self, name):
+        if name in self.ormar_config.model_fields or hasattr(self, name):
             object.__setattr__(self, name, value)
         else:
             # let pydantic handle errors for unknown fields
             super().__setattr__(name, value)
 
         # In this case, the hash could have changed, so update it
-        if name == self.ormar_config.pkname or self.pk is None:
+        if rehash:
             object.__setattr__(self, "__cached_hash__", None)
             new_hash = hash(self)
 
@@ -191,6 +232,8 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         # TODO: Check __pydantic_extra__
         if item == "__pydantic_extra__":
             return None
+        if item == "_orm":
+            return self._initialize_relations_manager()
         return super().__getattr__(item)  # type: ignore
 
     def __getstate__(self) -> Dict[Any, Any]:
@@ -232,13 +275,18 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
 
                 if hasattr(relation_proxy, "update_cache"):
                     relation_proxy.update_cache(prev_hash, new_hash)  # type: ignore
-                elif recurse and hasattr(relation_proxy, "_orm"):
+                elif (
+                    recurse
+                    and isinstance(relation_proxy, NewBaseModel)
+                    and relation_proxy._has_relations_manager()
+                ):
                     _update_cache(
-                        relation_proxy._orm._relations.values(),  # type: ignore
+                        list(relation_proxy._orm._relations.values()),
                         recurse=False,
                     )
 
-        _update_cache(list(self._orm._relations.values()))
+        if self._has_relations_manager():
+            _update_cache(list(self._orm._relations.values()))
 
     def _internal_set(self, name: str, value: Any) -> None:
         """
@@ -287,6 +335,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         property_fields = self.ormar_config.property_fields
         model_fields = self.ormar_config.model_fields
         pydantic_fields = set(self.model_fields.keys())
+        raw_pk_names = self._extract_raw_pk_names()
 
         # remove property fields
         for prop_filed in property_fields:
@@ -312,7 +361,10 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
                         k,
                         (
                             model_fields[k].expand_relationship(
-                                v, self, to_register=False
+                                v,
+                                self,
+                                to_register=False,
+                                keep_pk=k in raw_pk_names,
                             )
                             if k in model_fields
                             else (v if k in pydantic_fields else model_fields[k])
@@ -359,18 +411,46 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
     def _initialize_internal_attributes(self) -> None:
         """
         Initializes internal attributes during __init__()
+
+        Note that RelationsManager is not created here, it's initialized on first
+        access to _orm attribute (so on first access to relation).
         :rtype: None
         """
         # object.__setattr__(self, "_orm_id", uuid.uuid4().hex)
         object.__setattr__(self, "_orm_saved", False)
+        object.__setattr__(self, "_orm_changed", None)
         object.__setattr__(self, "_pk_column", None)
-        object.__setattr__(
-            self,
-            "_orm",
-            RelationsManager(
-                related_fields=self.extract_related_fields(), owner=cast("Model", self)
-            ),
+        object.__setattr__(self, "_base64_values", None)
+        object.__setattr__(self, "_deferred_loader", None)
+        object.__setattr__(self, "_result_set", None)
+
+    def _initialize_relations_manager(self) -> RelationsManager:
+        """
+        Creates and sets RelationsManager of the instance.
+        Called on first access to _orm attribute.
+
+        :return: relations manager of the instance
+        :rtype: RelationsManager
+        """
+        manager = RelationsManager(
+            related_fields=self.extract_related_fields(), owner=cast("Model", self)
         )
+        object.__setattr__(self, "_orm", manager)
+        return manager
+
+    def _has_relations_manager(self) -> bool:
+        """
+        Checks if RelationsManager was already initialized for this instance,
+        without initializing it. If it was not, no relation can be registered.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        try:
+            object.__getattribute__(self, "_orm")
+        except AttributeError:
+            return False
+        return True
 
     def __eq__(self, other: object) -> bool:
         """
@@ -388,15 +468,13 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         if getattr(self, "__cached_hash__", None) is not None:
             return self.__cached_hash__ or 0
 
-        if self.pk is not None:
-            ret = hash(str(self.pk) + self.__class__.__name__)
+        pk = self.pk
+        if pk is not None:
+            ret = hash((self.__class__.__name__, pk))
         else:
-            vals = {
-                k: v
-                for k, v in self.__dict__.items()
-                if k not in self.extract_related_names()
-            }
-            ret = hash(str(vals) + self.__class__.__name__)
+            related_names = self.extract_related_names()
+            vals = {k: v for k, v in self.__dict__.items() if k not in related_names}
+            ret = hash((self.__class__.__name__, str(vals)))
 
         object.__setattr__(self, "__cached_hash__", ret)
         return ret
@@ -457,6 +535,25 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         """Saved status of the model. Changed by setattr and loading from db"""
         return self._orm_saved
 
+    @property
+    def changed_fields(self) -> Set[str]:
+        """
+        Names of fields stored in model table that were set since the model was
+        last saved/loaded from the database.
+
+        If the model was never synchronized with the database all fields are
+        treated as changed.
+
+        Note that only assignments are tracked, so in place modifications
+        (i.e. of dicts in JSON fields) require setting the field again.
+
+        :return: set of changed fields names
+        :rtype: Set[str]
+        """
+        if self._orm_changed is None:
+            return self.extract_db_own_fields().union(self._extract_db_related_names())
+        return set(self._orm_changed)
+
     @property
     def signals(self) -> "SignalEmitter":
         """Exposes signals from model OrmarConfig"""
@@ -478,8 +575,50 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         self._orm.remove_parent(self, parent, name)
 
     def set_save_status(self, status: bool) -> None:
-        """Sets value of the save status"""
+        """
+        Sets value of the save status.
+        Saved model is in sync with database, so changed fields are cleared.
+        """
         object.__setattr__(self, "_orm_saved", status)
+        if status:
+            object.__setattr__(self, "_orm_changed", set())
+
+    def _mark_as_changed(self, name: str) -> None:
+        """
+        Marks the field as changed and the model as not saved.
+        Called by descriptors when field value is set.
+
+        :param name: name of the changed field
+        :type name: str
+        """
+        object.__setattr__(self, "_orm_saved", False)
+        changed = self._orm_changed
+        if changed is not None:
+            changed.add(name)
+
+    def _encode_base64(self, name: str, value: bytes) -> str:
+        """
+        Returns base64 representation of the value of LargeBinary field with
+        represent_as_base64_str flag. Representation is cached on first use
+        and reused as long as the field holds the same value (same object).
+
+        :param name: name of the field
+        :type name: str
+        :param value: current value of the field
+        :type value: bytes
+        :return: base64 encoded value
+        :rtype: str
+        """
+        cache = self._base64_values
+        cached = cache.get(name) if cache is not None else None
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        encoded = base64.b64encode(value).decode()
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_base64_values", cache)
+        cache[name] = (value, encoded)
+        return encoded
 
     @classmethod
     def update_forward_refs(cls, **localns: Any) -> None:
@@ -517,7 +656,10 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
                 update_column_definition(model=cls, field=field)
         populate_config_sqlalchemy_table_if_required(config=cls.ormar_config)
         # super().update_forward_refs(**localns)
-        cls.model_rebuild(force=True)
+        rebuild_model(model=cls)
+        cls._raw_pk_names = None
+        cls._dump_plans = {}
+        cls._field_accessors = {}
         cls.ormar_config.requires_ref_update = False
 
     @staticmethod
@@ -549,101 +691,6 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             ]
         return fields
 
-    @staticmethod
-    def _extract_nested_models_from_list(
-        relation_map: Dict,
-        models: MutableSequence,
-        include: Union[Set, Dict, None],
-        exclude: Union[Set, Dict, None],
-        exclude_primary_keys: bool,
-        exclude_through_models: bool,
-    ) -> List:
-        """
-        Converts list of models into list of dictionaries.
-
-        :param models: List of models
-        :type models: List
-        :param include: fields to include
-        :type include: Union[Set, Dict, None]
-        :param exclude: fields to exclude
-        :type exclude: Union[Set, Dict, None]
-        :return: list of models converted to dictionaries
-        :rtype: List[Dict]
-        """
-        result = []
-        for model in models:
-            try:
-                model_dict = model.model_dump(
-                    relation_map=relation_map,
-                    include=include,
-                    exclude=exclude,
-                    exclude_primary_keys=exclude_primary_keys,
-                    exclude_through_models=exclude_through_models,
-                )
-                if not exclude_through_models:
-                    model.populate_through_models(
-                        model=model,
-                        model_dict=model_dict,
-                        include=include,
-                        exclude=exclude,
-                        relation_map=relation_map,
-                    )
-                result.append(model_dict)
-            except ReferenceError:  # pragma no cover
-                continue
-        return result
-
-    @staticmethod
-    def populate_through_models(
-        model: "Model",
-        model_dict: Dict,
-        include: Union[Set, Dict],
-        exclude: Union[Set, Dict],
-        relation_map: Dict,
-    ) -> None:
-        """
-        Populates through models with values from dict representation.
-
-        :param model: model to populate through models
-        :type model: Model
-        :param model_dict: dict representation of the model
-        :type model_dict: Dict
-        :param include: fields to include
-        :type include: Dict
-        :param exclude: fields to exclude
-        :type exclude: Dict
-        :param relation_map: map of relations to follow to avoid circular refs
-        :type relation_map: Dict
-        :return: None
-        :rtype: None
-        """
-
-        include_dict = (
-            translate_list_to_dict(include)
-            if (include and isinstance(include, Set))
-            else include
-        )
-        exclude_dict = (
-            translate_list_to_dict(exclude)
-            if (exclude and isinstance(exclude, Set))
-            else exclude
-        )
-        models_to_populate = model._get_not_excluded_fields(
-            fields=model.extract_through_names(),
-            include=cast(Optional[Dict], include_dict),
-            exclude=cast(Optional[Dict], exclude_dict),
-        )
-        through_fields_to_populate = [
-            model.ormar_config.model_fields[through_model]
-            for through_model in models_to_populate
-            if model.ormar_config.model_fields[through_model].related_name
-            not in relation_map
-        ]
-        for through_field in through_fields_to_populate:
-            through_instance = getattr(model, through_field.name)
-            if through_instance:
-                model_dict[through_field.name] = through_instance.model_dump()
-
     @classmethod
     def _skip_ellipsis(
         cls, items: Union[Set, Dict, None], key: str, default_return: Any = None
@@ -676,86 +723,316 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             return items.get("__all__")
         return items
 
-    def _extract_nested_models(  # noqa: CCR001, CFQ002
-        self,
-        relation_map: Dict,
-        dict_instance: Dict,
-        include: Optional[Dict],
-        exclude: Optional[Dict],
+    @classmethod
+    def _get_dump_plan(
+        cls,
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        relation_map: Optional[Dict],
         exclude_primary_keys: bool,
         exclude_through_models: bool,
         exclude_list: bool,
-    ) -> Dict:
+        key: Optional[Hashable] = None,
+    ) -> DumpPlan:
         """
-        Traverse nested models and converts them into dictionaries.
-        Calls itself recursively if needed.
+        Returns the plan of model_dump() for given parameters.
+        Plans are cached on a class in _dump_plans, nested models pass the key
+        precalculated in plans of relations, so only the values are read
+        for each instance.
 
-        :param nested: flag if current instance is nested
-        :type nested: bool
-        :param dict_instance: current instance dict
-        :type dict_instance: Dict
         :param include: fields to include
-        :type include: Optional[Dict]
+        :type include: Union[Set, Dict, None]
         :param exclude: fields to exclude
-        :type exclude: Optional[Dict]
-        :param exclude: whether to exclude lists
-        :type exclude: bool
-        :return: current model dict with child models converted to dictionaries
+        :type exclude: Union[Set, Dict, None]
+        :param relation_map: map of the relations to follow to avoid circular deps
+        :type relation_map: Optional[Dict]
+        :param exclude_primary_keys: flag to exclude primary keys from dict
+        :type exclude_primary_keys: bool
+        :param exclude_through_models: flag to exclude through models from dict
+        :type exclude_through_models: bool
+        :param exclude_list: flag to exclude lists of nested values models from dict
+        :type exclude_list: bool
+        :param key: precalculated key of the parameters
+        :type key: Optional[Hashable]
+        :return: plan of dumping the model
+        :rtype: DumpPlan
+        """
+        if key is None:
+            key = get_plan_key(
+                include=include,
+                exclude=exclude,
+                relation_map=relation_map,
+                flags=(exclude_primary_keys, exclude_through_models, exclude_list),
+            )
+        plan = cls._dump_plans.get(key) if key is not None else None
+        if plan is None:
+            plan = cls._build_dump_plan(
+                include=include,
+                exclude=exclude,
+                relation_map=relation_map,
+                exclude_primary_keys=exclude_primary_keys,
+                exclude_through_models=exclude_through_models,
+                exclude_list=exclude_list,
+            )
+            if key is not None:
+                if len(cls._dump_plans) >= MAX_DUMP_PLANS:
+                    cls._dump_plans.clear()
+                cls._dump_plans[key] = plan
+        return plan
+
+    @classmethod
+    def _build_dump_plan(  # noqa: CFQ002
+        cls,
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        relation_map: Optional[Dict],
+        exclude_primary_keys: bool,
+        exclude_through_models: bool,
+        exclude_list: bool,
+    ) -> DumpPlan:
+        """
+        Calculates which fields are passed to pydantic, which relations should be
+        followed (with include/exclude and relation_map of nested models) and which
+        through models are populated when the model is nested.
+
+        :param include: fields to include
+        :type include: Union[Set, Dict, None]
+        :param exclude: fields to exclude
+        :type exclude: Union[Set, Dict, None]
+        :param relation_map: map of the relations to follow to avoid circular deps
+        :type relation_map: Optional[Dict]
+        :param exclude_primary_keys: flag to exclude primary keys from dict
+        :type exclude_primary_keys: bool
+        :param exclude_through_models: flag to exclude through models from dict
+        :type exclude_through_models: bool
+        :param exclude_list: flag to exclude lists of nested values models from dict
+        :type exclude_list: bool
+        :return: plan of dumping the model
+        :rtype: DumpPlan
+        """
+        include = copy.deepcopy(include)
+        exclude = copy.deepcopy(exclude)
+        pydantic_exclude = cls._update_excluded_with_related(exclude)
+        pydantic_exclude = cls._update_excluded_with_pks_and_through(
+            exclude=pydantic_exclude,
+            exclude_primary_keys=exclude_primary_keys,
+            exclude_through_models=exclude_through_models,
+        )
+        include_dict = (
+            translate_list_to_dict(include) if isinstance(include, Set) else include
+        )
+        exclude_dict = (
+            translate_list_to_dict(exclude) if isinstance(exclude, Set) else exclude
+        )
+        relation_map = (
+            relation_map
+            if relation_map is not None
+            else translate_list_to_dict(cls._iterate_related_models())
+        )
+
+        relations = []
+        if relation_map:
+            fields = cls._get_not_excluded_fields(
+                fields=cls.extract_related_names(),
+                include=include_dict,
+                exclude=exclude_dict,
+            )
+            for name in fields:
+                if name not in relation_map:
+                    continue
+                relation_field = cls.ormar_config.model_fields[name]
+                nested_include = cls._convert_all(
+                    cls._skip_ellipsis(include_dict, name)
+                )
+                nested_exclude = cls._convert_all(
+                    cls._skip_ellipsis(exclude_dict, name)
+                )
+                pk_name = relation_field.to.ormar_config.pkname
+                relations.append(
+                    RelationDumpPlan(
+                        name=name,
+                        relation_field=cast(ForeignKeyField, relation_field),
+                        include=nested_include,
+                        exclude=nested_exclude,
+                        relation_map=cast(
+                            Dict,
+                            cls._skip_ellipsis(relation_map, name, default_return={}),
+                        ),
+                        pk_name=(
+                            pk_name
+                            if cls._is_pk_dumped(
+                                pk_name=pk_name,
+                                include=nested_include,
+                                exclude=nested_exclude,
+                                exclude_primary_keys=exclude_primary_keys,
+                            )
+                            else None
+                        ),
+                        is_list=relation_field.virtual or relation_field.is_multi,
+                        exclude_primary_keys=exclude_primary_keys,
+                        exclude_through_models=exclude_through_models,
+                    )
+                )
+
+        through_fields = [
+            name
+            for name in cls._get_not_excluded_fields(
+                fields=cls.extract_through_names(),
+                include=cast(Optional[Dict], include_dict),
+                exclude=cast(Optional[Dict], exclude_dict),
+            )
+            if cls.ormar_config.model_fields[name].related_name not in relation_map
+        ]
+        bytes_fields = [
+            name
+            for name in cls._bytes_fields
+            if cls.ormar_config.model_fields[name].represent_as_base64_str
+        ]
+        return DumpPlan(
+            include=include,
+            exclude=pydantic_exclude,
+            bytes_fields=bytes_fields,
+            relations=relations,
+            through_fields=through_fields,
+            exclude_primary_keys=exclude_primary_keys,
+            exclude_through_models=exclude_through_models,
+            exclude_list=exclude_list,
+        )
+
+    @staticmethod
+    def _is_pk_dumped(
+        pk_name: str,
+        include: Union[Set, Dict, None],
+        exclude: Union[Set, Dict, None],
+        exclude_primary_keys: bool,
+    ) -> bool:
+        """
+        Checks if the pk of related model is dumped with given include/exclude.
+        Used to dump raw pk values of not yet accessed relations into the same shape
+        as the pk only related model would be dumped.
+
+        :param pk_name: name of the pk field of related model
+        :type pk_name: str
+        :param include: fields to include in related model
+        :type include: Union[Set, Dict, None]
+        :param exclude: fields to exclude in related model
+        :type exclude: Union[Set, Dict, None]
+        :param exclude_primary_keys: flag to exclude primary keys from dict
+        :type exclude_primary_keys: bool
+        :return: result of the check
+        :rtype: bool
+        """
+        if exclude_primary_keys or (include is not None and pk_name not in include):
+            return False
+        if exclude and pk_name in exclude:
+            return not (
+                isinstance(exclude, set) or exclude[pk_name] in (Ellipsis, True)
+            )
+        return True
+
+    def _dump_with_plan(
+        self,
+        plan: DumpPlan,
+        mode: Union[Literal["json", "python"], str] = "python",
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+    ) -> "DictStrAny":
+        """
+        Dumps the model into a dictionary following given plan.
+
+        :param plan: plan of dumping the model
+        :type plan: DumpPlan
+        :return: dictionary representation of the model
         :rtype: Dict
         """
-        fields = self._get_not_excluded_fields(
-            fields=self.extract_related_names(), include=include, exclude=exclude
+        dict_instance = super().model_dump(
+            mode=mode,
+            include=plan.include,
+            exclude=plan.exclude,
+            by_alias=by_alias,
+            exclude_defaults=exclude_defaults,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=False,
         )
+        for name in plan.bytes_fields:
+            value = dict_instance.get(name)
+            if value is not None and not isinstance(value, str):
+                dict_instance[name] = self._encode_base64(name=name, value=value)
+
+        if plan.relations and not getattr(self, "__pk_only__", False):
+            self._dump_relations(plan=plan, dict_instance=dict_instance)
+        return dict_instance
 
-        for field in fields:
-            if not relation_map or field not in relation_map:
+    def _dump_relations(self, plan: DumpPlan, dict_instance: Dict) -> None:
+        """
+        Traverse nested models and converts them into dictionaries
+        following the relations plans.
+
+        Raw fk values are dumped without constructing the related models and
+        relations that were never registered are populated as empty ones.
+
+        :param plan: plan of dumping the model
+        :type plan: DumpPlan
+        :param dict_instance: current instance dict
+        :type dict_instance: Dict
+        """
+        relations_registered = self._has_relations_manager()
+        for relation in plan.relations:
+            name = relation.name
+            raw_value = self.__dict__.get(name)
+            if relation.relation_field.is_raw_pk_value(raw_value):
+                dict_instance[name] = (
+                    {relation.pk_name: raw_value} if relation.pk_name else {}
+                )
+                continue
+            if not relations_registered:
+                # no relation was ever registered, so there is nothing to follow
+                if not relation.is_list:
+                    dict_instance[name] = None
+                elif not plan.exclude_list:
+                    dict_instance[name] = []
                 continue
             try:
-                nested_model = getattr(self, field)
+                nested_model = getattr(self, name)
                 if isinstance(nested_model, MutableSequence):
-                    if exclude_list:
+                    if plan.exclude_list:
                         continue
-
-                    dict_instance[field] = self._extract_nested_models_from_list(
-                        relation_map=self._skip_ellipsis(  # type: ignore
-                            relation_map, field, default_return=dict()
-                        ),
-                        models=nested_model,
-                        include=self._convert_all(self._skip_ellipsis(include, field)),
-                        exclude=self._convert_all(self._skip_ellipsis(exclude, field)),
-                        exclude_primary_keys=exclude_primary_keys,
-                        exclude_through_models=exclude_through_models,
-                    )
+                    result = []
+                    for model in nested_model:
+                        try:
+                            result.append(model._dump_nested(relation=relation))
+                        except ReferenceError:  # pragma no cover
+                            continue
+                    dict_instance[name] = result
                 elif nested_model is not None:
-                    model_dict = nested_model.model_dump(
-                        relation_map=self._skip_ellipsis(
-                            relation_map, field, default_return=dict()
-                        ),
-                        include=self._convert_all(self._skip_ellipsis(include, field)),
-                        exclude=self._convert_all(self._skip_ellipsis(exclude, field)),
-                        exclude_primary_keys=exclude_primary_keys,
-                        exclude_through_models=exclude_through_models,
-                    )
-                    if not exclude_through_models:
-                        nested_model.populate_through_models(
-                            model=nested_model,
-                            model_dict=model_dict,
-                            include=self._convert_all(
-                                self._skip_ellipsis(include, field)
-                            ),
-                            exclude=self._convert_all(
-                                self._skip_ellipsis(exclude, field)
-                            ),
-                            relation_map=self._skip_ellipsis(
-                                relation_map, field, default_return=dict()
-                            ),
-                        )
-                    dict_instance[field] = model_dict
+                    dict_instance[name] = nested_model._dump_nested(relation=relation)
                 else:
-                    dict_instance[field] = None
+                    dict_instance[name] = None
             except ReferenceError:  # pragma: no cover
-                dict_instance[field] = None
-        return dict_instance
+                dict_instance[name] = None
+
+    def _dump_nested(self, relation: RelationDumpPlan) -> Dict:
+        """
+        Dumps the model nested in a relation, populating also through models.
+
+        :param relation: plan of the relation leading to the model
+        :type relation: RelationDumpPlan
+        :return: dictionary representation of the model
+        :rtype: Dict
+        """
+        plan = relation.get_plan(cast(Type["Model"], self.__class__))
+        model_dict = self._dump_with_plan(plan=plan)
+        if not plan.exclude_through_models:
+            for through_name in plan.through_fields:
+                through_instance = getattr(self, through_name)
+                if through_instance:
+                    model_dict[through_name] = through_instance.model_dump()
+        return model_dict
 
     @typing_extensions.deprecated(
         "The `dict` method is deprecated; use `model_dump` instead.",
@@ -849,54 +1126,23 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         :return:
         :rtype:
         """
-        pydantic_exclude = self._update_excluded_with_related(exclude)
-        pydantic_exclude = self._update_excluded_with_pks_and_through(
-            exclude=pydantic_exclude,
+        plan = self._get_dump_plan(
+            include=include,
+            exclude=exclude,
+            relation_map=relation_map,
             exclude_primary_keys=exclude_primary_keys,
             exclude_through_models=exclude_through_models,
+            exclude_list=exclude_list,
         )
-        dict_instance = super().model_dump(
+        return self._dump_with_plan(
+            plan=plan,
             mode=mode,
-            include=include,
-            exclude=pydantic_exclude,
             by_alias=by_alias,
-            exclude_defaults=exclude_defaults,
             exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
             round_trip=round_trip,
-            warnings=False,
-        )
-
-        dict_instance = {
-            k: self._convert_bytes_to_str(column_name=k, value=v)
-            for k, v in dict_instance.items()
-        }
-
-        include_dict = (
-            translate_list_to_dict(include) if isinstance(include, Set) else include
         )
-        exclude_dict = (
-            translate_list_to_dict(exclude) if isinstance(exclude, Set) else exclude
-        )
-
-        relation_map = (
-            relation_map
-            if relation_map is not None
-            else translate_list_to_dict(self._iterate_related_models())
-        )
-        pk_only = getattr(self, "__pk_only__", False)
-        if relation_map and not pk_only:
-            dict_instance = self._extract_nested_models(
-                relation_map=relation_map,
-                dict_instance=dict_instance,
-                include=include_dict,
-                exclude=exclude_dict,
-                exclude_primary_keys=exclude_primary_keys,
-                exclude_through_models=exclude_through_models,
-                exclude_list=exclude_list,
-            )
-
-        return dict_instance
 
     @typing_extensions.deprecated(
         "The `json` method is deprecated; use `model_dump_json` instead.",
@@ -1090,31 +1336,10 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             )
         return value
 
-    def _convert_bytes_to_str(self, column_name: str, value: Any) -> Union[str, Dict]:
-        """
-        Converts value to str from bytes for represent_as_base64_str columns.
-
-        :param column_name: name of the field
-        :type column_name: str
-        :param value: value fo the field
-        :type value: Any
-        :return: converted value if needed, else original value
-        :rtype: Any
-        """
-        if column_name not in self._bytes_fields:
-            return value
-        field = self.ormar_config.model_fields[column_name]
-        if (
-            value is not None
-            and not isinstance(value, str)
-            and field.represent_as_base64_str
-        ):
-            return base64.b64encode(value).decode()
-        return value
-
     def _convert_json(self, column_name: str, value: Any) -> Union[str, Dict, None]:
         """
-        Converts value to/from json if needed (for Json columns).
+        Converts value to json string if needed (for Json columns with pydantic
+        type overwritten to pydantic.Json), other Json columns keep decoded values.
 
         :param column_name: name of the field
         :type column_name: str
@@ -1123,7 +1348,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         :return: converted value if needed, else original value
         :rtype: Any
         """
-        if column_name not in self._json_fields:
+        if column_name not in self._json_string_fields:
             return value
         return encode_json(value)
 
@@ -1158,8 +1383,12 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         for field in self._extract_db_related_names():
             relation_field = self.ormar_config.model_fields[field]
             target_pk_name = relation_field.to.ormar_config.pkname
-            target_field = getattr(self, field)
-            self_fields[field] = getattr(target_field, target_pk_name, None)
+            raw_value = self.__dict__.get(field)
+            if relation_field.is_raw_pk_value(raw_value):
+                self_fields[field] = raw_value
+            else:
+                target_field = getattr(self, field)
+                self_fields[field] = getattr(target_field, target_pk_name, None)
             if not relation_field.nullable and not self_fields[field]:
                 raise ModelPersistenceError(
                     f"You cannot save {relation_field.to.get_name()} "
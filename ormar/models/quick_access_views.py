@@ -24,8 +24,10 @@ quick_access_set = {
     "_convert_json",
     "_extract_db_related_names",
     "_extract_model_db_fields",
-    "_extract_nested_models",
-    "_extract_nested_models_from_list",
+    "_dump_nested",
+    "_dump_relations",
+    "_dump_with_plan",
+    "_dump_plans",
     "_extract_own_model_fields",
     "_extract_related_model_instead_of_field",
     "_get_not_excluded_fields",
@@ -37,6 +39,13 @@ quick_access_set = {
     "_orm",
     "_orm_id",
     "_orm_saved",
+    "_orm_changed",
+    "_base64_values",
+    "_encode_base64",
+    "_deferred_loader",
+    "_set_deferred_values",
+    "_result_set",
+    "_mark_as_changed",
     "_related_names",
     "_skip_ellipsis",
     "_update_and_follow",
@@ -49,6 +58,7 @@ quick_access_set = {
     "extract_related_fields",
     "extract_through_names",
     "update_from_dict",
+    "changed_fields",
     "get_child",
     "get_column_alias",
     "get_column_name_from_alias",
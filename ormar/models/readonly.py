@@ -0,0 +1,194 @@
+import base64
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ormar.models.json_dump import dumps
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+
+class ReadOnlyRecord:
+    """
+    Base class of compact, immutable records returned by QuerySet.readonly().
+
+    Records keep only the values of selected fields in __slots__, without pydantic
+    internals, relations manager and hashing of ormar models.
+    Subclasses are generated once per model and set of selected fields.
+    """
+
+    __slots__ = ()
+
+    _model_cls: ClassVar[Type["Model"]]
+    _fields: ClassVar[Tuple[str, ...]]
+    _relations: ClassVar[FrozenSet[str]]
+    _raw_pks: ClassVar[Dict[str, str]]
+    _base64_fields: ClassVar[Tuple[str, ...]]
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, value)
+        # same as in ormar models values of LargeBinary fields with
+        # represent_as_base64_str flag are base64 encoded strings
+        for name in self._base64_fields:
+            value = getattr(self, name)
+            if isinstance(value, bytes):
+                object.__setattr__(self, name, base64.b64encode(value).decode())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({values})"
+
+    def model_dump(
+        self,
+        *,
+        include: Union[Set, Dict, None] = None,
+        exclude: Union[Set, Dict, None] = None,
+        exclude_none: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Returns dictionary with values of the record in the same shape
+        as model_dump() of ormar model.
+
+        Not loaded foreign keys are dumped as dictionary with the pk of related model.
+
+        :param include: fields to include
+        :type include: Union[Set, Dict, None]
+        :param exclude: fields to exclude
+        :type exclude: Union[Set, Dict, None]
+        :param exclude_none: flag to exclude None values
+        :type exclude_none: bool
+        :return: dictionary of the values
+        :rtype: Dict[str, Any]
+        """
+        result: Dict[str, Any] = dict()
+        for name in self._fields:
+            if include is not None and name not in include:
+                continue
+            nested_exclude = exclude.get(name) if isinstance(exclude, dict) else None
+            if (
+                exclude is not None
+                and name in exclude
+                and nested_exclude in (None, ...)
+            ):
+                continue
+            value = getattr(self, name)
+            if name in self._relations and value is not None:
+                nested_include = (
+                    include.get(name) if isinstance(include, dict) else None
+                )
+                kwargs: Dict[str, Any] = dict(
+                    include=None if nested_include is ... else nested_include,
+                    exclude=nested_exclude,
+                    exclude_none=exclude_none,
+                )
+                value = (
+                    [item.model_dump(**kwargs) for item in value]
+                    if isinstance(value, list)
+                    else value.model_dump(**kwargs)
+                )
+            elif name in self._raw_pks and value is not None:
+                value = {self._raw_pks[name]: value}
+            if exclude_none and value is None:
+                continue
+            result[name] = value
+        return result
+
+    def model_dump_json(
+        self,
+        *,
+        include: Union[Set, Dict, None] = None,
+        exclude: Union[Set, Dict, None] = None,
+        exclude_none: bool = False,
+    ) -> str:
+        """
+        Returns json representation of the record, same as model_dump_json()
+        of ormar model.
+
+        :param include: fields to include
+        :type include: Union[Set, Dict, None]
+        :param exclude: fields to exclude
+        :type exclude: Union[Set, Dict, None]
+        :param exclude_none: flag to exclude None values
+        :type exclude_none: bool
+        :return: json string
+        :rtype: str
+        """
+        data = self.model_dump(
+            include=include, exclude=exclude, exclude_none=exclude_none
+        )
+        return dumps(data, self._model_cls).decode()
+
+
+def get_record_class(
+    model_cls: Type["Model"], fields: Tuple[str, ...], relations: FrozenSet[str]
+) -> Type[ReadOnlyRecord]:
+    """
+    Returns record class for given model and set of fields.
+    Classes are created once and cached on the model class.
+
+    :param model_cls: ormar model class
+    :type model_cls: Type[Model]
+    :param fields: names of selected fields in order
+    :type fields: Tuple[str, ...]
+    :param relations: names of fields holding nested records
+    :type relations: FrozenSet[str]
+    :return: record class
+    :rtype: Type[ReadOnlyRecord]
+    """
+    key = (fields, relations)
+    record_cls = model_cls._readonly_records.get(key)
+    if record_cls is None:
+        model_fields = model_cls.ormar_config.model_fields
+        raw_pks = {
+            name: model_fields[name].to.ormar_config.pkname
+            for name in fields
+            if name not in relations
+            and name in model_fields
+            and model_fields[name].is_relation
+            and not model_fields[name].virtual
+            and not model_fields[name].is_multi
+        }
+        base64_fields = tuple(
+            name
+            for name in fields
+            if name in model_cls._bytes_fields
+            and model_fields[name].represent_as_base64_str
+        )
+        record_cls = type(
+            f"{model_cls.__name__}Record",
+            (ReadOnlyRecord,),
+            {
+                "__slots__": fields,
+                "__module__": model_cls.__module__,
+                "_model_cls": model_cls,
+                "_fields": fields,
+                "_relations": relations,
+                "_raw_pks": raw_pks,
+                "_base64_fields": base64_fields,
+            },
+        )
+        model_cls._readonly_records[key] = record_cls
+    return record_cls
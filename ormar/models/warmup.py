@@ -0,0 +1,173 @@
+"""
+Helpers used after the models are defined and at the application startup, that
+prepare the models in batches and precompute the lazily built per class structures,
+so the first requests do not pay the price of building them.
+"""
+
+import gc
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import pydantic
+
+from ormar.exceptions import ModelDefinitionError
+from ormar.models.helpers.pydantic import batched_model_rebuilds
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+PydanticVariant = Union[Type["Model"], Tuple[Type["Model"], Dict[str, Any]]]
+SelectRelatedShapes = Dict[Type["Model"], List[Union[str, List[str]]]]
+
+
+def warm_pydantic_cache(
+    variants: Iterable[PydanticVariant],
+) -> List[Type[pydantic.BaseModel]]:
+    """
+    Generates pydantic models for given variants and stores them in the
+    get_pydantic() cache, so later calls with the same include/exclude
+    return already generated models.
+
+    Each variant is either an ormar model class (for get_pydantic() without
+    parameters) or a tuple of ormar model class and dictionary of keyword
+    arguments passed to get_pydantic() (include and/or exclude).
+
+    :param variants: model classes or tuples of model class and get_pydantic kwargs
+    :type variants: Iterable[Union[Type[Model], Tuple[Type[Model], Dict[str, Any]]]]
+    :return: list of generated pydantic models in order of variants
+    :rtype: List[Type[pydantic.BaseModel]]
+    """
+    models = []
+    for variant in variants:
+        model_cls, kwargs = variant if isinstance(variant, tuple) else (variant, {})
+        models.append(model_cls.get_pydantic(**kwargs))
+    return models
+
+
+def update_forward_refs(models: Iterable[Type["Model"]], **localns: Any) -> None:
+    """
+    Updates ForwardRefs of many models at once.
+
+    Works the same as calling update_forward_refs() on each of the models,
+    but pydantic schema of each changed model is rebuilt only once at the end,
+    instead of after each registered relation.
+
+    :param models: models with ForwardRefs to update
+    :type models: Iterable[Type[Model]]
+    :param localns: local namespace
+    :type localns: Any
+    """
+    with batched_model_rebuilds():
+        for model_cls in models:
+            model_cls.update_forward_refs(**localns)
+
+
+def prepare_models(
+    models: Optional[Iterable[Type["Model"]]] = None,
+    select_related_shapes: Optional[SelectRelatedShapes] = None,
+    freeze: bool = False,
+) -> None:
+    """
+    Eagerly computes per class caches of models that are otherwise filled lazily
+    on first use (related and through names and fields, raw pk names,
+    relation maps, aliases and default model_dump() plan).
+
+    For each of select_related_shapes (model class: list of select_related
+    arguments) the select query with joins is built once, so the per class
+    structures used by such queries (relation aliases, join columns) are prepared
+    too. Queries themselves are not cached, sql is still compiled on each execution.
+
+    If models are not provided all concrete models with resolved ForwardRefs
+    are prepared.
+
+    Freezing is opt-in: only with freeze flag set gc.freeze() is called at the end,
+    so objects prepared before forking the workers are not touched by garbage
+    collector and stay shared between processes (copy-on-write). Note that it
+    freezes all objects tracked at that moment (not only the prepared ones) and
+    frozen objects are never collected, so call it once, right before forking.
+
+    :raises ModelDefinitionError: if passed model has unresolved ForwardRefs
+    :param models: models to prepare, all defined models if not provided
+    :type models: Optional[Iterable[Type[Model]]]
+    :param select_related_shapes: select_related arguments of hot queries per model
+    :type select_related_shapes: Optional[Dict[Type[Model], List[Union[str, List]]]]
+    :param freeze: flag if gc.freeze() should be called after preparation
+    :type freeze: bool
+    """
+    if models is None:
+        models = [
+            model_cls
+            for model_cls in _get_all_models()
+            if not model_cls.ormar_config.requires_ref_update
+        ]
+    for model_cls in models:
+        _prepare_model(model_cls=model_cls)
+    for model_cls, shapes in (select_related_shapes or {}).items():
+        _prepare_model(model_cls=model_cls)
+        for related in shapes:
+            model_cls.objects.select_related(related).build_select_expression()
+    if freeze:
+        gc.freeze()
+
+
+def _get_all_models() -> List[Type["Model"]]:
+    """
+    Returns all defined, not abstract ormar models.
+
+    :return: list of model classes
+    :rtype: List[Type[Model]]
+    """
+    from ormar import Model
+
+    models: List[Type["Model"]] = []
+    to_check = Model.__subclasses__()
+    while to_check:
+        model_cls = to_check.pop()
+        to_check.extend(model_cls.__subclasses__())
+        if (
+            hasattr(model_cls, "ormar_config")
+            and not model_cls.ormar_config.abstract
+            and model_cls not in models
+        ):
+            models.append(model_cls)
+    return models
+
+
+def _prepare_model(model_cls: Type["Model"]) -> None:
+    """
+    Fills lazily calculated caches of given model class.
+
+    :raises ModelDefinitionError: if model has unresolved ForwardRefs
+    :param model_cls: model to prepare
+    :type model_cls: Type[Model]
+    """
+    if model_cls.ormar_config.requires_ref_update:
+        raise ModelDefinitionError(
+            f"Model {model_cls.get_name()} has not updated "
+            f"ForwardRefs. Call update_forward_refs() before preparing models."
+        )
+    model_cls.extract_related_names()
+    model_cls.extract_through_names()
+    model_cls.extract_related_fields()
+    model_cls._extract_raw_pk_names()
+    model_cls._iterate_related_models()
+    # alias manager is shared by models of the same config and builds its
+    # reversed aliases (used to parse rows of joined queries) on first access
+    _ = model_cls.ormar_config.alias_manager.reversed_aliases
+    model_cls._get_dump_plan(
+        include=None,
+        exclude=None,
+        relation_map=None,
+        exclude_primary_keys=False,
+        exclude_through_models=False,
+        exclude_list=False,
+    )
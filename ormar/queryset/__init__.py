@@ -7,6 +7,8 @@ from ormar.queryset.clause import and_, or_
 from ormar.queryset.field_accessor import FieldAccessor
 from ormar.queryset.queries import FilterQuery, LimitQuery, OffsetQuery, OrderQuery
 from ormar.queryset.queryset import QuerySet
+from ormar.queryset.related_loader import load_related
+from ormar.queryset.write_buffer import WriteBuffer
 
 __all__ = [
     "QuerySet",
@@ -20,4 +22,6 @@ __all__ = [
     "and_",
     "or_",
     "FieldAccessor",
+    "load_related",
+    "WriteBuffer",
 ]
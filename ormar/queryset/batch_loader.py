@@ -0,0 +1,130 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
+
+from ormar.exceptions import NoMatch
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+    from ormar.queryset import QuerySet
+
+T = TypeVar("T", bound="Model")
+
+
+class BatchLoader(Generic[T]):
+    """
+    Coalesces lookups of models by primary key into batched queries.
+
+    Primary keys requested with `load()` during one iteration of the event loop
+    (or within delay seconds from the first request) are fetched with one
+    `WHERE pk IN (...)` query of the queryset the loader was created from.
+    Each awaiter receives its own model or `NoMatch` exception.
+
+    When max_batch_size primary keys are collected the query is issued
+    immediately, without waiting for the rest of the batch.
+    """
+
+    def __init__(
+        self, queryset: "QuerySet[T]", max_batch_size: int = 500, delay: float = 0.0
+    ) -> None:
+        self.queryset = queryset
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self._pending: Dict[Any, List[asyncio.Future]] = {}
+        self._handle: Optional[Union[asyncio.Handle, asyncio.TimerHandle]] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, pk: Any) -> T:
+        """
+        Returns model with given primary key, fetched in a batch with other
+        primary keys requested at the same time.
+
+        Primary key has to be of the same type as the primary key of the model.
+
+        :raises NoMatch: if model with given pk does not exist (or does not match
+        the filters of the queryset)
+        :param pk: primary key of the model
+        :type pk: Any
+        :return: model with given primary key
+        :rtype: Model
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(pk, []).append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._handle is None:
+            self._handle = (
+                loop.call_later(self.delay, self._dispatch)
+                if self.delay
+                else loop.call_soon(self._dispatch)
+            )
+        return await future
+
+    async def load_many(self, pks: Iterable[Any]) -> List[T]:
+        """
+        Returns models with given primary keys in order of the primary keys.
+
+        :raises NoMatch: if any of the models does not exist
+        :param pks: primary keys of the models
+        :type pks: Iterable[Any]
+        :return: list of models
+        :rtype: List[Model]
+        """
+        return list(await asyncio.gather(*(self.load(pk) for pk in pks)))
+
+    def _dispatch(self) -> None:
+        """
+        Starts the query for collected primary keys and resets the batch.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            task = asyncio.ensure_future(self._fetch(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, pending: Dict[Any, List[asyncio.Future]]) -> None:
+        """
+        Fetches models for collected primary keys and resolves the awaiters.
+
+        :param pending: awaiters per primary key
+        :type pending: Dict[Any, List[asyncio.Future]]
+        """
+        pkname = self.queryset.model.ormar_config.pkname
+        filters: Dict[str, Any] = {f"{pkname}__in": list(pending)}
+        try:
+            models = await self.queryset.filter(**filters).all()
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        models_by_pk: Dict[Any, "Model"] = {model.pk: model for model in models}
+        for pk, futures in pending.items():
+            model = models_by_pk.get(pk)
+            for future in futures:
+                if future.done():
+                    continue
+                if model is None:
+                    future.set_exception(
+                        NoMatch(
+                            f"{self.queryset.model.get_name()} "
+                            f"with pk {pk!r} does not exist"
+                        )
+                    )
+                else:
+                    future.set_result(model)
@@ -0,0 +1,69 @@
+"""
+Checks of the state of `databases` connections.
+
+`databases` has no public api to check if the current connection is inside
+a transaction, so it's read from its private attributes:
+
+* `Database._global_connection` - connection shared by all tasks when the
+  database uses force_rollback,
+* `Connection._transaction_stack` - transactions open on the connection.
+
+Those attributes are used only with versions of `databases` they were verified
+with (the same range as the dependency of ormar). With other versions
+the connection is always treated as being inside a transaction, which is safe
+but slower (queries are not shared and not run on separate connections).
+"""
+
+import re
+from typing import Tuple
+
+import databases
+
+SUPPORTED_DATABASES_VERSIONS = ((0, 7), (0, 8))
+
+
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Parses leading numeric parts of the version string.
+
+    :param version: version string, i.e. "0.7.0"
+    :type version: str
+    :return: numeric parts of the version
+    :rtype: Tuple[int, ...]
+    """
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:2])
+
+
+def supports_connection_internals(database: databases.Database) -> bool:
+    """
+    Checks if the installed version of `databases` is in the supported range
+    and the database has the private attributes used by the checks.
+
+    :param database: database to check
+    :type database: databases.Database
+    :return: flag if private internals can be used
+    :rtype: bool
+    """
+    minimum, maximum = SUPPORTED_DATABASES_VERSIONS
+    version = _parse_version(getattr(databases, "__version__", ""))
+    return minimum <= version < maximum and hasattr(database, "_global_connection")
+
+
+def in_transaction(database: databases.Database) -> bool:
+    """
+    Checks if the connection of the current task is inside a transaction
+    (or the database uses one global connection with force_rollback).
+
+    Returns True if the internals of `databases` are not supported, so callers
+    keep using the current connection.
+
+    :param database: database to check
+    :type database: databases.Database
+    :return: flag if current connection is inside a transaction
+    :rtype: bool
+    """
+    if not supports_connection_internals(database):
+        return True
+    if database._global_connection is not None:
+        return True
+    return bool(getattr(database.connection(), "_transaction_stack", None))
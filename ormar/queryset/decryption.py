@@ -0,0 +1,165 @@
+import asyncio
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import databases
+import sqlalchemy
+
+from ormar.fields.sqlalchemy_compressed import (
+    CompressedType,
+    CompressedValue,
+    deferred_decompression,
+)
+from ormar.fields.sqlalchemy_encrypted import (
+    EncryptedString,
+    EncryptedValue,
+    deferred_decryption,
+)
+
+# row, column name and not yet decrypted (or decompressed) value
+PendingValue = Tuple[Dict[str, Any], str, Union[EncryptedValue, CompressedValue]]
+
+
+@contextmanager
+def deferred_processing() -> Generator[None, None, None]:
+    """
+    Makes encrypted and compressed columns return placeholders instead of
+    decrypting and decompressing the values.
+    """
+    decryption_token = deferred_decryption.set(True)
+    decompression_token = deferred_decompression.set(True)
+    try:
+        yield
+    finally:
+        deferred_decompression.reset(decompression_token)
+        deferred_decryption.reset(decryption_token)
+
+
+class OffloadedDecryption:
+    """
+    Fetches rows without decrypting the encrypted columns (and decompressing
+    the compressed ones) and processes collected values per column in batches
+    in executor (default thread pool of the loop), so decryption of large results
+    does not block the event loop.
+
+    Rows are returned as dictionaries with already decrypted values.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, batch_size: int = 500):
+        self.executor = executor
+        self.batch_size = batch_size
+
+    async def fetch_all(
+        self, database: databases.Database, expr: sqlalchemy.sql.Select
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches all rows of the query and decrypts their values in executor.
+
+        :param database: database to query
+        :type database: databases.Database
+        :param expr: select query
+        :type expr: sqlalchemy.sql.Select
+        :return: rows with decrypted values
+        :rtype: List[Dict[str, Any]]
+        """
+        with deferred_processing():
+            rows = [self._to_dict(row) for row in await database.fetch_all(expr)]
+        await self.decrypt_rows(rows)
+        return rows
+
+    async def iterate(
+        self, database: databases.Database, expr: sqlalchemy.sql.Select
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Iterates rows of the query, values are decrypted in executor for batches
+        of rows. Decryption is deferred only while the next row is fetched,
+        so it does not leak to the code consuming the rows.
+
+        :param database: database to query
+        :type database: databases.Database
+        :param expr: select query
+        :type expr: sqlalchemy.sql.Select
+        :return: asynchronous generator of rows with decrypted values
+        :rtype: AsyncGenerator[Dict[str, Any], None]
+        """
+        iterator = database.iterate(query=expr).__aiter__()
+        rows: List[Dict[str, Any]] = []
+        finished = False
+        while not finished:
+            try:
+                with deferred_processing():
+                    rows.append(self._to_dict(await iterator.__anext__()))
+            except StopAsyncIteration:
+                finished = True
+            if rows and (finished or len(rows) >= self.batch_size):
+                await self.decrypt_rows(rows)
+                for row in rows:
+                    yield row
+                rows = []
+
+    async def decrypt_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Collects not decrypted (and not decompressed) values per column
+        and processes them in batches in executor, processed values are set
+        back in the rows.
+
+        :param rows: rows with EncryptedValue and CompressedValue placeholders
+        :type rows: List[Dict[str, Any]]
+        """
+        pending: Dict[Union[EncryptedString, CompressedType], List[PendingValue]] = {}
+        for row in rows:
+            for key, value in row.items():
+                if (
+                    value.__class__ is EncryptedValue
+                    or value.__class__ is CompressedValue
+                ):
+                    pending.setdefault(value.column_type, []).append((row, key, value))
+        loop = asyncio.get_running_loop()
+        batches: List[List[PendingValue]] = []
+        jobs = []
+        for column_type, values in pending.items():
+            process: Callable[..., List[Any]]
+            if isinstance(column_type, EncryptedString):
+                column_type._refresh()
+                process = cast(Callable[..., List[Any]], column_type.decrypt_values)
+            else:
+                process = cast(Callable[..., List[Any]], column_type.decompress_values)
+            for start in range(0, len(values), self.batch_size):
+                batch = values[start : start + self.batch_size]
+                batches.append(batch)
+                jobs.append(
+                    loop.run_in_executor(
+                        self.executor,
+                        process,
+                        [value.value for _, _, value in batch],
+                        batch[0][2].dialect,
+                    )
+                )
+        for batch, decrypted in zip(batches, await asyncio.gather(*jobs)):
+            for (row, key, _), value in zip(batch, decrypted):
+                row[key] = value
+
+    @staticmethod
+    def _to_dict(row: Any) -> Dict[str, Any]:
+        """
+        Converts database row into dictionary, values are read by keys so
+        backends processing the values lazily process them here.
+
+        :param row: database row
+        :type row: databases.interfaces.Record
+        :return: dictionary with row values
+        :rtype: Dict[str, Any]
+        """
+        return {key: row[key] for key in row.keys()}
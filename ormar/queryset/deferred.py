@@ -0,0 +1,91 @@
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type
+
+from ormar.queryset.utils import fetch_rows_by_pks
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+
+class DeferredLoader:
+    """
+    Loads deferred columns of models returned by one query.
+
+    Models from the same result set share one loader, so when deferred columns
+    of any of them are requested they are fetched for all the models at once,
+    with one `SELECT pk, columns ... WHERE pk IN (...)` query per batch of
+    batch_size primary keys, instead of one query per model.
+
+    Models are referenced weakly, so loader does not keep alive the models that
+    are no longer used (i.e. already consumed in iterate()).
+
+    Loading runs once per loader, in a task awaited by all concurrent callers,
+    and models are detached from the loader only after their values are set.
+    """
+
+    def __init__(
+        self, model_cls: Type["Model"], fields: Sequence[str], batch_size: int = 500
+    ) -> None:
+        self.model_cls = model_cls
+        self.fields = list(fields)
+        self.batch_size = batch_size
+        self.loaded = False
+        self._instances: List[weakref.ReferenceType] = []
+        self._task: Optional[asyncio.Future] = None
+
+    def add(self, instance: "Model") -> None:
+        """
+        Registers the model as the one with not loaded deferred fields.
+
+        :param instance: model returned by the query
+        :type instance: Model
+        """
+        self._instances.append(weakref.ref(instance))
+        object.__setattr__(instance, "_deferred_loader", self)
+
+    async def load(self) -> None:
+        """
+        Fetches deferred columns of all registered models that still exist
+        and sets loaded values on them.
+
+        First call starts the loading and all calls (also the concurrent ones)
+        wait until the values are set. No new models are registered after
+        loading started, so values are loaded only once.
+        If loading fails it's started again on the next call.
+        """
+        self.loaded = True
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._load())
+        await asyncio.shield(self._task)
+
+    async def _load(self) -> None:
+        """
+        Fetches deferred columns of registered models and detaches the models
+        from the loader once the values are set.
+        """
+        instances_by_pk: Dict[Any, List["Model"]] = {}
+        for reference in self._instances:
+            instance = reference()
+            if instance is not None and instance._deferred_loader is self:
+                instances_by_pk.setdefault(instance.pk, []).append(instance)
+
+        pkname = self.model_cls.ormar_config.pkname
+        try:
+            async for values in fetch_rows_by_pks(
+                model_cls=self.model_cls,
+                pks=list(instances_by_pk),
+                fields=self.fields,
+                batch_size=self.batch_size,
+            ):
+                for instance in instances_by_pk.get(values.pop(pkname), []):
+                    instance._set_deferred_values(values)
+        except BaseException:
+            self._task = None
+            raise
+
+        for instances in instances_by_pk.values():
+            for instance in instances:
+                if instance._deferred_loader is self:
+                    object.__setattr__(instance, "_deferred_loader", None)
+        self._instances = []
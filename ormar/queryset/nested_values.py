@@ -0,0 +1,327 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+from ormar.models.readonly import ReadOnlyRecord, get_record_class
+from ormar.queryset.utils import translate_list_to_dict
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import ForeignKeyField, Model
+
+# sources of the values of read only record fields
+VALUE, NONE, EMPTY_LIST = range(3)
+
+# parsed values of a row and index of already parsed children by relation name
+Entry = Tuple[Dict[str, Any], Dict[str, Dict[Hashable, Any]]]
+
+
+class ValuesNode:
+    """
+    Single model in the tree of selected relations with the raw row keys
+    of its columns.
+    """
+
+    __slots__ = (
+        "name",
+        "model_cls",
+        "is_list",
+        "columns",
+        "pk_key",
+        "children",
+        "is_through",
+        "record_cls",
+        "record_fields",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        model_cls: Type["Model"],
+        is_list: bool,
+        is_through: bool = False,
+    ) -> None:
+        self.name = name
+        self.model_cls = model_cls
+        self.is_list = is_list
+        self.is_through = is_through
+        self.columns: List[Tuple[str, str]] = []
+        self.pk_key: Optional[str] = None
+        self.children: List["ValuesNode"] = []
+        self.record_cls: Optional[Type[ReadOnlyRecord]] = None
+        self.record_fields: List[Tuple[str, int]] = []
+
+    def get_key(self, row: Mapping) -> Optional[Hashable]:
+        """
+        Returns value identifying the model in the row, that is a pk or if pk
+        is not selected values of all columns. None means that there is no
+        related model in this row (outer join returned nulls).
+
+        :param row: raw row from the database
+        :type row: Mapping
+        :return: identity of the model in the row
+        :rtype: Optional[Hashable]
+        """
+        if self.pk_key is not None:
+            return row[self.pk_key]
+        values = tuple(row[key] for key, _ in self.columns)
+        if all(value is None for value in values):
+            return None
+        return values
+
+    def prepare_record_class(self, relation_map: Dict) -> None:
+        """
+        Resolves the fields of read only records of this node (and its children)
+        to match the fields dumped by model_dump() of ormar model.
+
+        Not selected own fields are filled with None, not loaded relations
+        with None or empty list, and relations not included in the relation map
+        (back references to the parent) are skipped, same as in ormar models.
+
+        :param relation_map: map of relations included in model_dump()
+        :type relation_map: Dict
+        """
+        selected = {name for _, name in self.columns}
+        children = {child.name for child in self.children}
+        for name, field in self.model_cls.ormar_config.model_fields.items():
+            if name in children or (name in selected and not field.is_relation):
+                self.record_fields.append((name, VALUE))
+            elif not field.is_relation or self.is_through:
+                self.record_fields.append((name, NONE))
+            elif name not in relation_map:
+                continue
+            elif field.is_multi or field.virtual:
+                self.record_fields.append((name, EMPTY_LIST))
+            else:
+                self.record_fields.append((name, VALUE if name in selected else NONE))
+        for child in self.children:
+            if child.name not in self.model_cls.ormar_config.model_fields:
+                self.record_fields.append((child.name, VALUE))
+            child_map = relation_map.get(child.name)
+            child.prepare_record_class(
+                relation_map=child_map if isinstance(child_map, dict) else {}
+            )
+        self.record_cls = get_record_class(
+            model_cls=self.model_cls,
+            fields=tuple(name for name, _ in self.record_fields),
+            relations=frozenset(children),
+        )
+
+
+class NestedValuesBuilder:
+    """
+    Builds nested dictionaries (in the shape of model_dump()) directly from raw
+    joined rows, without constructing the models.
+
+    Rows describing the same model (by pk) are merged in one pass, related models
+    are nested under relation names, with lists for reverse and many to many
+    relations.
+    """
+
+    def __init__(
+        self,
+        model_cls: Type["Model"],
+        column_map: Dict[str, str],
+        relations: Dict[str, Tuple[str, "ForeignKeyField", bool]],
+        row_keys: List[str],
+    ) -> None:
+        self.root = ValuesNode(name="", model_cls=model_cls, is_list=True)
+        self._entries: Dict[Hashable, Entry] = dict()
+        self._build_tree(
+            column_map=column_map, relations=relations, row_keys=set(row_keys)
+        )
+
+    def _build_tree(
+        self,
+        column_map: Dict[str, str],
+        relations: Dict[str, Tuple[str, "ForeignKeyField", bool]],
+        row_keys: set,
+    ) -> None:
+        """
+        Creates nodes for all selected relations and assigns them the columns
+        resolved by ReverseAliasResolver. Relations not reachable from the main
+        model (not passed in relations) and their columns are skipped.
+
+        Raw fk columns of relations pointing back to the parent model are skipped
+        too, as those are not included in model_dump() of nested models.
+
+        :param column_map: raw column name: relation string with column name
+        :type column_map: Dict[str, str]
+        :param relations: relation string: (table alias, field, is through flag)
+        :type relations: Dict[str, Tuple[str, ForeignKeyField, bool]]
+        :param row_keys: names of the columns in raw rows
+        :type row_keys: set
+        """
+        nodes = {"": self.root}
+        back_references: Dict[str, str] = dict()
+        pk_alias = self.root.model_cls.get_column_alias(
+            self.root.model_cls.ormar_config.pkname
+        )
+        self.root.pk_key = pk_alias if pk_alias in row_keys else None
+        # through models are nested in the target models so those have to exist
+        ordered = sorted(relations.items(), key=lambda x: (x[0].count("__"), x[1][2]))
+        for relation_str, (alias, field, is_through) in ordered:
+            previous_str = relation_str.rpartition("__")[0]
+            if is_through:
+                parent_str = (
+                    f"{previous_str}__{field.name}" if previous_str else field.name
+                )
+                node = ValuesNode(
+                    name=field.through.get_name(),
+                    model_cls=field.through,
+                    is_list=False,
+                    is_through=True,
+                )
+            else:
+                parent_str = previous_str
+                node = ValuesNode(
+                    name=field.name,
+                    model_cls=field.to,
+                    is_list=field.is_multi or field.virtual,
+                )
+                back_references[relation_str] = field.get_related_name()
+            model_config = node.model_cls.ormar_config
+            pk_key = f"{alias}_{node.model_cls.get_column_alias(model_config.pkname)}"
+            node.pk_key = pk_key if pk_key in row_keys else None
+            parent = nodes.get(parent_str)
+            if parent is not None:
+                nodes[relation_str] = node
+                parent.children.append(node)
+
+        for column_name, resolved_name in column_map.items():
+            relation_str, _, column_alias = resolved_name.rpartition("__")
+            if relation_str not in nodes:
+                continue
+            node = nodes[relation_str]
+            name = node.model_cls.get_column_name_from_alias(column_alias)
+            if name == back_references.get(relation_str):
+                continue
+            node.columns.append((column_name, name))
+
+    def add_rows(self, rows: List) -> List[Dict[str, Any]]:
+        """
+        Parses rows into nested dictionaries and merges them with already parsed
+        ones. Returns new root level dictionaries in order of the rows.
+
+        Note that already returned dictionaries are updated in place if later rows
+        contain more of their related models.
+
+        :param rows: raw rows from the database
+        :type rows: List
+        :return: list of new nested dictionaries
+        :rtype: List[Dict[str, Any]]
+        """
+        result = []
+        for row in rows:
+            entry, created = self._parse_row(
+                row=row, node=self.root, index=self._entries
+            )
+            if created:
+                result.append(cast(Entry, entry)[0])
+        return result
+
+    def to_records(self, values: List[Dict[str, Any]]) -> List[ReadOnlyRecord]:
+        """
+        Converts parsed root level dictionaries into read only records.
+
+        :param values: dictionaries returned by add_rows
+        :type values: List[Dict[str, Any]]
+        :return: list of records
+        :rtype: List[ReadOnlyRecord]
+        """
+        if self.root.record_cls is None:
+            self.root.prepare_record_class(
+                relation_map=translate_list_to_dict(
+                    self.root.model_cls._iterate_related_models()
+                )
+            )
+        return [self._to_record(node=self.root, values=item) for item in values]
+
+    def _to_record(self, node: ValuesNode, values: Dict[str, Any]) -> ReadOnlyRecord:
+        """
+        Converts dictionary of given node with nested children into record.
+
+        :param node: node describing the values
+        :type node: ValuesNode
+        :param values: parsed values
+        :type values: Dict[str, Any]
+        :return: record with values
+        :rtype: ReadOnlyRecord
+        """
+        for child in node.children:
+            value = values[child.name]
+            if value is None:
+                continue
+            values[child.name] = (
+                [self._to_record(node=child, values=item) for item in value]
+                if child.is_list
+                else self._to_record(node=child, values=value)
+            )
+        return cast(Type[ReadOnlyRecord], node.record_cls)(
+            *[
+                (
+                    values.get(name)
+                    if source == VALUE
+                    else [] if source == EMPTY_LIST else None
+                )
+                for name, source in node.record_fields
+            ]
+        )
+
+    def clear(self) -> None:
+        """
+        Forgets already parsed root level models, used when iterating
+        to not keep all rows in memory.
+        """
+        self._entries = dict()
+
+    def _parse_row(
+        self, row: Mapping, node: ValuesNode, index: Dict[Hashable, Any]
+    ) -> Tuple[Optional[Entry], bool]:
+        """
+        Parses values of given node from the row, registers it in index of parent
+        and proceeds to children nodes.
+
+        :param row: raw row from the database
+        :type row: Mapping
+        :param node: currently parsed node
+        :type node: ValuesNode
+        :param index: already parsed entries of this node for the parent
+        :type index: Dict[Hashable, Any]
+        :return: parsed entry (None if missing) and flag if it was created now
+        :rtype: Tuple[Optional[Entry], bool]
+        """
+        key = node.get_key(row)
+        if key is None:
+            return None, False
+        entry: Optional[Entry] = index.get(key)
+        created = entry is None
+        if entry is None:
+            values = {name: row[column_name] for column_name, name in node.columns}
+            for child in node.children:
+                values[child.name] = [] if child.is_list else None
+            children_index: Dict[str, Dict[Hashable, Any]] = {
+                child.name: {} for child in node.children
+            }
+            entry = (values, children_index)
+            index[key] = entry
+        values, children_index = entry
+        for child in node.children:
+            child_entry, child_created = self._parse_row(
+                row=row, node=child, index=children_index[child.name]
+            )
+            if not child_created or child_entry is None:
+                continue
+            if child.is_list:
+                values[child.name].append(child_entry[0])
+            else:
+                values[child.name] = child_entry[0]
+        return entry, created
@@ -0,0 +1,121 @@
+import asyncio
+import contextvars
+from typing import TYPE_CHECKING, AsyncGenerator, List, TypeVar
+
+from ormar.queryset.connections import in_transaction
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+    from ormar.queryset import QuerySet
+
+T = TypeVar("T", bound="Model")
+
+PARTITION_DONE = object()
+
+
+async def iterate_partitions(
+    querysets: List["QuerySet[T]"], ordered: bool = False, buffer_size: int = 100
+) -> AsyncGenerator[T, None]:
+    """
+    Iterates given querysets concurrently, each on a separate connection from
+    the pool, and merges the models into one async generator.
+
+    Each partition is read by a separate task into a queue of buffer_size models.
+    If ordered is False models are yielded as soon as any partition returns them
+    (order within each partition is preserved), otherwise all models of a partition
+    are yielded before the models of the next partition.
+
+    If the connection of the caller is inside a transaction (or database uses
+    force_rollback) partitions are iterated one by one on that connection,
+    so the uncommitted changes are visible. The same happens if the installed
+    version of `databases` is not supported (see `ormar.queryset.connections`).
+
+    :param querysets: querysets of the partitions
+    :type querysets: List[QuerySet]
+    :param ordered: flag if partitions should be yielded in order
+    :type ordered: bool
+    :param buffer_size: max number of models read ahead by each partition
+    :type buffer_size: int
+    :return: asynchronous generator of models
+    :rtype: AsyncGenerator[Model]
+    """
+    database = querysets[0].database
+    if in_transaction(database):
+        for queryset in querysets:
+            async for model in queryset.iterate():
+                yield model
+        return
+
+    queues: List[asyncio.Queue] = [
+        asyncio.Queue(maxsize=buffer_size) for _ in (querysets if ordered else [0])
+    ]
+    stopped = asyncio.Event()
+    # tasks run in a copy of the context of the caller, which holds the connection
+    # of the caller, so they are started in an empty context and each of them
+    # gets a new connection from the pool with `Database.connection()`
+    tasks = [
+        contextvars.Context().run(
+            asyncio.ensure_future,
+            _read_partition(queryset, queues[index if ordered else 0], stopped),
+        )
+        for index, queryset in enumerate(querysets)
+    ]
+    try:
+        for queue in queues:
+            remaining = 1 if ordered else len(querysets)
+            while remaining:
+                item = await queue.get()
+                if item is PARTITION_DONE:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+    finally:
+        # tasks are not cancelled, as cancelling a query of `databases` while
+        # it starts the transaction of the iterator leaves the connection acquired,
+        # instead they stop before putting next model and the queues are drained
+        # until all of them close their iterators
+        stopped.set()
+        pending = {task for task in tasks if not task.done()}
+        while pending:
+            for queue in queues:
+                while not queue.empty():
+                    queue.get_nowait()
+            _, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _read_partition(
+    queryset: "QuerySet", queue: asyncio.Queue, stopped: asyncio.Event
+) -> None:
+    """
+    Reads models of the partition into the queue.
+
+    Puts the exception into the queue if the query fails, and the PARTITION_DONE
+    marker when all models are read. Stops without putting anything more into
+    the queue as soon as stopped is set.
+
+    :param queryset: queryset of the partition
+    :type queryset: QuerySet
+    :param queue: queue to put the models into
+    :type queue: asyncio.Queue
+    :param stopped: event set when the models are no longer consumed
+    :type stopped: asyncio.Event
+    """
+    iterator = queryset.iterate()
+    try:
+        async for model in iterator:
+            if stopped.is_set():
+                return
+            await queue.put(model)
+    except Exception as exc:
+        item: object = exc
+    else:
+        item = PARTITION_DONE
+    finally:
+        await iterator.aclose()
+    if not stopped.is_set():
+        await queue.put(item)
@@ -1,10 +1,18 @@
 import asyncio
+import datetime
+import decimal
+from concurrent.futures import Executor
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Awaitable,
+    Callable,
     Dict,
+    Generator,
     Generic,
+    Hashable,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -17,6 +25,7 @@ from typing import (
 )
 
 import databases
+import pydantic
 import sqlalchemy
 from sqlalchemy import bindparam
 
@@ -38,10 +47,18 @@ from ormar.exceptions import (
 )
 from ormar.queryset import FieldAccessor, FilterQuery, SelectAction
 from ormar.queryset.actions.order_action import OrderAction
+from ormar.queryset.batch_loader import BatchLoader
 from ormar.queryset.clause import FilterGroup, QueryClause
+from ormar.queryset.decryption import OffloadedDecryption
+from ormar.queryset.deferred import DeferredLoader
+from ormar.queryset.nested_values import NestedValuesBuilder
+from ormar.queryset.parallel import iterate_partitions
 from ormar.queryset.queries.prefetch_query import PrefetchQuery
 from ormar.queryset.queries.query import Query
+from ormar.queryset.related_loader import ResultSet
 from ormar.queryset.reverse_alias_resolver import ReverseAliasResolver
+from ormar.queryset.single_flight import in_flight_queries
+from ormar.queryset.utils import get_pydantic_projection
 
 if TYPE_CHECKING:  # pragma no cover
     from ormar import Model
@@ -51,6 +68,8 @@ if TYPE_CHECKING:  # pragma no cover
 else:
     T = TypeVar("T", bound="Model")
 
+P = TypeVar("P", bound=pydantic.BaseModel)
+
 
 class QuerySet(Generic[T]):
     """
@@ -70,6 +89,10 @@ class QuerySet(Generic[T]):
         prefetch_related: Optional[List] = None,
         limit_raw_sql: bool = False,
         proxy_source_model: Optional[Type["Model"]] = None,
+        readonly: bool = False,
+        decryption: Optional[OffloadedDecryption] = None,
+        deferred: Optional[List[str]] = None,
+        single_flight: bool = False,
     ) -> None:
         self.proxy_source_model = proxy_source_model
         self.model_cls = model_cls
@@ -82,6 +105,10 @@ class QuerySet(Generic[T]):
         self._excludable = excludable or ormar.ExcludableItems()
         self.order_bys = order_bys or []
         self.limit_sql_raw = limit_raw_sql
+        self._readonly = readonly
+        self._decryption = decryption
+        self._deferred = [] if deferred is None else deferred
+        self._single_flight = single_flight
 
     @property
     def model_config(self) -> "OrmarConfig":
@@ -119,6 +146,10 @@ class QuerySet(Generic[T]):
         prefetch_related: Optional[List] = None,
         limit_raw_sql: Optional[bool] = None,
         proxy_source_model: Optional[Type["Model"]] = None,
+        readonly: Optional[bool] = None,
+        decryption: Optional[OffloadedDecryption] = None,
+        deferred: Optional[List[str]] = None,
+        single_flight: Optional[bool] = None,
     ) -> "QuerySet":
         """
         Method that returns new instance of queryset based on passed params,
@@ -130,6 +161,10 @@ class QuerySet(Generic[T]):
             "excludable": "_excludable",
             "prefetch_related": "_prefetch_related",
             "limit_raw_sql": "limit_sql_raw",
+            "readonly": "_readonly",
+            "decryption": "_decryption",
+            "deferred": "_deferred",
+            "single_flight": "_single_flight",
         }
         passed_args = locals()
 
@@ -150,6 +185,10 @@ class QuerySet(Generic[T]):
             prefetch_related=replace_if_none("prefetch_related"),
             limit_raw_sql=replace_if_none("limit_raw_sql"),
             proxy_source_model=replace_if_none("proxy_source_model"),
+            readonly=replace_if_none("readonly"),
+            decryption=replace_if_none("decryption"),
+            deferred=replace_if_none("deferred"),
+            single_flight=replace_if_none("single_flight"),
         )
 
     async def _prefetch_related_models(
@@ -174,15 +213,31 @@ class QuerySet(Generic[T]):
         )
         return await query.prefetch_related(models=models)  # type: ignore
 
-    async def _process_query_result_rows(self, rows: List) -> List["T"]:
+    async def _process_query_result_rows(
+        self,
+        rows: List,
+        deferred_loader: Optional[DeferredLoader] = None,
+        result_set: Optional[ResultSet] = None,
+    ) -> List["T"]:
         """
         Process database rows and initialize ormar Model from each of the rows.
 
+        All returned models are registered in one result set (passed one or a new
+        one), so not loaded related models of all of them can be fetched at once.
+        If fields of the model are deferred, models are also registered
+        in one loader, so deferred fields are later loaded for all of them at once.
+
         :param rows: list of database rows from query result
         :type rows: List[sqlalchemy.engine.result.RowProxy]
+        :param deferred_loader: loader of deferred fields to register models in
+        :type deferred_loader: Optional[DeferredLoader]
+        :param result_set: result set to register models in
+        :type result_set: Optional[ResultSet]
         :return: list of models
         :rtype: List[Model]
         """
+        if self._readonly:
+            return self._process_query_result_rows_as_records(rows)
         result_rows = []
         for row in rows:
             result_rows.append(
@@ -197,9 +252,121 @@ class QuerySet(Generic[T]):
             await asyncio.sleep(0)
 
         if result_rows:
-            return self.model.merge_instances_list(result_rows)  # type: ignore
+            result_rows = self.model.merge_instances_list(result_rows)  # type: ignore
+            result_set = result_set or ResultSet()
+            for instance in result_rows:
+                result_set.add(cast("Model", instance))
+            if self._deferred:
+                loader = deferred_loader or DeferredLoader(
+                    model_cls=self.model, fields=self._deferred
+                )
+                for instance in result_rows:
+                    loader.add(cast("Model", instance))
         return cast(List["T"], result_rows)
 
+    def _process_query_result_rows_as_records(self, rows: List) -> List["T"]:
+        """
+        Process database rows into read only records, rows of the same model
+        are merged.
+
+        :raises QueryDefinitionError: if prefetch_related is used
+        :param rows: list of database rows from query result
+        :type rows: List[sqlalchemy.engine.result.RowProxy]
+        :return: list of read only records
+        :rtype: List[ReadOnlyRecord]
+        """
+        if self._prefetch_related:
+            raise QueryDefinitionError(
+                "Prefetch related queries are not supported with readonly records"
+            )
+        if self._deferred:
+            raise QueryDefinitionError(
+                "Deferred fields are not supported with readonly records"
+            )
+        if not rows:
+            return []
+        builder = self._get_nested_values_builder(
+            exclude_through=False,
+            row_keys=list(cast(LegacyRow, rows[0]).keys()),
+            add_pk_columns=True,
+        )
+        return cast(List["T"], builder.to_records(builder.add_rows(rows)))
+
+    async def _fetch_all(self, expr: sqlalchemy.sql.Select) -> List:
+        """
+        Fetches all rows of the query, with decryption offloaded to executor
+        if offload_decryption() was called.
+
+        If single_flight() was called, rows of identical query (with the same
+        decryption settings) already running are reused instead of issuing
+        the query again.
+
+        :param expr: select query
+        :type expr: sqlalchemy.sql.Select
+        :return: database rows
+        :rtype: List
+        """
+        decryption = self._decryption
+        options = (
+            None
+            if decryption is None
+            else (id(decryption.executor), decryption.batch_size)
+        )
+        return list(await self._run_read_query(self._fetch_rows, expr, options))
+
+    async def _fetch_rows(self, expr: sqlalchemy.sql.Select) -> List:
+        """
+        Fetches all rows of the query, with decryption offloaded to executor
+        if offload_decryption() was called.
+
+        :param expr: select query
+        :type expr: sqlalchemy.sql.Select
+        :return: database rows
+        :rtype: List
+        """
+        if self._decryption is None:
+            return await self.database.fetch_all(expr)
+        return await self._decryption.fetch_all(database=self.database, expr=expr)
+
+    async def _run_read_query(
+        self,
+        fetch: Callable[[sqlalchemy.sql.Select], Awaitable[Any]],
+        expr: sqlalchemy.sql.Select,
+        options: Hashable = None,
+    ) -> Any:
+        """
+        Runs read query with given fetch function, if single_flight() was called
+        identical queries running concurrently are issued only once.
+
+        :param fetch: function fetching the result of the query
+        :type fetch: Callable[[sqlalchemy.sql.Select], Awaitable[Any]]
+        :param expr: select query
+        :type expr: sqlalchemy.sql.Select
+        :param options: settings of the fetch function that change its result
+        :type options: Hashable
+        :return: result of the query
+        :rtype: Any
+        """
+        if self._single_flight:
+            return await in_flight_queries.run(
+                database=self.database, expr=expr, fetch=fetch, options=options
+            )
+        return await fetch(expr)
+
+    def _iterate_rows(self, expr: sqlalchemy.sql.Select) -> AsyncGenerator[Any, None]:
+        """
+        Iterates rows of the query, with decryption offloaded to executor
+        if offload_decryption() was called.
+
+        :param expr: select query
+        :type expr: sqlalchemy.sql.Select
+        :return: asynchronous generator of database rows
+        :rtype: AsyncGenerator
+        """
+        if self._decryption is None:
+            return self.database.iterate(query=expr)
+        return self._decryption.iterate(database=self.database, expr=expr)
+
     def _resolve_filter_groups(
         self, groups: Any
     ) -> Tuple[List[FilterGroup], List[str]]:
@@ -427,6 +594,82 @@ class QuerySet(Generic[T]):
             relations = self.model._iterate_related_models()
         return self.rebuild_self(select_related=relations)
 
+    def readonly(self) -> "QuerySet[T]":
+        """
+        Makes the queryset return compact, immutable records instead of ormar models.
+
+        Records are built straight from the rows, without validation, relations
+        registration and pydantic internals, and use only a fraction of memory
+        of the full models. They expose fields (and selected related models)
+        as attributes and support model_dump() and model_dump_json().
+
+        Records cannot be modified nor saved, prefetch_related is not supported.
+
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self.rebuild_self(readonly=True)
+
+    def single_flight(self) -> "QuerySet[T]":
+        """
+        Deduplicates identical read queries running concurrently.
+
+        When many coroutines issue the same query at once (i.e. on cache stampede)
+        only the first one runs it and all others wait for its result, so the
+        database runs the query once. Each caller constructs own models from
+        the shared rows.
+
+        Queries are keyed by compiled sql and parameters, entry is removed
+        when the query completes, so the results are not cached.
+
+        Applies to queries returning rows (get, first, all, values etc.),
+        count, exists and aggregate functions.
+
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self.rebuild_self(single_flight=True)
+
+    def offload_decryption(
+        self, executor: Optional[Executor] = None, batch_size: int = 500
+    ) -> "QuerySet[T]":
+        """
+        Moves decryption of encrypted fields (and decompression of compressed
+        fields) out of the event loop.
+
+        Encrypted values are fetched as they are, collected per column and
+        decrypted in batches of batch_size values in executor (default thread pool
+        of the event loop if not provided), before the models are constructed.
+
+        :param executor: executor used to decrypt the values
+        :type executor: Optional[concurrent.futures.Executor]
+        :param batch_size: max number of values decrypted in one executor call
+        :type batch_size: int
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self.rebuild_self(
+            decryption=OffloadedDecryption(executor=executor, batch_size=batch_size)
+        )
+
+    def offload_decompression(
+        self, executor: Optional[Executor] = None, batch_size: int = 500
+    ) -> "QuerySet[T]":
+        """
+        Moves decompression of compressed fields out of the event loop.
+
+        Works the same as offload_decryption(), compressed (and encrypted) values
+        are processed in batches of batch_size values in executor.
+
+        :param executor: executor used to decompress the values
+        :type executor: Optional[concurrent.futures.Executor]
+        :param batch_size: max number of values decompressed in one executor call
+        :type batch_size: int
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self.offload_decryption(executor=executor, batch_size=batch_size)
+
     def prefetch_related(
         self, related: Union[List, str, FieldAccessor]
     ) -> "QuerySet[T]":
@@ -542,6 +785,54 @@ class QuerySet(Generic[T]):
         """
         return self.fields(columns=columns, _is_exclude=True)
 
+    def defer(self, *fields: Union[str, FieldAccessor]) -> "QuerySet[T]":
+        """
+        With `defer()` you can skip loading of heavy columns of the model
+        (like long texts or large json payloads), same as with `exclude_fields()`,
+        but the deferred fields can be loaded later with `load_deferred()`.
+
+        Until loaded deferred fields are set to None, so only nullable
+        fields of the model (not relations nor primary key) can be deferred.
+
+        Models returned by one query share the loader, so calling
+        `await model.load_deferred()` on any of them loads deferred fields of all
+        of them with one `SELECT pk, fields ... WHERE pk IN (...)` query,
+        so accessing deferred fields of listed models does not issue N queries.
+
+        `defer()` can be called several times, building up the deferred fields.
+
+        :raises QueryDefinitionError: if field cannot be deferred
+        :param fields: names of the fields to defer
+        :type fields: Union[str, FieldAccessor]
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        names = [
+            field._access_chain if isinstance(field, FieldAccessor) else field
+            for field in fields
+        ]
+        for name in names:
+            field = self.model_config.model_fields.get(name)
+            if (
+                field is None
+                or field.is_relation
+                or name == self.model_config.pkname
+                or not field.nullable
+            ):
+                raise QueryDefinitionError(
+                    f"Field {name} of {self.model.get_name()} cannot be deferred, "
+                    f"only nullable, not relation and not primary key fields "
+                    f"can be deferred."
+                )
+        excludable = ormar.ExcludableItems.from_excludable(self._excludable)
+        excludable.build(
+            items=names,
+            model_cls=self.model_cls,  # type: ignore
+            is_exclude=True,
+        )
+        deferred = list(dict.fromkeys([*self._deferred, *names]))
+        return self.rebuild_self(excludable=excludable, deferred=deferred)
+
     def order_by(self, columns: Union[List, str, OrderAction]) -> "QuerySet[T]":
         """
         With `order_by()` you can order the results from database based on your
@@ -589,10 +880,72 @@ class QuerySet(Generic[T]):
         order_bys = self.order_bys + [x for x in orders_by if x not in self.order_bys]
         return self.rebuild_self(order_bys=order_bys)
 
+    def _get_values_resolver(
+        self, exclude_through: bool, add_pk_columns: bool = False
+    ) -> ReverseAliasResolver:
+        """
+        Returns resolver of raw column names into relation strings
+        for current query.
+
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param add_pk_columns: flag if not explicitly selected pks should be kept
+        :type add_pk_columns: bool
+        :return: resolver of column names
+        :rtype: ReverseAliasResolver
+        """
+        return ReverseAliasResolver(
+            select_related=self._select_related,
+            excludable=self._excludable,
+            model_cls=self.model_cls,  # type: ignore
+            exclude_through=exclude_through,
+            add_pk_columns=add_pk_columns,
+        )
+
+    def _get_nested_values_builder(
+        self,
+        exclude_through: bool,
+        row_keys: List[str],
+        related: Optional[List[str]] = None,
+        add_pk_columns: bool = False,
+    ) -> NestedValuesBuilder:
+        """
+        Returns builder of nested dictionaries from raw rows for current query.
+
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param row_keys: names of the columns in raw rows
+        :type row_keys: List[str]
+        :param related: relations to nest, all selected relations if not provided
+        :type related: Optional[List[str]]
+        :param add_pk_columns: flag if not explicitly selected pks should be kept
+        :type add_pk_columns: bool
+        :return: builder of nested values
+        :rtype: NestedValuesBuilder
+        """
+        alias_resolver = self._get_values_resolver(
+            exclude_through=exclude_through, add_pk_columns=add_pk_columns
+        )
+        column_map = alias_resolver.resolve_columns(columns_names=row_keys)
+        relations = alias_resolver.resolve_relations()
+        if related is not None:
+            relations = {
+                relation_str: relation
+                for relation_str, relation in relations.items()
+                if relation_str in related or relation[2]
+            }
+        return NestedValuesBuilder(
+            model_cls=self.model_cls,  # type: ignore
+            column_map=column_map,
+            relations=relations,
+            row_keys=row_keys,
+        )
+
     async def values(
         self,
         fields: Union[List, str, Set, Dict, None] = None,
         exclude_through: bool = False,
+        nested: bool = False,
         _as_dict: bool = True,
         _flatten: bool = False,
     ) -> List:
@@ -605,8 +958,15 @@ class QuerySet(Generic[T]):
 
         Note that it always return a list even for one row from database.
 
+        With nested=True related models are returned as nested dictionaries (or lists
+        of dictionaries for reverse and many to many relations) keyed by field names,
+        same as in model_dump(), and rows of the same main model are merged.
+        Models are not constructed nor validated in the process.
+
         :param exclude_through: flag if through models should be excluded
         :type exclude_through: bool
+        :param nested: flag if related models should be nested
+        :type nested: bool
         :param _flatten: internal parameter to flatten one element tuples
         :type _flatten: bool
         :param _as_dict: internal parameter if return dict or tuples
@@ -616,18 +976,22 @@ class QuerySet(Generic[T]):
         """
         if fields:
             return await self.fields(columns=fields).values(
-                _as_dict=_as_dict, _flatten=_flatten, exclude_through=exclude_through
+                _as_dict=_as_dict,
+                _flatten=_flatten,
+                exclude_through=exclude_through,
+                nested=nested,
             )
         expr = self.build_select_expression()
-        rows = await self.database.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         if not rows:
             return []
-        alias_resolver = ReverseAliasResolver(
-            select_related=self._select_related,
-            excludable=self._excludable,
-            model_cls=self.model_cls,  # type: ignore
-            exclude_through=exclude_through,
-        )
+        if nested:
+            builder = self._get_nested_values_builder(
+                exclude_through=exclude_through,
+                row_keys=list(cast(LegacyRow, rows[0]).keys()),
+            )
+            return builder.add_rows(rows)
+        alias_resolver = self._get_values_resolver(exclude_through=exclude_through)
         column_map = alias_resolver.resolve_columns(
             columns_names=list(cast(LegacyRow, rows[0]).keys())
         )
@@ -676,6 +1040,114 @@ class QuerySet(Generic[T]):
             _flatten=flatten,
         )
 
+    async def iterate_values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        nested: bool = False,
+    ) -> AsyncGenerator[Dict, None]:
+        """
+        Return async iterable generator of dictionaries with column values,
+        same as in values() but without fetching all rows at once.
+
+        With nested=True consecutive rows of the same main model are merged and
+        one nested dictionary is yielded per main model, so the query should be
+        ordered by the main model (default ordering by primary key does that).
+
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param nested: flag if related models should be nested
+        :type nested: bool
+        :param fields: field name or list of field names to extract from db
+        :type fields:  Union[List, str, Set, Dict]
+        :return: asynchronous iterable generator of dictionaries
+        :rtype: AsyncGenerator[Dict]
+        """
+        if fields:
+            async for result in self.fields(columns=fields).iterate_values(
+                exclude_through=exclude_through, nested=nested
+            ):
+                yield result
+            return
+
+        expr = self.build_select_expression()
+        if not nested:
+            column_map: Optional[Dict[str, str]] = None
+            async for row in self._iterate_rows(expr):
+                if column_map is None:
+                    column_map = self._get_values_resolver(
+                        exclude_through=exclude_through
+                    ).resolve_columns(columns_names=list(row.keys()))
+                yield {
+                    column_map[k]: v for k, v in dict(row).items() if k in column_map
+                }
+            return
+
+        builder: Optional[NestedValuesBuilder] = None
+        rows: list = []
+        last_primary_key = None
+        pk_alias = self.model.get_column_alias(self.model_config.pkname)
+
+        async for row in self._iterate_rows(expr):
+            if builder is None:
+                builder = self._get_nested_values_builder(
+                    exclude_through=exclude_through, row_keys=list(row.keys())
+                )
+            current_primary_key = row[pk_alias]
+            if last_primary_key == current_primary_key or last_primary_key is None:
+                last_primary_key = current_primary_key
+                rows.append(row)
+                continue
+
+            yield builder.add_rows(rows)[0]
+            builder.clear()
+            last_primary_key = current_primary_key
+            rows = [row]
+
+        if rows:
+            yield cast(NestedValuesBuilder, builder).add_rows(rows)[0]
+
+    async def as_model(self, pydantic_model: Type[P]) -> List[P]:
+        """
+        Returns a list of pydantic models (i.e. created with get_pydantic())
+        instead of ormar models.
+
+        Only columns of fields declared in the pydantic model are selected, nested
+        pydantic models are selected as related models. Rows are nested without
+        constructing ormar models and validated at once with TypeAdapter.
+
+        Relations selected by select_related() but not declared as nested pydantic
+        models are not returned.
+
+        Projection and TypeAdapter are created once per pydantic model and cached
+        on the ormar model.
+
+        :param pydantic_model: pydantic model to return
+        :type pydantic_model: Type[pydantic.BaseModel]
+        :return: list of pydantic models
+        :rtype: List[pydantic.BaseModel]
+        """
+        projection = self.model._pydantic_projections.get(pydantic_model)
+        if projection is None:
+            fields, related = get_pydantic_projection(
+                model_cls=self.model, pydantic_model=pydantic_model
+            )
+            adapter = pydantic.TypeAdapter(List[pydantic_model])  # type: ignore
+            projection = (fields, related, adapter)
+            self.model._pydantic_projections[pydantic_model] = projection
+        fields, related, adapter = projection
+        queryset = self.select_related(related) if related else self
+        queryset = queryset.fields(fields)
+        rows = await queryset._fetch_all(queryset.build_select_expression())
+        if not rows:
+            return []
+        builder = queryset._get_nested_values_builder(
+            exclude_through=True,
+            row_keys=list(cast(LegacyRow, rows[0]).keys()),
+            related=related,
+        )
+        return adapter.validate_python(builder.add_rows(rows))
+
     async def exists(self) -> bool:
         """
         Returns a bool value to confirm if there are rows matching the given criteria
@@ -686,7 +1158,7 @@ class QuerySet(Generic[T]):
         """
         expr = self.build_select_expression()
         expr = sqlalchemy.exists(expr).select()
-        return await self.database.fetch_val(expr)
+        return await self._run_read_query(self.database.fetch_val, expr)
 
     async def count(self, distinct: bool = True) -> int:
         """
@@ -710,7 +1182,7 @@ class QuerySet(Generic[T]):
             pk_column_name = self.model.get_column_alias(self.model_config.pkname)
             expr_distinct = expr.group_by(pk_column_name).alias("subquery_for_group")
             expr = sqlalchemy.func.count().select().select_from(expr_distinct)
-        return await self.database.fetch_val(expr)
+        return await self._run_read_query(self.database.fetch_val, expr)
 
     async def _query_aggr_function(self, func_name: str, columns: List) -> Any:
         func = getattr(sqlalchemy.func, func_name)
@@ -726,7 +1198,7 @@ class QuerySet(Generic[T]):
         expr = self.build_select_expression().alias(f"subquery_for_{func_name}")
         expr = sqlalchemy.select(select_columns).select_from(expr)
         # print("\n", expr.compile(compile_kwargs={"literal_binds": True}))
-        result = await self.database.fetch_one(expr)
+        result = await self._run_read_query(self.database.fetch_one, expr)
         return dict(result) if len(result) > 1 else result[0]  # type: ignore
 
     async def max(self, columns: Union[str, List[str]]) -> Any:  # noqa: A003
@@ -802,6 +1274,7 @@ class QuerySet(Generic[T]):
         )
         updates = {k: v for k, v in kwargs.items() if k in self_fields}
         updates = self.model.validate_enums(updates)
+        updates = self.model.load_json_fields(updates)
         updates = self.model.translate_columns_to_aliases(updates)
 
         expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
@@ -926,7 +1399,7 @@ class QuerySet(Generic[T]):
             )
             + self.order_bys,
         )
-        rows = await self.database.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         processed_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and processed_rows:
             processed_rows = await self._prefetch_related_models(processed_rows, rows)
@@ -1009,13 +1482,193 @@ class QuerySet(Generic[T]):
         else:
             expr = self.build_select_expression()
 
-        rows = await self.database.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         processed_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and processed_rows:
             processed_rows = await self._prefetch_related_models(processed_rows, rows)
         self.check_single_result_rows_count(processed_rows)
         return processed_rows[0]  # type: ignore
 
+    def loader(self, max_batch_size: int = 500, delay: float = 0.0) -> BatchLoader["T"]:
+        """
+        Returns loader that coalesces lookups by primary key into batched queries.
+
+        Primary keys requested with `await loader.load(pk)` (or
+        `loader.load_many(pks)`) during one iteration of the event loop, or within
+        delay seconds from the first request if delay is set, are fetched with one
+        `WHERE pk IN (...)` query of this queryset (so with its filters,
+        select_related etc.). Each awaiter receives the model with requested pk
+        or `NoMatch` exception if it does not exist.
+
+        Keep and reuse the loader between concurrent calls, each loader
+        collects own batches.
+
+        :param max_batch_size: max number of primary keys in one query
+        :type max_batch_size: int
+        :param delay: seconds to wait for more primary keys, 0 to wait one loop tick
+        :type delay: float
+        :return: batch loader
+        :rtype: BatchLoader
+        """
+        return BatchLoader(queryset=self, max_batch_size=max_batch_size, delay=delay)
+
+    async def get_batched(self, pk: Any) -> "T":
+        """
+        Gets the model by primary key, lookups issued concurrently by many coroutines
+        during one iteration of the event loop are fetched with one query.
+
+        Uses loader shared by all calls for given model, so it can be called only
+        on not modified queryset (i.e. `Model.objects.get_batched(pk)`),
+        to batch lookups of filtered queryset use `loader()`.
+
+        :raises NoMatch: if model with given pk does not exist
+        :raises QueryDefinitionError: if queryset was modified
+        :param pk: primary key of the model
+        :type pk: Any
+        :return: model with given primary key
+        :rtype: Model
+        """
+        if (
+            self.filter_clauses
+            or self.exclude_clauses
+            or self._select_related
+            or self._prefetch_related
+            or self._excludable.items
+            or self.order_bys
+            or self.limit_count is not None
+            or self.query_offset is not None
+            or self._readonly
+            or self._decryption is not None
+            or self._deferred
+        ):
+            raise QueryDefinitionError(
+                "get_batched() can be used only on not modified queryset, "
+                "use loader() to batch lookups of modified queryset."
+            )
+        if self.model._batch_loader is None:
+            self.model._batch_loader = self.loader()
+        return await self.model._batch_loader.load(pk)
+
+    async def in_bulk(
+        self, values: Iterable[Any], field: str = "pk", batch_size: int = 500
+    ) -> Dict[Any, "T"]:
+        """
+        Returns models which given field has one of passed values, as dictionary
+        of field values and models.
+
+        Field has to be a primary key or unique field of the model.
+
+        Models are fetched with `WHERE field IN (...)` queries for batches of
+        batch_size values, without the default ordering (ordering is applied only if
+        order_by() was called). Filters, select_related and prefetch_related set on
+        the queryset are applied. Values without matching model are not included.
+
+        :raises QueryDefinitionError: if field is not unique or limit/offset is set
+        :param values: values of the field to fetch models for
+        :type values: Iterable[Any]
+        :param field: name of the primary key or unique field
+        :type field: str
+        :param batch_size: max number of values in one query
+        :type batch_size: int
+        :return: dictionary of field values and models
+        :rtype: Dict[Any, Model]
+        """
+        name = self._get_in_bulk_field_name(field)
+        result: Dict[Any, "T"] = {}
+        for chunk in self._chunk_in_bulk_values(values, batch_size):
+            filters: Dict[str, Any] = {f"{name}__in": chunk}
+            queryset = self.filter(**filters)
+            expr = queryset.build_select_expression()
+            if not self.order_bys:
+                expr = expr.order_by(None)
+            rows = await queryset._fetch_all(expr)
+            models = await queryset._process_query_result_rows(rows)
+            if self._prefetch_related and models:
+                models = await queryset._prefetch_related_models(models, rows)
+            for model in models:
+                result[getattr(model, name)] = model
+        return result
+
+    async def exists_many(
+        self, values: Iterable[Any], field: str = "pk", batch_size: int = 500
+    ) -> Set[Any]:
+        """
+        Returns the set of passed values for which the model with given value
+        of field exists (and matches the filters of the queryset).
+
+        Only the column of the field is selected, with `WHERE field IN (...)`
+        queries for batches of batch_size values.
+
+        :raises QueryDefinitionError: if field is not unique or limit/offset is set
+        :param values: values of the field to check
+        :type values: Iterable[Any]
+        :param field: name of the primary key or unique field
+        :type field: str
+        :param batch_size: max number of values in one query
+        :type batch_size: int
+        :return: set of existing values
+        :rtype: Set[Any]
+        """
+        name = self._get_in_bulk_field_name(field)
+        column = self.model_config.table.columns[self.model.get_column_alias(name)]
+        existing: Set[Any] = set()
+        for chunk in self._chunk_in_bulk_values(values, batch_size):
+            filters: Dict[str, Any] = {f"{name}__in": chunk}
+            queryset = self.filter(**filters)
+            expr = (
+                queryset.build_select_expression()
+                .with_only_columns([column])
+                .order_by(None)
+            )
+            rows = await queryset._run_read_query(self.database.fetch_all, expr)
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def _get_in_bulk_field_name(self, field: str) -> str:
+        """
+        Validates the field used in in_bulk() and exists_many() and the queryset.
+
+        :raises QueryDefinitionError: if field is not unique or limit/offset is set
+        :param field: name of the field or pk
+        :type field: str
+        :return: name of the field
+        :rtype: str
+        """
+        if self.limit_count is not None or self.query_offset is not None:
+            raise QueryDefinitionError(
+                "in_bulk() and exists_many() cannot be used with limit and offset"
+            )
+        name = self.model_config.pkname if field == "pk" else field
+        model_field = self.model_config.model_fields.get(name)
+        if (
+            model_field is None
+            or model_field.is_relation
+            or not (model_field.primary_key or model_field.unique)
+        ):
+            raise QueryDefinitionError(
+                f"Field {field} of {self.model.get_name()} has to be a primary key "
+                f"or unique field to be used in in_bulk() and exists_many()"
+            )
+        return name
+
+    @staticmethod
+    def _chunk_in_bulk_values(
+        values: Iterable[Any], batch_size: int
+    ) -> Generator[List[Any], None, None]:
+        """
+        Splits unique values into batches of batch_size values.
+
+        :param values: values to split
+        :type values: Iterable[Any]
+        :param batch_size: max number of values in batch
+        :type batch_size: int
+        :return: generator of batches of values
+        :rtype: Generator[List[Any], None, None]
+        """
+        unique_values = list(dict.fromkeys(values))
+        for start in range(0, len(unique_values), batch_size):
+            yield unique_values[start : start + batch_size]
+
     async def get_or_create(
         self,
         _defaults: Optional[Dict[str, Any]] = None,
@@ -1080,7 +1733,7 @@ class QuerySet(Generic[T]):
             return await self.filter(*args, **kwargs).all()
 
         expr = self.build_select_expression()
-        rows = await self.database.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         result_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and result_rows:
             result_rows = await self._prefetch_related_models(result_rows, rows)
@@ -1121,20 +1774,246 @@ class QuerySet(Generic[T]):
         rows: list = []
         last_primary_key = None
         pk_alias = self.model.get_column_alias(self.model_config.pkname)
+        # models yielded until deferred fields are loaded share one loader
+        loader: Optional[DeferredLoader] = None
+        result_set = ResultSet()
 
-        async for row in self.database.iterate(query=expr):
+        async for row in self._iterate_rows(expr):
             current_primary_key = row[pk_alias]
             if last_primary_key == current_primary_key or last_primary_key is None:
                 last_primary_key = current_primary_key
                 rows.append(row)
                 continue
 
-            yield (await self._process_query_result_rows(rows))[0]
+            if self._deferred and (loader is None or loader.loaded):
+                loader = DeferredLoader(model_cls=self.model, fields=self._deferred)
+            yield (await self._process_query_result_rows(rows, loader, result_set))[0]
             last_primary_key = current_primary_key
             rows = [row]
 
         if rows:
-            yield (await self._process_query_result_rows(rows))[0]
+            if self._deferred and (loader is None or loader.loaded):
+                loader = DeferredLoader(model_cls=self.model, fields=self._deferred)
+            yield (await self._process_query_result_rows(rows, loader, result_set))[0]
+
+    async def parallel_iterate(
+        self,
+        partitions: int = 4,
+        key: str = "pk",
+        ordered: bool = False,
+        quantiles: bool = False,
+        buffer_size: int = 100,
+    ) -> AsyncGenerator["T", None]:
+        """
+        Return async iterable generator for all rows, read concurrently by
+        partitions queries on separate connections from the pool.
+
+        The range of key column is split into contiguous ranges, with even steps
+        between min and max value for numeric and date keys, or by quantiles
+        of the values (one query per partition) for other keys or if
+        quantiles is True. Each range is iterated by a separate task.
+
+        Models of each partition are yielded in order of the partition, if ordered
+        is True partitions are yielded one after another in order of the key.
+
+        :raises QueryDefinitionError: if key is not pk, unique or indexed field
+        or prefetch_related, limit or offset is used
+        :param partitions: number of partitions
+        :type partitions: int
+        :param key: name of the primary key, unique or indexed field
+        :type key: str
+        :param ordered: flag if partitions should be yielded in order
+        :type ordered: bool
+        :param quantiles: flag if ranges should be split by quantiles of the values
+        :type quantiles: bool
+        :param buffer_size: max number of models read ahead by each partition
+        :type buffer_size: int
+        :return: asynchronous iterable generator of returned models
+        :rtype: AsyncGenerator[Model]
+        """
+        name = self._get_partition_key_name(key)
+        split_points = await self._get_partition_split_points(
+            name=name, partitions=partitions, quantiles=quantiles
+        )
+        lower_bounds: List[Any] = [None, *split_points]
+        upper_bounds: List[Any] = [*split_points, None]
+        querysets = []
+        for lower, upper in zip(lower_bounds, upper_bounds):
+            filters: Dict[str, Any] = {}
+            if lower is not None:
+                filters[f"{name}__gte"] = lower
+            if upper is not None:
+                filters[f"{name}__lt"] = upper
+            querysets.append(self.filter(**filters))
+        # close the partitions explicitly, so the tasks and their connections are
+        # released when iteration stops early, not when the generator is collected
+        iterator = iterate_partitions(
+            querysets=querysets, ordered=ordered, buffer_size=buffer_size
+        )
+        try:
+            async for model in iterator:
+                yield model
+        finally:
+            await iterator.aclose()
+
+    def _get_partition_key_name(self, key: str) -> str:
+        """
+        Validates the key used in parallel_iterate() and the queryset.
+
+        :raises QueryDefinitionError: if key is not pk, unique or indexed field
+        or prefetch_related, limit or offset is used
+        :param key: name of the field or pk
+        :type key: str
+        :return: name of the field
+        :rtype: str
+        """
+        if self._prefetch_related:
+            raise QueryDefinitionError(
+                "Prefetch related queries are not supported in iterators"
+            )
+        if self.limit_count is not None or self.query_offset is not None:
+            raise QueryDefinitionError(
+                "parallel_iterate() cannot be used with limit and offset"
+            )
+        name = self.model_config.pkname if key == "pk" else key
+        model_field = self.model_config.model_fields.get(name)
+        if model_field is None or model_field.is_relation:
+            raise QueryDefinitionError(
+                f"{key} is not a field of {self.model.get_name()}"
+            )
+        if not model_field.primary_key and (
+            model_field.nullable or not (model_field.unique or model_field.index)
+        ):
+            raise QueryDefinitionError(
+                f"Field {key} of {self.model.get_name()} has to be a primary key "
+                f"or not nullable unique or indexed field to partition by it"
+            )
+        return name
+
+    async def _get_partition_split_points(
+        self, name: str, partitions: int, quantiles: bool
+    ) -> List[Any]:
+        """
+        Returns the values splitting the range of the key into partitions.
+
+        :param name: name of the key field
+        :type name: str
+        :param partitions: number of partitions
+        :type partitions: int
+        :param quantiles: flag if ranges should be split by quantiles of the values
+        :type quantiles: bool
+        :return: sorted unique split points
+        :rtype: List[Any]
+        """
+        if partitions < 2:
+            return []
+        queryset = self.rebuild_self(order_bys=[])
+        minimum = await queryset.order_by(name)._get_first_value(name)
+        if minimum is None:
+            return []
+        if not quantiles and isinstance(
+            minimum, (int, float, decimal.Decimal, datetime.date)
+        ):
+            maximum = await queryset.order_by(f"-{name}")._get_first_value(name)
+            if isinstance(minimum, int):
+                span = maximum - minimum + 1
+                points = [
+                    minimum + span * i // partitions for i in range(1, partitions)
+                ]
+            else:
+                points = [
+                    minimum + (maximum - minimum) * i / partitions
+                    for i in range(1, partitions)
+                ]
+        else:
+            count = await self.count(distinct=False)
+            points = [
+                await queryset.order_by(name)
+                .offset(count * i // partitions)
+                ._get_first_value(name)
+                for i in range(1, partitions)
+            ]
+        return [
+            point
+            for point in dict.fromkeys(points)
+            if point is not None and point > minimum
+        ]
+
+    async def _get_first_value(self, name: str) -> Any:
+        """
+        Returns the value of the field in the first row of the query.
+
+        :param name: name of the field
+        :type name: str
+        :return: value of the field or None if there are no rows
+        :rtype: Any
+        """
+        values = await self.limit(1, limit_raw_sql=True).values_list(name, flatten=True)
+        return values[0] if values else None
+
+    async def stream_blob(
+        self, field: str, pk: Any, chunk_size: int = 1024 * 1024
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Reads the value of LargeBinary field of a row with given pk in chunks,
+        so large values are never loaded into memory as a whole.
+
+        Each chunk is selected with separate query using substr() on the column,
+        filters of the queryset are applied to each query.
+
+        If the value is null an empty async generator is returned.
+
+        :raises NoMatch: if row with given pk does not exist
+        :raises QueryDefinitionError: if field is not a plain LargeBinary field
+        :param field: name of the LargeBinary field
+        :type field: str
+        :param pk: primary key of the row
+        :type pk: Any
+        :param chunk_size: max number of bytes in one chunk
+        :type chunk_size: int
+        :return: asynchronous generator of chunks of the value
+        :rtype: AsyncGenerator[bytes, None]
+        """
+        model_field = self.model_config.model_fields.get(field)
+        if (
+            model_field is None
+            or model_field.__type__ is not bytes
+            or model_field.encrypt_secret
+            or model_field.compress_backend != ormar.CompressBackends.NONE
+        ):
+            raise QueryDefinitionError(
+                f"Only not encrypted and not compressed LargeBinary fields can be "
+                f"streamed, {field} of {self.model.get_name()} is not one of them"
+            )
+        if chunk_size < 1:
+            raise QueryDefinitionError("Chunk size has to be a positive number")
+        column = self.table.columns[self.model.get_column_alias(field)]
+        pk_column = self.table.columns[
+            self.model.get_column_alias(self.model_config.pkname)
+        ]
+
+        def filtered(expr: sqlalchemy.sql.Select) -> sqlalchemy.sql.Select:
+            expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
+                expr.where(pk_column == pk)
+            )
+            return FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
+                expr
+            )
+
+        row = await self.database.fetch_one(
+            filtered(sqlalchemy.select([sqlalchemy.func.length(column)]))
+        )
+        if row is None:
+            raise NoMatch()
+        length = row[0] or 0
+        for start in range(0, length, chunk_size):
+            # sql substr() indexes from 1
+            chunk = sqlalchemy.func.substr(column, start + 1, chunk_size)
+            yield await self.database.fetch_val(
+                filtered(
+                    sqlalchemy.select([sqlalchemy.type_coerce(chunk, column.type)])
+                )
+            )
 
     async def create(self, **kwargs: Any) -> "T":
         """
@@ -1193,7 +2072,9 @@ class QuerySet(Generic[T]):
         All `Models` passed need to have primary key column populated.
 
         You can also select which fields to update by passing `columns` list
-        as a list of string names.
+        as a list of string names. By default only changed fields of each model
+        are updated (models with the same set of changed fields are updated
+        with one query), models without changes are skipped.
 
         Bulk operations do not send signals.
 
@@ -1205,20 +2086,11 @@ class QuerySet(Generic[T]):
         if not objects:
             raise ModelListEmptyError("Bulk update objects are empty!")
 
-        ready_objects = []
         pk_name = self.model_config.pkname
-        if not columns:
-            columns = list(
-                self.model.extract_db_own_fields().union(
-                    self.model.extract_related_names()
-                )
-            )
-
-        if pk_name not in columns:
-            columns.append(pk_name)
-
-        columns = [self.model.get_column_alias(k) for k in columns]
+        pk_column_name = self.model.get_column_alias(pk_name)
+        table_columns = [c.name for c in self.model_config.table.c]
 
+        ready_objects: Dict[Tuple[str, ...], List[Dict]] = {}
         for obj in objects:
             new_kwargs = obj.model_dump()
             if new_kwargs.get(pk_name) is None:
@@ -1226,29 +2098,34 @@ class QuerySet(Generic[T]):
                     "You cannot update unsaved objects. "
                     f"{self.model.__name__} has to have {pk_name} filled."
                 )
+            obj_columns = {
+                self.model.get_column_alias(k) for k in (columns or obj.changed_fields)
+            }
+            group = tuple(
+                c for c in table_columns if c in obj_columns and c != pk_column_name
+            )
+            if not group:
+                continue
             new_kwargs = obj.prepare_model_to_update(new_kwargs)
-            ready_objects.append(
-                {"new_" + k: v for k, v in new_kwargs.items() if k in columns}
+            ready_objects.setdefault(group, []).append(
+                {
+                    "new_" + k: v
+                    for k, v in new_kwargs.items()
+                    if k in group or k == pk_column_name
+                }
             )
             await asyncio.sleep(0)
 
-        pk_column = self.model_config.table.c.get(self.model.get_column_alias(pk_name))
-        pk_column_name = self.model.get_column_alias(pk_name)
-        table_columns = [c.name for c in self.model_config.table.c]
-        expr = self.table.update().where(
-            pk_column == bindparam("new_" + pk_column_name)
-        )
-        expr = expr.values(
-            **{
-                k: bindparam("new_" + k)
-                for k in columns
-                if k != pk_column_name and k in table_columns
-            }
-        )
-        # databases bind params only where query is passed as string
-        # otherwise it just passes all data to values and results in unconsumed columns
-        expr = str(expr)
-        await self.database.execute_many(expr, ready_objects)
+        pk_column = self.model_config.table.c.get(pk_column_name)
+        for group, group_objects in ready_objects.items():
+            expr = self.table.update().where(
+                pk_column == bindparam("new_" + pk_column_name)
+            )
+            expr = expr.values(**{k: bindparam("new_" + k) for k in group})
+            # databases bind params only where query is passed as string
+            # otherwise it just passes all data to values
+            # and results in unconsumed columns
+            await self.database.execute_many(str(expr), group_objects)
 
         for obj in objects:
             obj.set_save_status(True)
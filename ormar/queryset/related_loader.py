@@ -0,0 +1,139 @@
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Type, Union
+
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.field_accessor import FieldAccessor
+from ormar.queryset.utils import fetch_rows_by_pks
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+# number of primary keys in one IN (...) clause
+BATCH_SIZE = 500
+
+
+class ResultSet:
+    """
+    Weakly referenced models returned by one query.
+
+    Used to find the models loaded together with given model, so not loaded
+    related models of all of them can be fetched at once.
+    """
+
+    __slots__ = ("_models",)
+
+    def __init__(self) -> None:
+        self._models: List[weakref.ReferenceType] = []
+
+    def add(self, model: "Model") -> None:
+        """
+        Registers the model in the result set.
+
+        :param model: model returned by the query
+        :type model: Model
+        """
+        self._models.append(weakref.ref(model))
+        object.__setattr__(model, "_result_set", self)
+
+    @property
+    def models(self) -> List["Model"]:
+        """
+        Returns models from the result set that still exist.
+
+        :return: list of models
+        :rtype: List[Model]
+        """
+        models = (reference() for reference in self._models)
+        return [model for model in models if model is not None]
+
+
+async def load_related(
+    models: Sequence["Model"], related: Union[str, FieldAccessor, List]
+) -> Sequence["Model"]:
+    """
+    Loads not loaded related models (with only pk populated, that are set on
+    relations of models loaded without select_related) of given models.
+
+    For each level of the relation all not loaded related models are fetched
+    with one `SELECT ... WHERE pk IN (...)` query (per 500 primary keys) and
+    populated in place, so loading related models of a list of models does not
+    issue a query per model.
+
+    Related models that were already loaded are not fetched again, but the
+    nested relations are followed through them.
+
+    Only ForeignKey relations can be loaded this way, to fetch reverse and many
+    to many relations use `prefetch_related()`.
+
+    :raises QueryDefinitionError: if relation does not exist or is not a ForeignKey
+    :param models: models which related models should be loaded
+    :type models: Sequence[Model]
+    :param related: relation name(s), nested relations separated with '__'
+    :type related: Union[str, FieldAccessor, List[Union[str, FieldAccessor]]]
+    :return: passed models
+    :rtype: Sequence[Model]
+    """
+    if not isinstance(related, list):
+        related = [related]
+    for relation in related:
+        if isinstance(relation, FieldAccessor):
+            relation = relation._access_chain
+        current = list(models)
+        for name in relation.split("__"):
+            if not current:
+                break
+            current = await _load_relation(models=current, name=name)
+    return models
+
+
+async def _load_relation(models: List["Model"], name: str) -> List["Model"]:
+    """
+    Loads not loaded related models set on relation with given name.
+
+    :raises QueryDefinitionError: if relation does not exist or is not a ForeignKey
+    :param models: models which related models should be loaded
+    :type models: List[Model]
+    :param name: name of the relation
+    :type name: str
+    :return: unique related models of passed models
+    :rtype: List[Model]
+    """
+    model_cls = models[0].__class__
+    field = model_cls.ormar_config.model_fields.get(name)
+    if field is None or not field.is_relation or field.virtual or field.is_multi:
+        raise QueryDefinitionError(
+            f"{name} is not a ForeignKey relation of {model_cls.get_name()}, "
+            f"only ForeignKey relations can be loaded with load_related()."
+        )
+    related_models: Dict[int, "Model"] = {}
+    for model in models:
+        related_model = getattr(model, name)
+        if related_model is not None:
+            related_models.setdefault(id(related_model), related_model)
+    await load_pk_only_models(
+        model_cls=field.to,
+        models=[model for model in related_models.values() if model.__pk_only__],
+    )
+    return list(related_models.values())
+
+
+async def load_pk_only_models(model_cls: Type["Model"], models: List["Model"]) -> None:
+    """
+    Fetches own fields of pk only models with one query per batch of primary keys
+    and populates the models in place.
+
+    :param model_cls: class of the models
+    :type model_cls: Type[Model]
+    :param models: pk only models to load
+    :type models: List[Model]
+    """
+    models_by_pk: Dict[Any, List["Model"]] = {}
+    for model in models:
+        models_by_pk.setdefault(model.pk, []).append(model)
+    async for kwargs in fetch_rows_by_pks(
+        model_cls=model_cls, pks=list(models_by_pk), batch_size=BATCH_SIZE
+    ):
+        for model in models_by_pk.get(kwargs[model_cls.ormar_config.pkname], []):
+            model.update_from_dict(kwargs)
+            object.__setattr__(model, "__pk_only__", False)
+            model.set_save_status(True)
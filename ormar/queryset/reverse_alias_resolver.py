@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Type, cast
+from typing import TYPE_CHECKING, Dict, List, Tuple, Type, cast
 
 if TYPE_CHECKING:  # pragma: no cover
     from ormar import ForeignKeyField, Model
@@ -17,6 +17,7 @@ class ReverseAliasResolver:
         excludable: "ExcludableItems",
         select_related: List[str],
         exclude_through: bool = False,
+        add_pk_columns: bool = False,
     ) -> None:
         self.select_related = select_related
         self.model_cls = model_cls
@@ -25,6 +26,7 @@ class ReverseAliasResolver:
         )
         self.excludable = excludable
         self.exclude_through = exclude_through
+        self.add_pk_columns = add_pk_columns
 
         self._fields: Dict[str, "ForeignKeyField"] = dict()
         self._prefixes: Dict[str, str] = dict()
@@ -53,13 +55,35 @@ class ReverseAliasResolver:
                 allowed_columns = self.model_cls.own_table_columns(
                     model=self.model_cls,
                     excludable=self.excludable,
-                    add_pk_columns=False,
+                    use_alias=True,
+                    add_pk_columns=self.add_pk_columns,
                 )
                 if column_name in allowed_columns:
                     self._resolved_names[column_name] = column_name
 
         return self._resolved_names
 
+    def resolve_relations(self) -> Dict[str, Tuple[str, "ForeignKeyField", bool]]:
+        """
+        Returns selected relations with the table aliases used in the query.
+        Needs to be called after resolve_columns as it reuses the prefixes map.
+
+        Sample: "posts__user" -> ("xsd12df", user field, False)
+
+        :return: dictionary of relation string: (table alias, field, is through flag)
+        :rtype: Dict[str, Tuple[str, ForeignKeyField, bool]]
+        """
+        alias_manager = self.model_cls.ormar_config.alias_manager
+        relations = dict()
+        for prefix_name, relation_str in self._prefixes.items():
+            field = self._fields[prefix_name]
+            is_through = bool(
+                field.is_multi
+                and relation_str.rsplit("__", 1)[-1] == field.through.get_name()
+            )
+            relations[relation_str] = (alias_manager[prefix_name], field, is_through)
+        return relations
+
     def _resolve_column_with_prefix(self, column_name: str, prefix: str) -> None:
         """
         Takes the prefixed column, checks if field should be excluded, and if not
@@ -88,7 +112,8 @@ class ReverseAliasResolver:
             model=target_model,
             excludable=self.excludable,
             alias=prefix,
-            add_pk_columns=False,
+            use_alias=True,
+            add_pk_columns=self.add_pk_columns,
         )
         new_column_name = column_name.replace(f"{prefix}_", "")
         if new_column_name in allowed_columns:
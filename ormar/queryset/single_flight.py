@@ -0,0 +1,117 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+import databases
+import sqlalchemy
+
+from ormar.queryset.connections import in_transaction
+
+
+class SingleFlight:
+    """
+    Deduplicates identical read queries that run concurrently.
+
+    In flight queries are keyed by compiled sql, parameters and database.
+    First caller starts the query and all callers issuing the same query before it
+    completes wait for the same result, so the database runs the query only once.
+    The entry is removed as soon as the query completes, so results are not cached.
+
+    Queries run inside a transaction are shared only with queries on the same
+    connection, so uncommitted changes are not visible outside the transaction.
+    If the installed version of `databases` is not supported
+    (see `ormar.queryset.connections`) all queries are shared only that way.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(
+        self,
+        database: databases.Database,
+        expr: sqlalchemy.sql.ClauseElement,
+        fetch: Callable[[Any], Awaitable[Any]],
+        options: Hashable = None,
+    ) -> Any:
+        """
+        Runs the query with given fetch function or waits for the result of
+        identical query that is already running.
+
+        Options distinguish queries that are fetched with the same function but
+        return different results (i.e. with different decryption settings).
+
+        Query is run in a separate task, so cancellation of the caller that started
+        it does not cancel the query for other waiting callers.
+
+        :param database: database to query
+        :type database: databases.Database
+        :param expr: query to run
+        :type expr: sqlalchemy.sql.ClauseElement
+        :param fetch: function fetching the result of the query
+        :type fetch: Callable[[sqlalchemy.sql.ClauseElement], Awaitable[Any]]
+        :param options: additional settings of the fetch function
+        :type options: Hashable
+        :return: result of the query
+        :rtype: Any
+        """
+        key = self._get_key(database=database, expr=expr, fetch=fetch, options=options)
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch(expr))
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        """
+        Removes completed query, marks the exception as retrieved
+        in case all waiting callers were cancelled.
+
+        :param key: key of the query
+        :type key: Hashable
+        :param task: completed task of the query
+        :type task: asyncio.Future
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    def _get_key(
+        database: databases.Database,
+        expr: sqlalchemy.sql.ClauseElement,
+        fetch: Callable[[Any], Awaitable[Any]],
+        options: Hashable = None,
+    ) -> Tuple:
+        """
+        Builds the key of the query out of compiled sql, parameters, fetch
+        function with its options, database and the event loop.
+
+        :param database: database to query
+        :type database: databases.Database
+        :param expr: query to run
+        :type expr: sqlalchemy.sql.ClauseElement
+        :param fetch: function fetching the result of the query
+        :type fetch: Callable[[sqlalchemy.sql.ClauseElement], Awaitable[Any]]
+        :param options: additional settings of the fetch function
+        :type options: Hashable
+        :return: key of the query
+        :rtype: Tuple
+        """
+        compiled = expr.compile(dialect=database._backend._dialect)
+        params = tuple(
+            sorted((name, repr(value)) for name, value in compiled.params.items())
+        )
+        return (
+            id(asyncio.get_running_loop()),
+            id(database),
+            id(database.connection()) if in_transaction(database) else None,
+            getattr(fetch, "__name__", None),
+            options,
+            str(compiled),
+            params,
+        )
+
+
+in_flight_queries = SingleFlight()
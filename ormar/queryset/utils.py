@@ -3,15 +3,21 @@ import copy
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
     Union,
+    get_args,
 )
 
+import pydantic
+import sqlalchemy
+
 if TYPE_CHECKING:  # pragma no cover
     from ormar import BaseField, Model
 
@@ -262,3 +268,141 @@ def _process_through_field(
     else:
         relation = related_field.related_name
     return previous_model, relation, is_through
+
+
+def get_pydantic_projection(
+    model_cls: Type["Model"], pydantic_model: Type[pydantic.BaseModel]
+) -> Tuple[Dict, List[str]]:
+    """
+    Translates fields of pydantic model (i.e. created with get_pydantic) into
+    fields() dictionary and list of relations to select_related, so only columns
+    required by the pydantic model are selected.
+
+    Fields not present in ormar model are skipped.
+
+    :param model_cls: source ormar model
+    :type model_cls: Type[Model]
+    :param pydantic_model: target pydantic model
+    :type pydantic_model: Type[pydantic.BaseModel]
+    :return: fields dictionary and list of related names
+    :rtype: Tuple[Dict, List[str]]
+    """
+    related: List[str] = []
+    fields = _populate_pydantic_projection(
+        model_cls=model_cls,
+        pydantic_model=pydantic_model,
+        related=related,
+        relation_str="",
+        visited={pydantic_model},
+    )
+    return fields, related
+
+
+def _populate_pydantic_projection(
+    model_cls: Type["Model"],
+    pydantic_model: Type[pydantic.BaseModel],
+    related: List[str],
+    relation_str: str,
+    visited: Set[Type[pydantic.BaseModel]],
+) -> Dict:
+    """
+    Recursively builds fields() dictionary for given pydantic model,
+    registering visited relations in related list.
+
+    :param model_cls: ormar model matching the pydantic model
+    :type model_cls: Type[Model]
+    :param pydantic_model: pydantic model to project
+    :type pydantic_model: Type[pydantic.BaseModel]
+    :param related: list of relations to select, populated in place
+    :type related: List[str]
+    :param relation_str: relation string leading to current model
+    :type relation_str: str
+    :param visited: pydantic models already in current relation chain
+    :type visited: Set[Type[pydantic.BaseModel]]
+    :return: fields dictionary for current model
+    :rtype: Dict
+    """
+    fields: Dict = dict()
+    model_fields = model_cls.ormar_config.model_fields
+    for name in pydantic_model.model_fields:
+        field = model_fields.get(name)
+        if field is None or field.is_through:
+            continue
+        if not field.is_relation:
+            fields[name] = ...
+            continue
+        target = _get_pydantic_model_from_annotation(
+            pydantic_model.model_fields[name].annotation
+        )
+        if target is None or target in visited:
+            if not field.virtual and not field.is_multi:
+                fields[name] = ...
+            continue
+        nested_relation_str = f"{relation_str}__{name}" if relation_str else name
+        related.append(nested_relation_str)
+        fields[name] = _populate_pydantic_projection(
+            model_cls=field.to,
+            pydantic_model=target,
+            related=related,
+            relation_str=nested_relation_str,
+            visited={*visited, target},
+        ) or {field.to.ormar_config.pkname: ...}
+    return fields
+
+
+def _get_pydantic_model_from_annotation(
+    annotation: Any,
+) -> Optional[Type[pydantic.BaseModel]]:
+    """
+    Extracts pydantic model from (possibly nested) annotation
+    like Optional[Model] or List[Model].
+
+    :param annotation: annotation of pydantic field
+    :type annotation: Any
+    :return: pydantic model if found
+    :rtype: Optional[Type[pydantic.BaseModel]]
+    """
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _get_pydantic_model_from_annotation(arg)
+        if model is not None:
+            return model
+    return None
+
+
+async def fetch_rows_by_pks(
+    model_cls: Type["Model"],
+    pks: Sequence[Any],
+    fields: Optional[Sequence[str]] = None,
+    batch_size: int = 500,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Fetches rows of the model table with given primary keys, with one
+    `WHERE pk IN (...)` query per batch of batch_size primary keys.
+
+    :param model_cls: class of the model
+    :type model_cls: Type[Model]
+    :param pks: primary keys of the rows
+    :type pks: Sequence[Any]
+    :param fields: names of fields to select (pk is always selected), all if None
+    :type fields: Optional[Sequence[str]]
+    :param batch_size: max number of primary keys in one query
+    :type batch_size: int
+    :return: asynchronous generator of rows with fields names as keys
+    :rtype: AsyncGenerator[Dict[str, Any], None]
+    """
+    table = model_cls.ormar_config.table
+    pk_column = table.columns[model_cls.get_column_alias(model_cls.ormar_config.pkname)]
+    columns = (
+        [pk_column]
+        + [table.columns[model_cls.get_column_alias(name)] for name in fields]
+        if fields is not None
+        else list(table.columns)
+    )
+    for start in range(0, len(pks), batch_size):
+        expr = sqlalchemy.select(columns).where(
+            pk_column.in_(pks[start : start + batch_size])
+        )
+        for row in await model_cls.ormar_config.database.fetch_all(expr):
+            yield model_cls.translate_aliases_to_columns(dict(row))
@@ -0,0 +1,322 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import sqlalchemy
+
+from ormar.queryset.related_loader import load_pk_only_models
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+T = TypeVar("T", bound="Model")
+
+PendingWrite = Tuple["Model", Dict[str, Any], asyncio.Future]
+
+_NOT_CHECKED = object()
+
+
+class WriteBuffer(Generic[T]):
+    """
+    Write-behind buffer that batches inserts of models.
+
+    Models enqueued with `create()` or `save()` are collected for up to
+    max_delay_ms milliseconds (or until max_batch models are collected)
+    and inserted with one multi-row `INSERT` query by a background task.
+    Each awaiter receives its own saved model or the exception raised for its row.
+
+    Primary keys generated by the database are fetched with `RETURNING` on backends
+    that support it and calculated from the id of the inserted rows on sqlite
+    and mysql (for autoincrement primary keys). If neither is possible rows
+    without primary key are inserted one by one in one transaction.
+
+    As with bulk operations, signals are not sent.
+    """
+
+    def __init__(
+        self, model: Type[T], max_batch: int = 500, max_delay_ms: float = 5
+    ) -> None:
+        self.model = model
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self._pending: List[PendingWrite] = []
+        self._handle: Optional[Union[asyncio.Handle, asyncio.TimerHandle]] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._autoincrement_step: Any = _NOT_CHECKED
+
+    async def __aenter__(self) -> "WriteBuffer[T]":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.flush()
+
+    async def create(self, **kwargs: Any) -> T:
+        """
+        Creates the model with given kwargs and saves it in a batch with other
+        models enqueued at the same time.
+
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: saved model
+        :rtype: Model
+        """
+        return await self.save(self.model(**kwargs))
+
+    async def save(self, instance: T) -> T:
+        """
+        Saves the model in a batch with other models enqueued at the same time.
+
+        Values of the model are prepared (i.e. default values are populated)
+        when the model is enqueued.
+
+        :param instance: model to save
+        :type instance: Model
+        :return: saved model
+        :rtype: Model
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((instance, instance._prepare_insert_values(), future))
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        elif self._handle is None:
+            self._handle = (
+                loop.call_later(self.max_delay_ms / 1000, self._dispatch)
+                if self.max_delay_ms
+                else loop.call_soon(self._dispatch)
+            )
+        return await future
+
+    async def flush(self) -> None:
+        """
+        Inserts all enqueued models and waits until all started inserts complete.
+        """
+        self._dispatch()
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _dispatch(self) -> None:
+        """
+        Starts the insert of collected models and resets the batch.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._write(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, pending: List[PendingWrite]) -> None:
+        """
+        Inserts collected models, grouped by the set of inserted columns,
+        and resolves the awaiters.
+
+        If the batch insert fails each model of the batch is inserted separately,
+        so each awaiter receives the exception raised for its own row.
+
+        :param pending: models, values to insert and awaiters
+        :type pending: List[PendingWrite]
+        """
+        groups: Dict[Tuple[str, ...], List[PendingWrite]] = {}
+        for write in pending:
+            groups.setdefault(tuple(sorted(write[1])), []).append(write)
+        saved: List["Model"] = []
+        for writes in groups.values():
+            try:
+                await self._insert_batch(writes)
+                saved.extend(instance for instance, _, _ in writes)
+            except Exception:
+                for instance, values, future in writes:
+                    try:
+                        await self._insert_one(instance, values)
+                        saved.append(instance)
+                    except Exception as exc:
+                        if not future.done():
+                            future.set_exception(exc)
+        try:
+            await self._refresh_server_defaults(pending, saved)
+        except Exception as exc:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for instance, _, future in pending:
+            if not future.done():
+                future.set_result(instance)
+
+    async def _insert_batch(self, writes: List[PendingWrite]) -> None:
+        """
+        Inserts models with the same set of columns with one query.
+
+        :param writes: models, values to insert and awaiters
+        :type writes: List[PendingWrite]
+        """
+        config = self.model.ormar_config
+        rows = [values for _, values, _ in writes]
+        expr = config.table.insert().values(rows)
+        if self.model.get_column_alias(config.pkname) in rows[0]:
+            await config.database.execute(expr)
+        elif not await self._insert_with_generated_pks(writes, expr):
+            async with config.database.transaction():
+                for instance, values, _ in writes:
+                    await self._insert_one(instance, values, set_status=False)
+        for instance, _, _ in writes:
+            instance.set_save_status(True)
+
+    async def _insert_with_generated_pks(
+        self, writes: List[PendingWrite], expr: sqlalchemy.sql.Insert
+    ) -> bool:
+        """
+        Inserts models without primary key with one multi-row query and sets
+        primary keys generated by the database on the models.
+
+        With `RETURNING` returned rows are matched with the models by the value
+        of unique column if the models have one, otherwise autoincrement
+        primary keys (assigned in order of inserted rows) are sorted and set in
+        order of the models, so the order of returned rows does not matter.
+        Without `RETURNING` (sqlite, mysql) consecutive autoincrement primary keys
+        are calculated from the id of the last (sqlite) or first (mysql) row.
+
+        :param writes: models, values to insert and awaiters
+        :type writes: List[PendingWrite]
+        :param expr: multi-row insert query
+        :type expr: sqlalchemy.sql.Insert
+        :return: flag if the models were inserted
+        :rtype: bool
+        """
+        config = self.model.ormar_config
+        database = config.database
+        pk_column = config.table.columns[self.model.get_column_alias(config.pkname)]
+        autoincrement = config.model_fields[config.pkname].autoincrement
+        if getattr(database._backend._dialect, "full_returning", False):
+            unique_alias = self._get_unique_alias(writes)
+            if unique_alias is not None:
+                returned = await database.fetch_all(
+                    expr.returning(pk_column, config.table.columns[unique_alias])
+                )
+                pks = {row[1]: row[0] for row in returned}
+                generated = [pks[values[unique_alias]] for _, values, _ in writes]
+            elif autoincrement:
+                returned = await database.fetch_all(expr.returning(pk_column))
+                generated = sorted(row[0] for row in returned)
+            else:
+                return False
+        else:
+            increment = await self._get_autoincrement_step() if autoincrement else None
+            if increment is None:
+                return False
+            pk = await database.execute(expr)
+            if database._backend._dialect.name == "sqlite":
+                pk -= (len(writes) - 1) * increment
+            generated = [pk + index * increment for index in range(len(writes))]
+        for (instance, _, _), pk in zip(writes, generated):
+            setattr(instance, config.pkname, pk)
+        return True
+
+    def _get_unique_alias(self, writes: List[PendingWrite]) -> Optional[str]:
+        """
+        Returns the alias of unique not encrypted string or integer column with
+        different values set in all the models, used to match returned rows.
+
+        :param writes: models, values to insert and awaiters
+        :type writes: List[PendingWrite]
+        :return: alias of the column if there is one
+        :rtype: Optional[str]
+        """
+        for field in self.model.ormar_config.model_fields.values():
+            alias = field.get_alias()
+            if (
+                field.unique
+                and not field.primary_key
+                and not field.encrypt_secret
+                and field.__type__ in (str, int)
+            ):
+                column_values = [values.get(alias) for _, values, _ in writes]
+                if None not in column_values and len(set(column_values)) == len(
+                    column_values
+                ):
+                    return alias
+        return None
+
+    async def _get_autoincrement_step(self) -> Optional[int]:
+        """
+        Returns the step between autoincrement primary keys of the rows inserted
+        with one multi-row query, if the database assigns them consecutively.
+
+        Sqlite assigns consecutive rowids, mysql only with innodb_autoinc_lock_mode
+        0 or 1 (in interleaved mode 2 keys of one query can have gaps).
+        Mysql settings are checked once per buffer.
+
+        :return: step between primary keys or None if keys can have gaps
+        :rtype: Optional[int]
+        """
+        database = self.model.ormar_config.database
+        dialect_name = database._backend._dialect.name
+        if dialect_name == "sqlite":
+            return 1
+        if dialect_name != "mysql":
+            return None
+        if self._autoincrement_step is _NOT_CHECKED:
+            row = await database.fetch_one(
+                "SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment"
+            )
+            self._autoincrement_step = (
+                int(row[1]) if row is not None and int(row[0]) in (0, 1) else None
+            )
+        return cast(Optional[int], self._autoincrement_step)
+
+    async def _insert_one(
+        self, instance: "Model", values: Dict[str, Any], set_status: bool = True
+    ) -> None:
+        """
+        Inserts one model, the same way as `Model.save()` does.
+
+        :param instance: model to save
+        :type instance: Model
+        :param values: values to insert
+        :type values: Dict[str, Any]
+        :param set_status: flag if save status should be set
+        :type set_status: bool
+        """
+        expr = self.model.ormar_config.table.insert().values(**values)
+        pk = await self.model.ormar_config.database.execute(expr)
+        if pk and isinstance(pk, instance.pk_type()):
+            setattr(instance, self.model.ormar_config.pkname, pk)
+        if set_status:
+            instance.set_save_status(True)
+
+    async def _refresh_server_defaults(
+        self, pending: List[PendingWrite], saved: List["Model"]
+    ) -> None:
+        """
+        Loads values populated server side for saved models that did not have
+        them set, with one query per batch of primary keys.
+
+        :param pending: models, values to insert and awaiters
+        :type pending: List[PendingWrite]
+        :param saved: successfully saved models
+        :type saved: List[Model]
+        """
+        saved_ids = {id(instance) for instance in saved}
+        to_refresh = [
+            instance
+            for instance, values, _ in pending
+            if id(instance) in saved_ids
+            and self.model._has_missing_server_defaults(values)
+        ]
+        if to_refresh:
+            await load_pk_only_models(self.model, to_refresh)
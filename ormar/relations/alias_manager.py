@@ -154,6 +154,7 @@ class AliasManager:
         """
         alias = get_table_alias()
         self._aliases_new[alias_key] = alias
+        self._reversed_aliases = dict()
         return alias
 
     def resolve_relation_alias(
@@ -17,6 +17,8 @@ from typing import (  # noqa: I100, I201
     cast,
 )
 
+import pydantic
+
 import ormar  # noqa: I100, I202
 from ormar.exceptions import ModelPersistenceError, NoMatch, QueryDefinitionError
 
@@ -28,6 +30,8 @@ if TYPE_CHECKING:  # pragma no cover
 else:
     T = TypeVar("T", bound="Model")
 
+P = TypeVar("P", bound=pydantic.BaseModel)
+
 
 class QuerysetProxy(Generic[T]):
     """
@@ -289,6 +293,7 @@ class QuerysetProxy(Generic[T]):
         self,
         fields: Union[List, str, Set, Dict, None] = None,
         exclude_through: bool = False,
+        nested: bool = False,
     ) -> List:
         """
         Return a list of dictionaries with column values in order of the fields
@@ -301,13 +306,55 @@ class QuerysetProxy(Generic[T]):
 
         :param exclude_through: flag if through models should be excluded
         :type exclude_through: bool
+        :param nested: flag if related models should be nested
+        :type nested: bool
         :param fields: field name or list of field names to extract from db
         :type fields:  Union[List, str, Set, Dict]
         """
         return await self.queryset.values(
-            fields=fields, exclude_through=exclude_through
+            fields=fields, exclude_through=exclude_through, nested=nested
         )
 
+    async def iterate_values(
+        self,
+        fields: Union[List, str, Set, Dict, None] = None,
+        exclude_through: bool = False,
+        nested: bool = False,
+    ) -> AsyncGenerator[Dict, None]:
+        """
+        Return async iterable generator of dictionaries with column values,
+        same as in values() but without fetching all rows at once.
+
+        Actual call delegated to QuerySet.
+
+        :param exclude_through: flag if through models should be excluded
+        :type exclude_through: bool
+        :param nested: flag if related models should be nested
+        :type nested: bool
+        :param fields: field name or list of field names to extract from db
+        :type fields:  Union[List, str, Set, Dict]
+        :return: asynchronous iterable generator of dictionaries
+        :rtype: AsyncGenerator[Dict]
+        """
+        async for item in self.queryset.iterate_values(
+            fields=fields, exclude_through=exclude_through, nested=nested
+        ):
+            yield item
+
+    async def as_model(self, pydantic_model: Type[P]) -> List[P]:
+        """
+        Returns a list of pydantic models (i.e. created with get_pydantic())
+        instead of ormar models, selecting only the columns they need.
+
+        Actual call delegated to QuerySet.
+
+        :param pydantic_model: pydantic model to return
+        :type pydantic_model: Type[pydantic.BaseModel]
+        :return: list of pydantic models
+        :rtype: List[pydantic.BaseModel]
+        """
+        return await self.queryset.as_model(pydantic_model)
+
     async def values_list(
         self,
         fields: Union[List, str, Set, Dict, None] = None,
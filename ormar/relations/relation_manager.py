@@ -12,6 +12,9 @@ if TYPE_CHECKING:  # pragma no cover
 class RelationsManager:
     """
     Manages relations on a Model, each Model has it's own instance.
+
+    Relation instances are created lazily, on first access to given relation,
+    so models that never touch their relations do not pay for them.
     """
 
     def __init__(
@@ -21,10 +24,8 @@ class RelationsManager:
     ) -> None:
         self.owner = proxy(owner)
         self._related_fields = related_fields or []
-        self._related_names = [field.name for field in self._related_fields]
+        self._related_names = {field.name for field in self._related_fields}
         self._relations: Dict[str, Relation] = dict()
-        for field in self._related_fields:
-            self._add_relation(field)
 
     def __contains__(self, item: str) -> bool:
         """
@@ -38,6 +39,10 @@ class RelationsManager:
         return item in self._related_names
 
     def clear(self) -> None:
+        """
+        Clears all already initialized relations.
+        Not initialized relations cannot hold any related models.
+        """
         for relation in self._relations.values():
             relation.clear()
 
@@ -51,7 +56,7 @@ class RelationsManager:
         :return: related model or list of related models if set
         :rtype: Optional[Union[Model, List[Model]]
         """
-        relation = self._relations.get(name, None)
+        relation = self._get(name)
         if relation is not None:
             return relation.get()
         return None  # pragma nocover
@@ -127,6 +132,7 @@ class RelationsManager:
     def _get(self, name: str) -> Optional[Relation]:
         """
         Returns the actual relation and not the related model(s).
+        If the relation was not yet accessed it's initialized on the fly.
 
         :param name: name of the relation
         :type name: str
@@ -136,8 +142,21 @@ class RelationsManager:
         relation = self._relations.get(name, None)
         if relation is not None:
             return relation
+        if name in self._related_names:
+            return self._add_relation(self._get_field(name))
         return None
 
+    def _get_field(self, name: str) -> "ForeignKeyField":
+        """
+        Returns the relation field with given name.
+
+        :param name: name of the relation
+        :type name: str
+        :return: field with relation declaration
+        :rtype: ForeignKeyField
+        """
+        return next(field for field in self._related_fields if field.name == name)
+
     def _get_relation_type(self, field: "BaseField") -> RelationType:
         """
         Returns type of the relation declared on a field.
@@ -153,18 +172,22 @@ class RelationsManager:
             return RelationType.THROUGH
         return RelationType.PRIMARY if not field.virtual else RelationType.REVERSE
 
-    def _add_relation(self, field: "BaseField") -> None:
+    def _add_relation(self, field: "BaseField") -> Relation:
         """
         Registers relation in the manager.
         Adds Relation instance under field.name.
 
         :param field: field with relation declaration
         :type field: BaseField
+        :return: registered Relation instance
+        :rtype: ormar.relations.relation.Relation
         """
-        self._relations[field.name] = Relation(
+        relation: Relation = Relation(
             manager=self,
             type_=self._get_relation_type(field),
             field_name=field.name,
             to=field.to,
             through=getattr(field, "through", None),
         )
+        self._relations[field.name] = relation
+        return relation
@@ -42,9 +42,8 @@ class RelationProxy(Generic[T], List[T]):
         self.type_: "RelationType" = type_
         self.field_name = field_name
         self._owner: "Model" = self.relation.manager.owner
-        self.queryset_proxy: QuerysetProxy[T] = QuerysetProxy[T](
-            relation=self.relation, to=to, type_=type_
-        )
+        self._to: Type["T"] = to
+        self._queryset_proxy: Optional[QuerysetProxy[T]] = None
         self._related_field_name: Optional[str] = None
 
         self._relation_cache: Dict[int, int] = {}
@@ -61,6 +60,22 @@ class RelationProxy(Generic[T], List[T]):
                     pass
         super().__init__(validated_data or ())
 
+    @property
+    def queryset_proxy(self) -> QuerysetProxy[T]:
+        """
+        On first access initializes the QuerysetProxy of the relation, later stored
+        in _queryset_proxy property, so relations that are never queried do not
+        allocate it.
+
+        :return: QuerysetProxy of the relation
+        :rtype: QuerysetProxy
+        """
+        if self._queryset_proxy is None:
+            self._queryset_proxy = QuerysetProxy[T](
+                relation=self.relation, to=self._to, type_=self.type_
+            )
+        return self._queryset_proxy
+
     @property
     def related_field_name(self) -> str:
         """
@@ -0,0 +1,75 @@
+"""
+Starlette/FastAPI response that serializes ormar models directly to json bytes.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Set, Union
+
+try:
+    from starlette.background import BackgroundTask
+    from starlette.responses import Response
+except ImportError as exc:
+    raise ImportError(
+        "OrmarJSONResponse requires 'starlette' (installed with 'fastapi'), "
+        "install it to use ormar.responses."
+    ) from exc
+
+import ormar
+from ormar.models.json_dump import dump_json_many, dumps
+
+
+class OrmarJSONResponse(Response):
+    """
+    Response rendering ormar model or list of models with orjson (if installed)
+    in one pass, skipping the FastAPI validation and jsonable_encoder round trip.
+
+    Return it directly from the endpoint, output has the same shape
+    as model_dump_json() of the returned model(s).
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        *,
+        include: Union[Set, Dict, None] = None,
+        exclude: Union[Set, Dict, None] = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        exclude_primary_keys: bool = False,
+        exclude_through_models: bool = False,
+    ) -> None:
+        self.dump_kwargs: Dict[str, Any] = dict(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            exclude_primary_keys=exclude_primary_keys,
+            exclude_through_models=exclude_through_models,
+        )
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        """
+        Renders model, list of models or plain json compatible data into bytes.
+
+        :param content: content to render
+        :type content: Any
+        :return: json encoded content
+        :rtype: bytes
+        """
+        if isinstance(content, ormar.Model):
+            return dumps(content.model_dump(**self.dump_kwargs), content.__class__)
+        if isinstance(content, (list, tuple)) and all(
+            isinstance(item, ormar.Model) for item in content
+        ):
+            return dump_json_many(content, **self.dump_kwargs)
+        return dumps(content, ormar.Model)
@@ -0,0 +1,44 @@
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence, Type
+
+import databases
+import pytest
+
+
+@pytest.fixture()
+def count_queries(monkeypatch) -> Callable[..., List[Any]]:
+    """
+    Returns a function that patches query methods of the database to record
+    the executed queries and returns the list the queries are appended to.
+
+    Optionally each query waits for delay seconds before it's executed (to make
+    the queries overlap), only queries of query_type are recorded, and queries
+    with `_fail` attribute set raise RuntimeError.
+    """
+
+    def patch(
+        database: databases.Database,
+        methods: Sequence[str] = ("fetch_all",),
+        delay: float = 0.0,
+        query_type: Optional[Type] = None,
+    ) -> List[Any]:
+        executed: List[Any] = []
+
+        def counting(method: Callable) -> Callable:
+            async def counting_method(query: Any, *args: Any, **kwargs: Any) -> Any:
+                if query_type is None or isinstance(query, query_type):
+                    executed.append(query)
+                if delay:
+                    await asyncio.sleep(delay)
+                if getattr(query, "_fail", False):
+                    raise RuntimeError("Query failed")
+                return await method(query, *args, **kwargs)
+
+            counting_method.__name__ = method.__name__
+            return counting_method
+
+        for name in methods:
+            monkeypatch.setattr(database, name, counting(getattr(database, name)))
+        return executed
+
+    return patch
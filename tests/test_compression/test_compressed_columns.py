@@ -0,0 +1,165 @@
+# type: ignore
+import threading
+import zlib
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import ModelDefinitionError
+from ormar.fields.sqlalchemy_compressed import RAW_MARKER, ZlibBackend
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+decompressing_threads = set()
+
+
+class ThreadRecordingBackend(ormar.CompressBackend):
+    marker = b"t"
+
+    def compress(self, value: bytes) -> bytes:
+        return zlib.compress(value)
+
+    def decompress(self, value: bytes) -> bytes:
+        decompressing_threads.add(threading.current_thread().name)
+        return zlib.decompress(value)
+
+
+class Article(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="articles")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    body: Optional[str] = ormar.Text(compress=True, nullable=True)
+    meta = ormar.JSON(compress=True, nullable=True, compress_min_size=16)
+    cover: Optional[bytes] = ormar.LargeBinary(
+        max_length=10**6,
+        nullable=True,
+        compress_backend=ormar.CompressBackends.CUSTOM,
+        compress_custom_backend=ThreadRecordingBackend,
+    )
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_only_some_fields_can_be_compressed():
+    with pytest.raises(ModelDefinitionError):
+        ormar.String(max_length=10, compress=True)
+
+    with pytest.raises(ModelDefinitionError):
+        ormar.Text(
+            compress=True,
+            encrypt_secret="secret",
+            encrypt_backend=ormar.EncryptBackends.FERNET,
+        )
+
+    class NoMarkerBackend(ormar.CompressBackend):
+        def compress(self, value: bytes) -> bytes:  # pragma: no cover
+            return value
+
+        def decompress(self, value: bytes) -> bytes:  # pragma: no cover
+            return value
+
+    with pytest.raises(ModelDefinitionError):
+
+        class BrokenArticle(ormar.Model):
+            ormar_config = base_ormar_config.copy(tablename="broken_articles")
+
+            id: int = ormar.Integer(primary_key=True)
+            body: str = ormar.Text(
+                compress_backend=ormar.CompressBackends.CUSTOM,
+                compress_custom_backend=NoMarkerBackend,
+            )
+
+
+@pytest.mark.asyncio
+async def test_values_are_compressed_above_threshold():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            body = "lorem ipsum " * 1000
+            await Article.objects.create(
+                title="long", body=body, meta={"tags": ["a"] * 100}, cover=b"x" * 5000
+            )
+            await Article.objects.create(title="short", body="short", meta=[1])
+            await Article.objects.create(title="empty")
+
+            rows = await base_ormar_config.database.fetch_all(
+                "SELECT body, meta, cover FROM articles ORDER BY id"
+            )
+            assert rows[0][0][:1] == ZlibBackend.marker
+            assert len(rows[0][0]) < len(body)
+            assert rows[0][1][:1] == ZlibBackend.marker
+            assert rows[0][2][:1] == ThreadRecordingBackend.marker
+            assert rows[1][0] == RAW_MARKER + b"short"
+            assert rows[1][1] == RAW_MARKER + b"[1]"
+            assert list(rows[2]) == [None, None, None]
+
+            articles = await Article.objects.order_by("id").all()
+            assert articles[0].body == body
+            assert articles[0].meta == {"tags": ["a"] * 100}
+            assert articles[0].cover == b"x" * 5000
+            assert articles[1].body == "short"
+            assert articles[1].meta == [1]
+            assert articles[2].body is None
+
+            assert await Article.objects.order_by("id").values_list(
+                ["body", "meta"], flatten=False
+            ) == [(body, {"tags": ["a"] * 100}), ("short", [1]), (None, None)]
+
+
+@pytest.mark.asyncio
+async def test_compressed_values_are_updated():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            article = await Article.objects.create(title="a", body="a" * 1000)
+            article.body = "b" * 1000
+            article.meta = {"bulk": True}
+            await Article.objects.bulk_update([article])
+            article = await Article.objects.get()
+            assert article.body == "b" * 1000
+            assert article.meta == {"bulk": True}
+
+            await Article.objects.filter(id=article.id).update(
+                body="c" * 1000, meta={"update": True}
+            )
+            await article.load()
+            assert article.body == "c" * 1000
+            assert article.meta == {"update": True}
+
+
+@pytest.mark.asyncio
+async def test_decompression_can_be_offloaded_to_executor():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            for i in range(5):
+                await Article.objects.create(title=str(i), cover=bytes([i]) * 5000)
+
+            decompressing_threads.clear()
+            articles = await Article.objects.order_by("id").all()
+            assert decompressing_threads == {threading.current_thread().name}
+
+            decompressing_threads.clear()
+            offloaded = await (
+                Article.objects.order_by("id").offload_decompression(batch_size=2).all()
+            )
+            assert [article.cover for article in offloaded] == [
+                article.cover for article in articles
+            ]
+            assert threading.current_thread().name not in decompressing_threads
+
+
+def test_values_compressed_with_other_builtin_backend_can_be_read():
+    column_type = Article.ormar_config.table.columns["cover"].type
+    value = ZlibBackend.marker + zlib.compress(b"y" * 1000)
+    assert column_type.process_result_value(value, dialect=None) == b"y" * 1000
+
+
+def test_zstd_compression():
+    pytest.importorskip("zstandard")
+    field = ormar.Text(compress_backend=ormar.CompressBackends.ZSTD)
+    column_type = field.get_column("text").type
+    value = column_type.process_bind_param("z" * 1000, dialect=None)
+    assert value[:1] == b"\x02"
+    assert column_type.process_result_value(value, dialect=None) == "z" * 1000
@@ -0,0 +1,76 @@
+# type: ignore
+from typing import ForwardRef, List, Optional
+
+import ormar
+import pytest
+from ormar.models.helpers import pydantic as pydantic_helpers
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+PersonRef = ForwardRef("Person")
+PostRef = ForwardRef("Post")
+CategoryRef = ForwardRef("Category")
+
+
+class Person(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="persons")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    favourite: Optional[PostRef] = ormar.ForeignKey(
+        PostRef, related_name="fans", nullable=True
+    )
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[PersonRef] = ormar.ForeignKey(PersonRef)
+    categories: Optional[List[CategoryRef]] = ormar.ManyToMany(CategoryRef)
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    owner: Optional[PersonRef] = ormar.ForeignKey(PersonRef, related_name="owned")
+
+
+ormar.update_forward_refs([Person, Post, Category])
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_models_are_updated_in_batch():
+    assert pydantic_helpers.postponed_rebuilds is None
+    for model_cls in [Person, Post, Category]:
+        assert not model_cls.ormar_config.requires_ref_update
+        assert model_cls.__pydantic_complete__
+    assert {"owned", "posts"} <= set(Person.model_fields)
+    assert {"fans", "categories"} <= set(Post.model_fields)
+    assert Person(name="Jane", owned=[{"name": "news"}]).owned[0].name == "news"
+
+
+@pytest.mark.asyncio
+async def test_queries_on_models_updated_in_batch():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            person = await Person.objects.create(name="Jane")
+            news = await Category.objects.create(name="news", owner=person)
+            post = await Post.objects.create(title="Hello", author=person)
+            await post.categories.add(news)
+            await person.update(favourite=post)
+
+            person = await Person.objects.select_related(
+                ["owned", "posts__categories", "favourite"]
+            ).get()
+            assert person.owned[0].name == "news"
+            assert person.posts[0].categories[0].name == "news"
+            assert person.favourite.title == "Hello"
+            assert person.model_dump()["posts"][0]["categories"][0]["name"] == "news"
@@ -256,3 +256,17 @@ async def test_related_model_fields_properly_decrypted():
         report2 = await Report.objects.select_related("filters__hash").get()
         assert report2.filters[0].name == "test1"
         assert report2.filters[0].hash.name == hashed_test1
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_encrypts_values():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            hash1 = await Hash(name="test1").save()
+            hash1.name = "test2"
+            await Hash.objects.bulk_update([hash1])
+
+            secret = hashlib.sha256("udxc32".encode()).digest()
+            secret = base64.urlsafe_b64encode(secret)
+            hashed_test2 = hashlib.sha512(secret + "test2".encode()).hexdigest()
+            assert (await Hash.objects.get(id=hash1.id)).name == hashed_test2
@@ -0,0 +1,100 @@
+# type: ignore
+from typing import List
+
+import ormar
+import pytest
+from ormar import ModelDefinitionError
+from ormar.fields.sqlalchemy_encrypted import (
+    FernetBackend,
+    HashBackend,
+    get_backend,
+    get_key_digest,
+)
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+secrets: List[str] = ["first-key"]
+
+
+def get_secrets() -> List[str]:
+    return list(secrets)
+
+
+class Secret(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="secrets")
+
+    id: int = ormar.Integer(primary_key=True)
+    value: str = ormar.String(
+        max_length=100,
+        encrypt_secret=get_secrets,
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+    note: str = ormar.String(
+        max_length=100,
+        nullable=True,
+        encrypt_secret=["first-key"],
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_backends_are_cached_per_column_by_key_digest():
+    column_type = Secret.ormar_config.table.c.get("value").type
+    column_type._refresh()
+    backend = column_type.backend
+    column_type._refresh()
+    assert column_type.backend is backend
+    assert column_type._backend_digest == get_key_digest(("first-key",))
+    assert get_key_digest(("first-key",)) != get_key_digest(("first", "-key"))
+    assert "first-key" not in vars(column_type).values()
+
+    secrets.insert(0, "second-key")
+    try:
+        column_type._refresh()
+        assert column_type.backend is not backend
+    finally:
+        secrets.remove("second-key")
+    column_type._refresh()
+    assert column_type._backend_digest == get_key_digest(("first-key",))
+
+    note_type = Secret.ormar_config.table.c.get("note").type
+    note_type._refresh()
+    backend = note_type.backend
+    note_type._refresh()
+    assert note_type.backend is backend
+
+
+def test_rotation_not_supported_by_hash_backend():
+    with pytest.raises(ModelDefinitionError):
+        get_backend(HashBackend, ("new", "old"))
+    with pytest.raises(ModelDefinitionError):
+        get_backend(FernetBackend, ())
+
+
+@pytest.mark.asyncio
+async def test_old_values_are_decrypted_after_key_rotation():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Secret.objects.create(value="old value")
+            secrets.insert(0, "second-key")
+            try:
+                await Secret.objects.create(value="new value")
+                values = await Secret.objects.order_by("id").values_list(
+                    "value", flatten=True
+                )
+                assert values == ["old value", "new value"]
+
+                raw_values = await base_ormar_config.database.fetch_all(
+                    "SELECT value FROM secrets ORDER BY id"
+                )
+                old_backend = get_backend(FernetBackend, "first-key")
+                new_backend = get_backend(FernetBackend, "second-key")
+                assert old_backend.decrypt(raw_values[0][0]) == "old value"
+                assert new_backend.decrypt(raw_values[1][0]) == "new value"
+            finally:
+                secrets.remove("second-key")
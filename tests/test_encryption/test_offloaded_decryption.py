@@ -0,0 +1,128 @@
+# type: ignore
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import ormar
+import pytest
+from ormar.fields.sqlalchemy_encrypted import deferred_decryption
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+decrypting_threads = set()
+
+
+class ThreadRecordingBackend(ormar.fields.EncryptBackend):
+    def _initialize_backend(self, secret_key: bytes) -> None:
+        pass
+
+    def encrypt(self, value: Any) -> str:
+        return value[::-1]
+
+    def decrypt(self, value: Any) -> str:
+        decrypting_threads.add(threading.current_thread().name)
+        return value[::-1]
+
+
+class Owner(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="owners")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(
+        max_length=100,
+        encrypt_secret="owner-secret",
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+
+
+class Account(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="accounts")
+
+    id: int = ormar.Integer(primary_key=True)
+    number: str = ormar.String(
+        max_length=100,
+        encrypt_secret="account-secret",
+        encrypt_backend=ormar.EncryptBackends.CUSTOM,
+        encrypt_custom_backend=ThreadRecordingBackend,
+    )
+    balance: int = ormar.Integer(
+        encrypt_secret="balance-secret",
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+    note: Optional[str] = ormar.String(
+        max_length=100,
+        nullable=True,
+        encrypt_secret="note-secret",
+        encrypt_backend=ormar.EncryptBackends.FERNET,
+    )
+    owner: Optional[Owner] = ormar.ForeignKey(Owner)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    owner = await Owner.objects.create(name="Jane")
+    for i in range(7):
+        await Account.objects.create(
+            number=f"PL-{i}", balance=i * 100, note=None if i % 2 else f"note {i}"
+        )
+    await Account.objects.filter(id__in=[1, 2]).update(owner=owner.id)
+
+
+@pytest.mark.asyncio
+async def test_offloaded_decryption_returns_same_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            queryset = Account.objects.select_related("owner").order_by("id")
+            expected = [account.model_dump() for account in await queryset.all()]
+
+            decrypting_threads.clear()
+            offloaded = queryset.offload_decryption(batch_size=3)
+            accounts = await offloaded.all()
+            assert [account.model_dump() for account in accounts] == expected
+            assert accounts[0].balance == 0
+            assert accounts[1].owner.name == "Jane"
+            assert accounts[1].note is None
+            assert decrypting_threads
+            assert threading.current_thread().name not in decrypting_threads
+
+            iterated = [account.model_dump() async for account in offloaded.iterate()]
+            assert iterated == expected
+            account = await offloaded.get(id=3)
+            assert account.number == "PL-2"
+            account = await offloaded.first()
+            assert account.number == "PL-0"
+            values = await offloaded.values_list("number", flatten=True)
+            assert values == [f"PL-{i}" for i in range(7)]
+            values = [
+                value async for value in offloaded.iterate_values(fields="balance")
+            ]
+            assert [value["balance"] for value in values] == [i * 100 for i in range(7)]
+
+            readonly = await offloaded.readonly().all()
+            assert [record.model_dump() for record in readonly] == expected
+
+
+@pytest.mark.asyncio
+async def test_offloaded_decryption_with_own_executor_does_not_leak():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            with ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="decrypt"
+            ) as executor:
+                decrypting_threads.clear()
+                numbers = []
+                async for account in Account.objects.offload_decryption(
+                    executor=executor, batch_size=2
+                ).iterate():
+                    assert not deferred_decryption.get()
+                    numbers.append(account.number)
+            assert numbers == [f"PL-{i}" for i in range(7)]
+            assert all(name.startswith("decrypt") for name in decrypting_threads)
+            account = await Account.objects.get(id=1)
+            assert account.number == "PL-0"
@@ -0,0 +1,95 @@
+from typing import List, Optional
+
+import ormar
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    icon: Optional[str] = ormar.LargeBinary(
+        max_length=100, represent_as_base64_str=True, nullable=True
+    )
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+class Cart(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="carts")
+
+    id: int = ormar.Integer(primary_key=True)
+    items: Optional[List[Item]] = ormar.ManyToMany(Item)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_dump_plans_are_cached_and_reused():
+    Item._dump_plans.clear()
+    category = Category(id=1, name="Fruits", icon=b"icon")
+    items = [Item(id=i, name=f"Item {i}", category=category) for i in range(3)]
+
+    dumped = [item.model_dump(exclude={"category": {"icon"}}) for item in items]
+    assert len(Item._dump_plans) == 1
+    plan = next(iter(Item._dump_plans.values()))
+    relation_plan = next(
+        relation for relation in plan.relations if relation.name == "category"
+    )
+    assert relation_plan.key in Category._dump_plans
+
+    assert dumped[0]["category"] == {"id": 1, "name": "Fruits"}
+    assert items[0].model_dump(exclude={"category": {"icon"}}) == dumped[0]
+    assert len(Item._dump_plans) == 1
+
+    assert items[0].model_dump()["category"]["icon"] == "aWNvbg=="
+    assert items[0].model_dump(include={"name"}) == {"name": "Item 0"}
+    assert len(Item._dump_plans) == 3
+
+
+def test_nested_plans_are_invalidated_with_nested_class_plans():
+    Item._dump_plans.clear()
+    item = Item(id=1, name="Apple", category=Category(id=1, name="Fruits", icon=b"x"))
+    item.model_dump()
+    plan = next(iter(Item._dump_plans.values()))
+    relation_plan = next(
+        relation for relation in plan.relations if relation.name == "category"
+    )
+    nested_plan = Category._dump_plans[relation_plan.key]
+
+    Category._dump_plans.clear()
+    assert item.model_dump()["category"] == {"id": 1, "name": "Fruits", "icon": "eA=="}
+    assert Category._dump_plans[relation_plan.key] is not nested_plan
+
+
+def test_changing_include_after_dump_does_not_change_plan():
+    item = Item(id=1, name="Apple", category=Category(id=1, name="Fruits"))
+    include = {"name", "category"}
+    assert item.model_dump(include=include) == {
+        "name": "Apple",
+        "category": {"id": 1, "name": "Fruits", "icon": None},
+    }
+    include.remove("category")
+    assert item.model_dump(include=include) == {"name": "Apple"}
+
+
+def test_nested_lists_and_through_models_use_plans():
+    cart = Cart(id=1)
+    for i in range(2):
+        cart.items.append(Item(id=i, name=f"Item {i}"))
+    assert cart.model_dump(exclude_list=True) == {"id": 1}
+    assert cart.model_dump(exclude={"items": {"category"}})["items"] == [
+        {"id": 0, "name": "Item 0"},
+        {"id": 1, "name": "Item 1"},
+    ]
@@ -0,0 +1,153 @@
+import datetime
+import decimal
+import importlib
+import sys
+import uuid
+from typing import List, Optional
+
+import ormar
+import pytest
+from asgi_lifespan import LifespanManager
+from fastapi import FastAPI
+from httpx import AsyncClient
+from ormar.responses import OrmarJSONResponse
+
+from tests.lifespan import init_tests, lifespan
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+app = FastAPI(lifespan=lifespan(base_ormar_config))
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    price: decimal.Decimal = ormar.Decimal(max_digits=10, decimal_places=2)
+    code: uuid.UUID = ormar.UUID(default=uuid.uuid4)
+    created: datetime.datetime = ormar.DateTime(
+        timezone=True,
+        default=lambda: datetime.datetime.now(tz=datetime.timezone.utc),
+    )
+    payload: bytes = ormar.LargeBinary(max_length=100, nullable=True)
+    info: Optional[dict] = ormar.JSON(nullable=True)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+    tags: List[Category] = ormar.ManyToMany(Category, related_name="tagged_items")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@app.get("/items/", response_class=OrmarJSONResponse)
+async def get_items():
+    items = await Item.objects.select_related(["category", "tags"]).all()
+    return OrmarJSONResponse(items, exclude={"tags": {"itemcategory"}})
+
+
+@app.get("/items/{item_id}")
+async def get_item(item_id: int):
+    item = await Item.objects.select_related("category").get(pk=item_id)
+    return OrmarJSONResponse(item, exclude_primary_keys=True)
+
+
+@app.get("/items/{item_id}/changed")
+async def get_item_changed(item_id: int):
+    item = await Item.objects.get(pk=item_id)
+    return OrmarJSONResponse(
+        [item, Item(name="New", price=1)],
+        exclude_defaults=True,
+        exclude={"code", "created"},
+    )
+
+
+def joined_dumps(models, **kwargs) -> bytes:
+    return ("[" + ",".join(m.model_dump_json(**kwargs) for m in models) + "]").encode()
+
+
+def test_dump_json_many_matches_model_dump_json():
+    category = Category(id=1, name="Tools")
+    items = [
+        Item(
+            id=i,
+            name=f"Item {i}",
+            price=decimal.Decimal("10.50"),
+            payload=b"binary",
+            info={"nested": [1, 2], "flag": True},
+            category=category if i % 2 else None,
+            tags=[Category(id=2, name="Tag")] if i == 1 else [],
+        )
+        for i in range(3)
+    ]
+
+    assert ormar.dump_json_many(items) == joined_dumps(items)
+    assert ormar.dump_json_many(iter(items)) == joined_dumps(items)
+    assert ormar.dump_json_many([]) == b"[]"
+    for kwargs in [
+        dict(include={"id", "name", "category"}),
+        dict(exclude={"created": ..., "code": ..., "category": {"name"}}),
+        dict(exclude_none=True),
+        dict(exclude_unset=True),
+        dict(exclude_defaults=True, exclude={"code", "created"}),
+        dict(exclude_primary_keys=True, exclude_through_models=True),
+    ]:
+        assert ormar.dump_json_many(items, **kwargs) == joined_dumps(items, **kwargs)
+
+
+def test_encoder_is_cached_per_model():
+    Item._json_encoder = None
+    ormar.dump_json_many([Item(id=1, name="Item", price=1)])
+    encoder = Item._json_encoder
+    assert encoder is not None
+    ormar.dump_json_many([Item(id=2, name="Item", price=2)])
+    assert Item._json_encoder is encoder
+    assert Category._json_encoder is not encoder
+
+
+@pytest.mark.asyncio
+async def test_response_class():
+    client = AsyncClient(app=app, base_url="http://testserver")
+    async with client as client, LifespanManager(app):
+        category = await Category.objects.create(name="Tools")
+        tag = await Category.objects.create(name="Tag")
+        item = await Item.objects.create(
+            name="Hammer", price=decimal.Decimal("9.99"), category=category
+        )
+        await item.tags.add(tag)
+        await Item.objects.create(name="Saw", price=decimal.Decimal("19.99"))
+
+        response = await client.get("/items/")
+        assert response.headers["content-type"] == "application/json"
+        items = await Item.objects.select_related(["category", "tags"]).all()
+        assert response.content == joined_dumps(
+            items, exclude={"tags": {"itemcategory"}}
+        )
+        assert "itemcategory" not in response.json()[0]["tags"][0]
+
+        response = await client.get(f"/items/{item.id}")
+        assert response.json()["category"] == {"name": "Tools"}
+        assert response.json()["price"] == "9.99"
+        assert "id" not in response.json()
+
+        response = await client.get(f"/items/{item.id}/changed")
+        item = await Item.objects.get(pk=item.id)
+        kwargs = dict(exclude_defaults=True, exclude={"code", "created"})
+        assert response.content == joined_dumps(
+            [item, Item(name="New", price=1)], **kwargs
+        )
+        assert response.json()[1]["name"] == "New"
+        assert "payload" not in response.json()[1]
+
+
+def test_clear_error_without_starlette(monkeypatch):
+    monkeypatch.setitem(sys.modules, "starlette.responses", None)
+    monkeypatch.delitem(sys.modules, "ormar.responses")
+    with pytest.raises(ImportError, match="requires 'starlette'"):
+        importlib.import_module("ormar.responses")
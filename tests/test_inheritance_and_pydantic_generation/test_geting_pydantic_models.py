@@ -303,3 +303,35 @@ def test_getting_pydantic_model_mutual_rels_exclude():
     assert len(MutualB2.model_fields) == 2
     assert set(MutualB2.model_fields.keys()) == {"id", "name"}
     assert MutualB1 != MutualB2
+
+
+def test_getting_pydantic_model_is_cached():
+    PydanticItem = Item.get_pydantic(include={"name", "category__name"})
+    assert Item.get_pydantic(include={"name", "category__name"}) is PydanticItem
+    assert (
+        Item.get_pydantic(include={"name": ..., "category": {"name": ...}})
+        is PydanticItem
+    )
+    assert Item.get_pydantic(include={"name": ..., "category": {"name"}}) is (
+        PydanticItem
+    )
+    assert Item.get_pydantic(include={"name"}) is not PydanticItem
+    assert list(PydanticItem.model_fields.keys()) == ["name", "category"]
+
+    NestedCategory = PydanticItem.model_fields["category"].annotation.__args__[0]
+    assert list(NestedCategory.model_fields.keys()) == ["name"]
+    # nested model has a relation map of item so is not reused for categories
+    PydanticCategory = Category.get_pydantic(include={"name"})
+    assert PydanticCategory is not NestedCategory
+
+
+def test_warming_pydantic_cache():
+    models = ormar.warm_pydantic_cache(
+        [MutualA, (MutualB, {"exclude": {"mutual_a"}}), (Item, {"include": {"name"}})]
+    )
+    assert models == [
+        MutualA.get_pydantic(),
+        MutualB.get_pydantic(exclude={"mutual_a"}),
+        Item.get_pydantic(include={"name"}),
+    ]
+    assert list(models[2].model_fields.keys()) == ["name"]
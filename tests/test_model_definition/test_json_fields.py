@@ -0,0 +1,98 @@
+from typing import Dict, Optional
+
+import ormar
+import pydantic
+import pytest
+from pydantic import Json
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Document(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="json_documents")
+
+    id: int = ormar.Integer(primary_key=True)
+    payload = ormar.JSON(nullable=True)
+    counts: Optional[Dict[str, int]] = ormar.JSON(
+        nullable=True, overwrite_pydantic_type=Optional[Json[Dict[str, int]]]
+    )
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_json_field_keeps_decoded_values():
+    payload = {"a": [1, 2, {"b": None}]}
+    document = Document(payload=payload)
+    assert document.payload is payload
+
+    document.payload = payload
+    assert document.payload is payload
+
+    assert Document(payload='{"a": 1}').payload == {"a": 1}
+    assert Document(payload=b"[1, 2]").payload == [1, 2]
+    assert Document(payload='"text"').payload == "text"
+    with pytest.raises(pydantic.ValidationError):
+        Document(payload="not a json")
+
+
+def test_json_field_schema_is_not_changed():
+    json_string = {
+        "type": "string",
+        "contentMediaType": "application/json",
+        "contentSchema": {},
+    }
+    properties = Document.model_json_schema()["properties"]
+    assert properties["payload"] == {
+        "anyOf": [json_string, {"type": "null"}],
+        "default": None,
+        "title": "Payload",
+    }
+    assert (
+        Document.get_pydantic().model_json_schema()["properties"]["payload"]
+        == properties["payload"]
+    )
+
+    properties = Document.model_json_schema(mode="serialization")["properties"]
+    assert properties["payload"] == {
+        "anyOf": [{}, {"type": "null"}],
+        "default": None,
+        "title": "Payload",
+    }
+    assert Document(payload=None).payload is None
+
+
+def test_json_field_with_overwritten_pydantic_type_still_expects_strings():
+    assert Document(counts={"a": 1}).counts == {"a": 1}
+    assert Document(counts='{"a": 1}').counts == {"a": 1}
+    with pytest.raises(pydantic.ValidationError):
+        Document(counts={"a": "b"})
+
+
+@pytest.mark.asyncio
+async def test_json_values_are_encoded_once():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            document = await Document.objects.create(payload={"a": 1}, counts={"b": 2})
+            await Document.objects.create(payload='{"a": 2}', counts='{"e": 5}')
+            await Document.objects.filter(id=document.id).update(payload={"c": 3})
+            await Document.objects.filter(payload__isnull=True).update(
+                each=True, payload='{"d": 4}'
+            )
+            rows = await base_ormar_config.database.fetch_all(
+                "SELECT payload FROM json_documents ORDER BY id"
+            )
+            assert [row[0].replace(" ", "") for row in rows] == [
+                '{"c":3}',
+                '{"a":2}',
+            ]
+
+            documents = await Document.objects.order_by("id").all()
+            assert [document.payload for document in documents] == [
+                {"c": 3},
+                {"a": 2},
+            ]
+            assert [document.counts for document in documents] == [{"b": 2}, {"e": 5}]
@@ -0,0 +1,94 @@
+import gc
+from typing import ForwardRef, List, Optional
+
+import ormar
+import pytest
+from ormar.exceptions import ModelDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: List[Tag] = ormar.ManyToMany(Tag)
+
+
+class Unresolved(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="unresolved")
+
+    id: int = ormar.Integer(primary_key=True)
+    child = ormar.ForeignKey(ForwardRef("Child"))
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_prepare_models_fills_caches():
+    ormar.prepare_models(
+        models=[Author, Book, Tag],
+        select_related_shapes={Book: ["author", ["author", "tags"]]},
+    )
+    for model_cls in [Author, Book, Tag]:
+        assert model_cls._related_names is not None
+        assert model_cls._through_names is not None
+        assert model_cls._related_fields is not None
+        assert model_cls._raw_pk_names is not None
+        assert model_cls.__relation_map__ is not None
+        assert model_cls._dump_plans
+    assert base_ormar_config.alias_manager._reversed_aliases
+    assert Book._related_names == {"author", "tags"}
+    assert Book._raw_pk_names == {"author"}
+    assert Author.__relation_map__ == ["books__tags"]
+
+
+def test_prepare_models_freezes_gc_only_when_requested(monkeypatch):
+    calls: List[bool] = []
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append(True))
+    ormar.prepare_models(models=[Author])
+    assert calls == []
+    ormar.prepare_models(models=[Author], freeze=True)
+    assert calls == [True]
+
+
+def test_prepare_all_models_skips_not_updated_models():
+    ormar.prepare_models()
+    assert Book._related_names == {"author", "tags"}
+    assert Unresolved._related_names is None
+
+    with pytest.raises(ModelDefinitionError):
+        ormar.prepare_models(models=[Unresolved])
+
+
+@pytest.mark.asyncio
+async def test_queries_after_prepare_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            ormar.prepare_models(
+                models=[Book], select_related_shapes={Book: ["author"]}
+            )
+            author = await Author.objects.create(name="Tolkien")
+            await Book.objects.create(title="Hobbit", author=author)
+            book = await Book.objects.select_related("author").get()
+            assert book.author.name == "Tolkien"
+            assert book.model_dump()["author"] == {"id": author.id, "name": "Tolkien"}
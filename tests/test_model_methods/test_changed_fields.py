@@ -0,0 +1,128 @@
+from typing import Optional
+
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Director(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="directors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Movie(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="movies")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, name="title")
+    year: int = ormar.Integer()
+    profit: float = ormar.Float()
+    info: dict = ormar.JSON(default={})
+    director: Optional[Director] = ormar.ForeignKey(Director)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_changed_fields_of_not_saved_model():
+    movie = Movie(name="Terminator", year=1984, profit=0.078)
+    assert movie.changed_fields == {
+        "id",
+        "name",
+        "year",
+        "profit",
+        "info",
+        "director",
+    }
+
+
+@pytest.mark.asyncio
+async def test_only_changed_fields_are_updated():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            director = await Director(name="Cameron").save()
+            movie = await Movie(name="Terminator", year=1984, profit=0.078).save()
+            assert movie.changed_fields == set()
+
+            # change the row behind the instance back to check what is sent
+            await Movie.objects.filter(id=movie.id).update(year=2000, profit=1.0)
+
+            movie.name = "Terminator 2"
+            movie.director = director
+            assert movie.changed_fields == {"name", "director"}
+            assert not movie.saved
+            await movie.update()
+            assert movie.changed_fields == set()
+            assert movie.saved
+
+            movie = await Movie.objects.get(id=movie.id)
+            assert movie.name == "Terminator 2"
+            assert movie.director.pk == director.pk
+            assert movie.year == 2000
+            assert movie.profit == 1.0
+
+            await Movie.objects.filter(id=movie.id).update(year=2001)
+            await movie.update()
+            await movie.update(profit=2.0)
+            await movie.load()
+            assert movie.year == 2001
+            assert movie.profit == 2.0
+            assert movie.changed_fields == set()
+
+
+@pytest.mark.asyncio
+async def test_not_updated_columns_stay_changed():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            movie = await Movie(name="Terminator", year=1984, profit=0.078).save()
+            movie.name = "Terminator 2"
+            movie.year = 1991
+            await movie.update(_columns=["name"])
+            assert movie.changed_fields == {"year"}
+
+            await movie.update()
+            movie = await Movie.objects.get(id=movie.id)
+            assert movie.name == "Terminator 2"
+            assert movie.year == 1991
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_sends_only_changed_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Movie.objects.bulk_create(
+                [
+                    Movie(name=f"Movie {i}", year=2000 + i, profit=float(i))
+                    for i in range(4)
+                ]
+            )
+            movies = await Movie.objects.order_by("id").all()
+            await Movie.objects.update(each=True, profit=10.0)
+
+            movies[0].name = "Changed 0"
+            movies[1].name = "Changed 1"
+            movies[2].year = 1990
+            movies[2].info = {"changed": True}
+            await Movie.objects.bulk_update(movies)
+            assert all(movie.changed_fields == set() for movie in movies)
+
+            movies = await Movie.objects.order_by("id").all()
+            assert [movie.name for movie in movies] == [
+                "Changed 0",
+                "Changed 1",
+                "Movie 2",
+                "Movie 3",
+            ]
+            assert movies[2].year == 1990
+            assert movies[2].info == {"changed": True}
+            assert all(movie.profit == 10.0 for movie in movies)
+
+            await Movie.objects.bulk_update(movies, columns=["profit"])
+            movies = await Movie.objects.order_by("id").all()
+            assert [movie.profit for movie in movies] == [10.0] * 4
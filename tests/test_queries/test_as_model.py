@@ -0,0 +1,123 @@
+from typing import List, Optional
+
+import ormar
+import pydantic
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    bio: str = ormar.Text(default="")
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100, name="book_title")
+    year: int = ormar.Integer(nullable=True)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: List[Tag] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+class BookTitle(pydantic.BaseModel):
+    title: str
+    author: Optional[int] = None
+
+
+async def create_sample_data():
+    tolkien = await Author.objects.create(name="Tolkien", bio="Long bio")
+    lewis = await Author.objects.create(name="Lewis")
+    fantasy = await Tag.objects.create(name="fantasy")
+    classic = await Tag.objects.create(name="classic")
+    hobbit = await Book.objects.create(title="Hobbit", year=1937, author=tolkien)
+    await hobbit.tags.add(fantasy)
+    await hobbit.tags.add(classic)
+    await Book.objects.create(title="Silmarillion", year=1977, author=tolkien)
+    await Book.objects.create(title="Narnia", author=lewis)
+    await Book.objects.create(title="Anonymous")
+
+
+@pytest.mark.asyncio
+async def test_as_model_with_get_pydantic():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            BookOut = Book.get_pydantic(include={"title": ..., "author": {"name"}})
+            books = await Book.objects.order_by("id").as_model(BookOut)
+            assert all(isinstance(book, BookOut) for book in books)
+            assert [book.model_dump() for book in books] == [
+                {"title": "Hobbit", "author": {"name": "Tolkien"}},
+                {"title": "Silmarillion", "author": {"name": "Tolkien"}},
+                {"title": "Narnia", "author": {"name": "Lewis"}},
+                {"title": "Anonymous", "author": None},
+            ]
+            fields, related, _ = Book._pydantic_projections[BookOut]
+            assert fields == {"title": ..., "author": {"name": ...}}
+            assert related == ["author"]
+
+            books = (
+                await Book.objects.filter(author__name="Tolkien")
+                .order_by("id")
+                .as_model(BookOut)
+            )
+            assert [book.title for book in books] == ["Hobbit", "Silmarillion"]
+
+
+@pytest.mark.asyncio
+async def test_as_model_with_lists_and_plain_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            AuthorOut = Author.get_pydantic(
+                include={"name": ..., "books": {"title": ..., "tags": {"name"}}}
+            )
+            authors = await Author.objects.order_by("id").as_model(AuthorOut)
+            assert authors[0].model_dump() == {
+                "name": "Tolkien",
+                "books": [
+                    {
+                        "title": "Hobbit",
+                        "tags": [{"name": "fantasy"}, {"name": "classic"}],
+                    },
+                    {"title": "Silmarillion", "tags": []},
+                ],
+            }
+            assert authors[1].books[0].title == "Narnia"
+
+            books = await Book.objects.order_by("id").as_model(BookTitle)
+            assert books[0] == BookTitle(title="Hobbit", author=1)
+            assert books[-1] == BookTitle(title="Anonymous", author=None)
+
+            author = await Author.objects.get(name="Tolkien")
+            books = await author.books.order_by("-id").as_model(BookTitle)
+            assert [book.title for book in books] == ["Silmarillion", "Hobbit"]
+
+
+@pytest.mark.asyncio
+async def test_values_of_aliased_columns():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            books = await Book.objects.fields("title").order_by("id").values()
+            assert books[0] == {"book_title": "Hobbit"}
+            books = await Book.objects.fields("title").values(nested=True)
+            assert books[0] == {"title": "Hobbit"}
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import NoMatch, QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture()
+def queries(count_queries):
+    return count_queries(base_ormar_config.database)
+
+
+async def create_sample_data():
+    author = await Author.objects.create(name="Tolkien")
+    for i in range(5):
+        await Book.objects.create(title=f"Book {i}", author=author)
+
+
+@pytest.mark.asyncio
+async def test_get_batched_coalesces_concurrent_lookups(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            queries.clear()
+            results = await asyncio.gather(
+                *(Book.objects.get_batched(pk) for pk in [3, 1, 5, 3, 100]),
+                return_exceptions=True,
+            )
+            assert len(queries) == 1
+            assert [book.title for book in results[:4]] == [
+                "Book 2",
+                "Book 0",
+                "Book 4",
+                "Book 2",
+            ]
+            assert results[0] is results[3]
+            assert isinstance(results[4], NoMatch)
+
+            queries.clear()
+            book = await Book.objects.get_batched(2)
+            assert book.title == "Book 1"
+            assert len(queries) == 1
+
+            with pytest.raises(QueryDefinitionError):
+                await Book.objects.filter(title="Book 1").get_batched(2)
+
+
+@pytest.mark.asyncio
+async def test_loader_uses_queryset_and_batches(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            loader = Book.objects.select_related("author").loader(max_batch_size=2)
+            queries.clear()
+            books = await loader.load_many([1, 2, 3, 4, 5])
+            assert len(queries) == 3
+            assert [book.id for book in books] == [1, 2, 3, 4, 5]
+            assert books[0].author.name == "Tolkien"
+
+            loader = Book.objects.exclude(title="Book 0").loader(delay=0.01)
+
+            async def delayed_load(pk):
+                await asyncio.sleep(0)
+                return await loader.load(pk)
+
+            queries.clear()
+            results = await asyncio.gather(
+                loader.load(2), delayed_load(3), delayed_load(1), return_exceptions=True
+            )
+            assert len(queries) == 1
+            assert [book.id for book in results[:2]] == [2, 3]
+            assert isinstance(results[2], NoMatch)
+
+
+@pytest.mark.asyncio
+async def test_loader_propagates_query_errors():
+    async with base_ormar_config.database:
+        loader = Book.objects.readonly().prefetch_related("author").loader()
+        with pytest.raises(QueryDefinitionError):
+            await loader.load_many([1, 2])
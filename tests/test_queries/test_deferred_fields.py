@@ -0,0 +1,156 @@
+import asyncio
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    body: Optional[str] = ormar.Text(nullable=True, name="post_body")
+    payload: Optional[dict] = ormar.JSON(nullable=True)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    author = await Author.objects.create(name="Tolkien")
+    for i in range(5):
+        await Post.objects.create(
+            title=f"Post {i}", body=f"Body {i}", payload={"i": i}, author=author
+        )
+
+
+@pytest.mark.asyncio
+async def test_deferred_fields_are_loaded_for_whole_result_set():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            posts = (
+                await Post.objects.select_related("author")
+                .defer("body", Post.payload)
+                .order_by("id")
+                .all()
+            )
+            assert all(post.body is None and post.payload is None for post in posts)
+            assert posts[0].author.name == "Tolkien"
+
+            posts[1].title = "Changed"
+            posts[2].body = "Set before load"
+            del posts[4]
+
+            await posts[3].load_deferred()
+            assert [post.body for post in posts] == [
+                "Body 0",
+                "Body 1",
+                "Set before load",
+                "Body 3",
+            ]
+            assert [post.payload for post in posts] == [
+                {"i": 0},
+                {"i": 1},
+                {"i": 2},
+                {"i": 3},
+            ]
+            assert posts[0].changed_fields == set()
+            assert posts[1].changed_fields == {"title"}
+            assert posts[2].changed_fields == {"body"}
+            assert all(post._deferred_loader is None for post in posts)
+
+            await posts[1].update()
+            post = await Post.objects.get(id=posts[1].id)
+            assert post.title == "Changed"
+            assert post.body == "Body 1"
+
+
+@pytest.mark.asyncio
+async def test_deferred_fields_in_iterate_and_get():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            posts = []
+            async for post in Post.objects.defer("body").order_by("id").iterate():
+                posts.append(post)
+            assert posts[0]._deferred_loader is posts[4]._deferred_loader
+            await posts[0].load_deferred()
+            assert [post.body for post in posts] == [f"Body {i}" for i in range(5)]
+            assert posts[0].payload == {"i": 0}
+
+            post = await Post.objects.defer("body").defer("payload").get(id=2)
+            assert post.body is None and post.payload is None
+            assert (await post.load_deferred()).body == "Body 1"
+            assert post.payload == {"i": 1}
+            assert post._orm_saved
+            await post.load_deferred()
+
+            post = await Post.objects.get(id=3)
+            assert (await post.load_deferred()).body == "Body 2"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_wait_for_values(monkeypatch, count_queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            fetch_all = base_ormar_config.database.fetch_all
+            queries = count_queries(base_ormar_config.database, delay=0.01)
+
+            async def view(post):
+                await post.load_deferred()
+                return post.body
+
+            posts = await Post.objects.defer("body").order_by("id").all()
+            queries.clear()
+            bodies = await asyncio.gather(*(view(post) for post in posts))
+            assert bodies == [f"Body {i}" for i in range(5)]
+            assert len(queries) == 1
+
+            posts = await Post.objects.defer("body").order_by("id").all()
+            first = asyncio.ensure_future(posts[0].load_deferred())
+            await asyncio.sleep(0)
+            first.cancel()
+            assert await view(posts[1]) == "Body 1"
+            assert posts[0].body == "Body 0"
+
+            posts = await Post.objects.defer("body").order_by("id").all()
+
+            async def failing_fetch_all(query, *args, **kwargs):
+                raise RuntimeError("Query failed")
+
+            monkeypatch.setattr(
+                base_ormar_config.database, "fetch_all", failing_fetch_all
+            )
+            with pytest.raises(RuntimeError):
+                await posts[0].load_deferred()
+            assert posts[0]._deferred_loader is not None
+            monkeypatch.setattr(base_ormar_config.database, "fetch_all", fetch_all)
+            assert (await posts[0].load_deferred()).body == "Body 0"
+            assert posts[4].body == "Body 4"
+
+
+@pytest.mark.asyncio
+async def test_defer_validates_fields():
+    async with base_ormar_config.database:
+        for field in ["title", "id", "author", "unknown"]:
+            with pytest.raises(QueryDefinitionError):
+                Post.objects.defer(field)
+        with pytest.raises(QueryDefinitionError):
+            await Post.objects.defer("body").readonly().all()
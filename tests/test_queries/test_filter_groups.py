@@ -139,3 +139,19 @@ def test_one_model_with_group():
     result.resolve(model_cls=Book)
     assert len(result.actions) == 1
     assert len(result._nested_groups) == 1
+
+
+def test_root_field_accessors_are_cached():
+    assert Book.title is Book.title
+    assert Book.author is Book.author
+    assert Book.pk is Book.id
+    assert Book._field_accessors.keys() == {"title", "author", "id"}
+    assert Author._field_accessors == {}
+
+    result = (Book.author.name == "aa") & (Book.title == "bb")
+    result.resolve(model_cls=Book)
+    author_prefix = result._nested_groups[0].actions[0].table_prefix
+    assert (
+        str(result.get_text_clause().compile(compile_kwargs={"literal_binds": True}))
+        == f"(({author_prefix}_authors.name = 'aa') AND (books.title = 'bb'))"
+    )
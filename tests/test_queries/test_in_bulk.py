@@ -0,0 +1,116 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    isbn: str = ormar.String(max_length=20, unique=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: List[Tag] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture()
+def queries(count_queries):
+    return count_queries(base_ormar_config.database)
+
+
+async def create_sample_data():
+    author = await Author.objects.create(name="Tolkien")
+    tag = await Tag.objects.create(name="Fantasy")
+    for i in range(5):
+        book = await Book.objects.create(isbn=f"isbn-{i}", title=f"Book {i}")
+        if i % 2 == 0:
+            book.author = author
+            await book.update()
+            await book.tags.add(tag)
+
+
+@pytest.mark.asyncio
+async def test_in_bulk_returns_models_by_key(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            queries.clear()
+            books = await Book.objects.in_bulk([5, 1, 3, 1, 100], batch_size=2)
+            assert len(queries) == 2
+            assert all(query._order_by_clauses == () for query in queries)
+            assert sorted(books) == [1, 3, 5]
+            assert books[3].title == "Book 2"
+
+            books = await Book.objects.select_related("author").in_bulk(
+                ["isbn-0", "isbn-1"], field="isbn"
+            )
+            assert sorted(books) == ["isbn-0", "isbn-1"]
+            assert books["isbn-0"].author.name == "Tolkien"
+            assert books["isbn-1"].author is None
+
+            books = (
+                await Book.objects.prefetch_related("tags")
+                .filter(title__in=["Book 0", "Book 1"])
+                .in_bulk([1, 2, 3])
+            )
+            assert sorted(books) == [1, 2]
+            assert books[1].tags[0].name == "Fantasy"
+            assert books[2].tags == []
+
+            queries.clear()
+            assert await Book.objects.in_bulk([]) == {}
+            assert queries == []
+
+            books = await Book.objects.order_by("-id").in_bulk([1, 2])
+            assert queries[-1]._order_by_clauses != ()
+
+
+@pytest.mark.asyncio
+async def test_exists_many_returns_existing_values(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            queries.clear()
+            assert await Book.objects.exists_many([1, 2, 100], batch_size=2) == {1, 2}
+            assert len(queries) == 2
+            assert all(len(query.selected_columns) == 1 for query in queries)
+
+            existing = await Book.objects.filter(author__name="Tolkien").exists_many(
+                ["isbn-0", "isbn-1", "isbn-2"], field="isbn"
+            )
+            assert existing == {"isbn-0", "isbn-2"}
+
+
+@pytest.mark.asyncio
+async def test_in_bulk_requires_unique_field():
+    async with base_ormar_config.database:
+        with pytest.raises(QueryDefinitionError):
+            await Book.objects.in_bulk(["Book 1"], field="title")
+        with pytest.raises(QueryDefinitionError):
+            await Book.objects.exists_many([1], field="author")
+        with pytest.raises(QueryDefinitionError):
+            await Book.objects.limit(2).in_bulk([1])
@@ -0,0 +1,201 @@
+import asyncio
+import datetime
+from typing import Optional
+
+import databases
+import databases.core
+import ormar
+import ormar.queryset.parallel
+import pytest
+import pytest_asyncio
+from databases.core import Connection
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="items")
+
+    id: int = ormar.Integer(primary_key=True)
+    code: str = ormar.String(max_length=20, unique=True)
+    created: datetime.date = ormar.Date(index=True)
+    name: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture(autouse=True, scope="function")
+async def cleanup():
+    yield
+    async with base_ormar_config.database:
+        await Item.objects.delete(each=True)
+        await Category.objects.delete(each=True)
+
+
+async def sample_data():
+    category = await Category.objects.create(name="Tools")
+    await Item.objects.bulk_create(
+        [
+            Item(
+                code=f"code-{i:03}",
+                created=datetime.date(2024, 1, 1) + datetime.timedelta(days=i),
+                name=f"Item {i}",
+                category=category if i % 2 else None,
+            )
+            for i in range(50)
+        ]
+    )
+
+
+@pytest.fixture()
+def connections(monkeypatch):
+    opened = []
+
+    class CountingConnection(Connection):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr(databases.core, "Connection", CountingConnection)
+    return opened
+
+
+async def released(connections):
+    # Database.iterate() leaves closing the iterator of the connection to the
+    # event loop (after the generator is collected), so wait for it
+    for _ in range(100):
+        if all(connection._connection_counter == 0 for connection in connections):
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.mark.asyncio
+async def test_parallel_iterate_returns_all_rows(connections):
+    async with base_ormar_config.database:
+        await sample_data()
+        connections.clear()
+        items = [item async for item in Item.objects.parallel_iterate(partitions=4)]
+        assert len(connections) == 4
+        assert sorted(item.code for item in items) == [
+            f"code-{i:03}" for i in range(50)
+        ]
+
+        items = [
+            item
+            async for item in Item.objects.parallel_iterate(
+                partitions=3, ordered=True, buffer_size=2
+            )
+        ]
+        assert [item.id for item in items] == sorted(item.id for item in items)
+        assert len(items) == 50
+
+        items = [
+            item
+            async for item in Item.objects.select_related("category")
+            .filter(category__name="Tools")
+            .parallel_iterate(partitions=5, key="created")
+        ]
+        assert len(items) == 25
+        assert all(item.category.name == "Tools" for item in items)
+
+        items = [
+            item
+            async for item in Item.objects.parallel_iterate(
+                partitions=4, key="code", ordered=True
+            )
+        ]
+        assert [item.code for item in items] == [f"code-{i:03}" for i in range(50)]
+
+        items = [
+            item
+            async for item in Item.objects.parallel_iterate(
+                partitions=7, quantiles=True, ordered=True
+            )
+        ]
+        assert len(items) == 50
+
+
+@pytest.mark.asyncio
+async def test_parallel_iterate_stops_partitions_on_break(monkeypatch, connections):
+    tasks = []
+    read_partition = ormar.queryset.parallel._read_partition
+
+    async def tracking_read_partition(*args, **kwargs):
+        tasks.append(asyncio.current_task())
+        await read_partition(*args, **kwargs)
+
+    monkeypatch.setattr(
+        ormar.queryset.parallel, "_read_partition", tracking_read_partition
+    )
+    async with base_ormar_config.database:
+        await sample_data()
+        connections.clear()
+        iterator = Item.objects.parallel_iterate(partitions=4, buffer_size=1)
+        async for item in iterator:
+            assert item.name.startswith("Item")
+            break
+        await iterator.aclose()
+
+        assert len(tasks) == 4
+        assert all(task.done() and not task.cancelled() for task in tasks)
+        assert len(connections) == 4
+        assert await released(connections)
+        assert await Item.objects.count() == 50
+
+
+@pytest.mark.asyncio
+async def test_parallel_iterate_with_unsupported_databases_version(
+    monkeypatch, connections
+):
+    monkeypatch.setattr(databases, "__version__", "0.9.0")
+    async with base_ormar_config.database:
+        await sample_data()
+        connections.clear()
+        items = [item async for item in Item.objects.parallel_iterate(partitions=4)]
+        assert len(items) == 50
+        assert connections == []
+
+
+@pytest.mark.asyncio
+async def test_parallel_iterate_in_transaction():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            for i in range(5):
+                await Item.objects.create(
+                    code=f"code-{i}", created=datetime.date.today(), name="Item"
+                )
+            items = [item async for item in Item.objects.parallel_iterate(partitions=2)]
+            assert len(items) == 5
+            assert [item async for item in Item.objects.parallel_iterate()] != []
+            assert [
+                item async for item in Item.objects.filter(name="No").parallel_iterate()
+            ] == []
+
+
+@pytest.mark.asyncio
+async def test_parallel_iterate_validation():
+    async with base_ormar_config.database:
+        with pytest.raises(QueryDefinitionError):
+            await Item.objects.parallel_iterate(key="name").__anext__()
+        with pytest.raises(QueryDefinitionError):
+            await Item.objects.parallel_iterate(key="category").__anext__()
+        with pytest.raises(QueryDefinitionError):
+            await Item.objects.limit(10).parallel_iterate().__anext__()
+        with pytest.raises(QueryDefinitionError):
+            await (
+                Item.objects.prefetch_related("category").parallel_iterate().__anext__()
+            )
@@ -0,0 +1,167 @@
+import json
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.exceptions import QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    info: Optional[dict] = ormar.JSON(nullable=True)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: List[Tag] = ormar.ManyToMany(Tag)
+
+
+class Folder(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="folders")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Attachment(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="attachments")
+
+    id: int = ormar.Integer(primary_key=True)
+    content: str = ormar.LargeBinary(max_length=100, represent_as_base64_str=True)
+    raw: Optional[bytes] = ormar.LargeBinary(max_length=100, nullable=True)
+    folder: Optional[Folder] = ormar.ForeignKey(Folder)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    tolkien = await Author.objects.create(name="Tolkien")
+    fantasy = await Tag.objects.create(name="fantasy")
+    hobbit = await Book.objects.create(
+        title="Hobbit", author=tolkien, info={"pages": 310}
+    )
+    await hobbit.tags.add(fantasy)
+    await Book.objects.create(title="Silmarillion", author=tolkien)
+    await Book.objects.create(title="Anonymous")
+
+
+@pytest.mark.asyncio
+async def test_readonly_records_match_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            for queryset in [
+                Book.objects.order_by("id"),
+                Book.objects.select_related("author").order_by("id"),
+                Book.objects.select_related(["author", "tags"]).order_by("id"),
+                Author.objects.select_related("books")
+                .exclude_fields("books__info")
+                .order_by("id"),
+                Book.objects.select_related("author").fields(["title", "author__name"]),
+            ]:
+                models = await queryset.all()
+                records = await queryset.readonly().all()
+                assert [record.model_dump() for record in records] == [
+                    model.model_dump() for model in models
+                ]
+                assert [json.loads(record.model_dump_json()) for record in records] == [
+                    json.loads(model.model_dump_json()) for model in models
+                ]
+
+            book = await Book.objects.select_related("author").readonly().get(id=1)
+            assert isinstance(book, ormar.ReadOnlyRecord)
+            assert book.title == "Hobbit"
+            assert book.author.name == "Tolkien"
+            assert book.info == {"pages": 310}
+            assert book.model_dump(include={"title": ..., "author": {"name"}}) == {
+                "title": "Hobbit",
+                "author": {"name": "Tolkien"},
+            }
+            assert json.loads(
+                book.model_dump_json(exclude={"info": ..., "author": {"id"}})
+            ) == {"id": 1, "title": "Hobbit", "author": {"name": "Tolkien"}, "tags": []}
+
+            book = await Book.objects.readonly().first()
+            assert book.author == 1
+            assert book.model_dump()["author"] == {"id": 1}
+
+
+@pytest.mark.asyncio
+async def test_readonly_records_dump_base64_fields_as_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            folder = await Folder.objects.create(name="Docs")
+            await Attachment.objects.create(
+                content=b"\x00\xffabc", raw=b"\x00\xffabc", folder=folder
+            )
+            for queryset in [
+                Attachment.objects,
+                Folder.objects.select_related("attachments"),
+            ]:
+                models = await queryset.all()
+                records = await queryset.readonly().all()
+                assert [record.model_dump() for record in records] == [
+                    model.model_dump() for model in models
+                ]
+                assert [json.loads(record.model_dump_json()) for record in records] == [
+                    json.loads(model.model_dump_json()) for model in models
+                ]
+
+            attachment = await Attachment.objects.readonly().get()
+            assert attachment.content == "AP9hYmM="
+            assert attachment.raw == b"\x00\xffabc"
+
+
+@pytest.mark.asyncio
+async def test_readonly_records_are_immutable_and_cached():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            books = await Book.objects.readonly().all()
+            book = books[0]
+            assert not hasattr(book, "__dict__")
+            with pytest.raises(AttributeError):
+                book.title = "Changed"
+            with pytest.raises(AttributeError):
+                del book.title
+            assert books[1].__class__ is book.__class__
+            assert (await Book.objects.readonly().first()) == book
+            assert book != books[1]
+            assert repr(book).startswith("BookRecord(id=1, title='Hobbit'")
+
+            records = [
+                book
+                async for book in Book.objects.select_related("tags")
+                .readonly()
+                .iterate()
+            ]
+            assert [book.title for book in records] == [
+                "Hobbit",
+                "Silmarillion",
+                "Anonymous",
+            ]
+            assert records[0].tags[0].name == "fantasy"
+            assert records[1].tags == []
+
+            with pytest.raises(QueryDefinitionError):
+                await Book.objects.prefetch_related("author").readonly().all()
@@ -0,0 +1,112 @@
+import asyncio
+
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    pages: int = ormar.Integer(default=100)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture()
+def queries(count_queries):
+    return count_queries(
+        base_ormar_config.database,
+        methods=["fetch_all", "fetch_one", "fetch_val"],
+        delay=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_queries_run_once(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            for i in range(3):
+                await Book.objects.create(title=f"Book {i}", pages=100 * (i + 1))
+            queries.clear()
+            queryset = Book.objects.single_flight().order_by("id")
+            results = await asyncio.gather(*(queryset.all() for _ in range(10)))
+            assert len(queries) == 1
+            assert all(result == results[0] for result in results)
+            assert results[0][0] is not results[1][0]
+            results[0][0].title = "Changed"
+            assert results[1][0].title == "Book 0"
+
+            queries.clear()
+            await asyncio.gather(
+                queryset.get(id=1),
+                queryset.get(id=1),
+                queryset.get(id=2),
+                queryset.count(),
+                queryset.count(),
+                queryset.filter(pages__gt=100).exists(),
+                queryset.filter(pages__gt=100).exists(),
+                queryset.max("pages"),
+                queryset.max("pages"),
+            )
+            assert len(queries) == 5
+
+            queries.clear()
+            await queryset.all()
+            await queryset.all()
+            assert len(queries) == 2
+
+            queries.clear()
+            await asyncio.gather(*(Book.objects.order_by("id").all() for _ in range(3)))
+            assert len(queries) == 3
+
+
+@pytest.mark.asyncio
+async def test_queries_with_different_decryption_are_not_shared(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Book.objects.create(title="Book")
+            queries.clear()
+            queryset = Book.objects.single_flight()
+            await asyncio.gather(
+                queryset.all(),
+                queryset.offload_decryption().all(),
+                queryset.offload_decryption().all(),
+                queryset.offload_decryption(batch_size=10).all(),
+            )
+            assert len(queries) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_and_cancellation_of_shared_queries(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Book.objects.create(title="Book")
+            queryset = Book.objects.single_flight()
+
+            first = asyncio.ensure_future(queryset.all())
+            second = asyncio.ensure_future(queryset.all())
+            await asyncio.sleep(0)
+            first.cancel()
+            books = await second
+            assert books[0].title == "Book"
+            assert first.cancelled()
+            assert len(queries) == 1
+
+            expr = queryset.build_select_expression()
+            expr._fail = True
+            results = await asyncio.gather(
+                queryset._fetch_all(expr),
+                queryset._fetch_all(expr),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, RuntimeError) for result in results)
+            assert len(queries) == 2
+            assert (await queryset.get()).title == "Book"
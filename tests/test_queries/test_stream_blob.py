@@ -0,0 +1,81 @@
+import base64
+import os
+from typing import Optional
+
+import ormar
+import pytest
+from ormar.exceptions import NoMatch, QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Attachment(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="attachments")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    content: Optional[bytes] = ormar.LargeBinary(max_length=10**7, nullable=True)
+    preview: Optional[str] = ormar.LargeBinary(
+        max_length=10**6, represent_as_base64_str=True, nullable=True
+    )
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_base64_representation_is_cached_until_value_changes():
+    data = os.urandom(100)
+    attachment = Attachment(name="a", preview=data)
+    preview = attachment.preview
+    assert preview == base64.b64encode(data).decode()
+    assert attachment.preview is preview
+    assert attachment.model_dump()["preview"] is preview
+
+    attachment.preview = b"new"
+    assert attachment.preview == base64.b64encode(b"new").decode()
+    assert attachment.model_dump()["preview"] == attachment.preview
+
+
+def test_binary_fields_accept_buffers():
+    data = os.urandom(100)
+    attachment = Attachment(name="a", content=memoryview(data))
+    assert attachment.content == data
+    attachment.content = bytearray(b"new")
+    assert attachment.content == b"new"
+
+
+@pytest.mark.asyncio
+async def test_stream_blob_reads_value_in_chunks():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            data = os.urandom(100_003)
+            attachment = await Attachment.objects.create(name="big", content=data)
+            empty = await Attachment.objects.create(name="empty")
+
+            chunks = [
+                chunk
+                async for chunk in Attachment.objects.stream_blob(
+                    "content", attachment.pk, chunk_size=10_000
+                )
+            ]
+            assert len(chunks) == 11
+            assert all(isinstance(chunk, bytes) for chunk in chunks)
+            assert b"".join(chunks) == data
+
+            assert [
+                chunk
+                async for chunk in Attachment.objects.stream_blob("content", empty.pk)
+            ] == []
+
+            with pytest.raises(NoMatch):
+                async for _ in Attachment.objects.filter(name="other").stream_blob(
+                    "content", attachment.pk
+                ):
+                    pass  # pragma: no cover
+
+            with pytest.raises(QueryDefinitionError):
+                async for _ in Attachment.objects.stream_blob("name", attachment.pk):
+                    pass  # pragma: no cover
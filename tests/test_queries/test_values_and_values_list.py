@@ -424,3 +424,137 @@ async def test_querysetproxy_values_list():
             .values_list(exclude_through=True, flatten=True)
         )
         assert user == ["Anonymous"]
+
+
+@pytest.mark.asyncio
+async def test_nested_values():
+    async with base_ormar_config.database:
+        posts = await Post.objects.select_related("category__created_by").values(
+            nested=True
+        )
+        assert posts[0] == {
+            "id": 1,
+            "name": "Ormar strikes again!",
+            "category": {
+                "id": 1,
+                "name": "News",
+                "sort_order": 0,
+                "created_by": {"id": 1, "name": "Anonymous"},
+            },
+        }
+        assert len(posts) == 3
+
+        posts = await Post.objects.select_related("category").values(
+            ["name", "category__name"], nested=True
+        )
+        assert posts[1] == {
+            "name": "Why don't you use ormar yet?",
+            "category": {"name": "News"},
+        }
+
+        assert await Post.objects.values(nested=True) == await Post.objects.values()
+
+
+@pytest.mark.asyncio
+async def test_nested_values_merge_reverse_and_m2m_relations():
+    async with base_ormar_config.database:
+        categories = await Category.objects.select_related(
+            ["posts", "created_by__roles"]
+        ).values(nested=True)
+        assert len(categories) == 1
+        category = categories[0]
+        assert [post["name"] for post in category["posts"]] == [
+            "Ormar strikes again!",
+            "Why don't you use ormar yet?",
+            "Check this out, ormar now for free",
+        ]
+        # relations pointing back to the parent are skipped, same as in model_dump()
+        assert category["posts"][0] == {"id": 1, "name": "Ormar strikes again!"}
+        assert category["created_by"]["roles"] == [
+            {"id": 1, "name": "admin", "roleuser": {"id": 1, "role": 1, "user": 1}},
+            {"id": 2, "name": "editor", "roleuser": {"id": 2, "role": 2, "user": 1}},
+        ]
+
+        users = await User.objects.select_related(["roles", "categories"]).values(
+            exclude_through=True, nested=True
+        )
+        assert users == [
+            {
+                "id": 1,
+                "name": "Anonymous",
+                "roles": [{"id": 1, "name": "admin"}, {"id": 2, "name": "editor"}],
+                "categories": [{"id": 1, "name": "News", "sort_order": 0}],
+            }
+        ]
+
+        roles = await Role.objects.select_related("users__categories").values(
+            nested=True
+        )
+        assert roles[0]["users"][0]["categories"][0] == {
+            "id": 1,
+            "name": "News",
+            "sort_order": 0,
+        }
+        assert roles[1]["users"][0]["roleuser"] == {"id": 2, "role": 2, "user": 1}
+
+
+@pytest.mark.asyncio
+async def test_nested_values_without_related_rows():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Category(name="Empty").save()
+            await Post(name="No category").save()
+            categories = (
+                await Category.objects.select_related(["posts", "created_by"])
+                .filter(name="Empty")
+                .values(nested=True)
+            )
+            assert categories == [
+                {
+                    "id": 2,
+                    "name": "Empty",
+                    "sort_order": None,
+                    "created_by": None,
+                    "posts": [],
+                }
+            ]
+            posts = (
+                await Post.objects.select_related("category")
+                .filter(name="No category")
+                .values(nested=True)
+            )
+            assert posts[0]["category"] is None
+
+
+@pytest.mark.asyncio
+async def test_iterate_values():
+    async with base_ormar_config.database:
+        posts = [post async for post in Post.objects.iterate_values()]
+        assert posts == await Post.objects.values()
+
+        categories = [
+            category
+            async for category in Category.objects.select_related(
+                "posts"
+            ).iterate_values(nested=True)
+        ]
+        assert categories == await Category.objects.select_related("posts").values(
+            nested=True
+        )
+        assert len(categories[0]["posts"]) == 3
+
+        roles = [
+            role
+            async for role in Role.objects.select_related("users").iterate_values(
+                ["name", "users__name"], exclude_through=True, nested=True
+            )
+        ]
+        assert roles == [
+            {"name": "admin", "users": [{"name": "Anonymous"}]},
+            {"name": "editor", "users": [{"name": "Anonymous"}]},
+        ]
+
+        user = await User.objects.get()
+        roles = [role async for role in user.roles.iterate_values(nested=True)]
+        assert [role["name"] for role in roles] == ["admin", "editor"]
+        assert roles == await user.roles.values(nested=True)
@@ -0,0 +1,112 @@
+import asyncio
+import uuid
+
+import ormar
+import pytest
+import sqlalchemy
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Event(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="events")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, unique=True)
+    level: int = ormar.Integer(default=1)
+    source: str = ormar.String(max_length=100, server_default="api")
+
+
+class Metric(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="metrics")
+
+    id: uuid.UUID = ormar.UUID(primary_key=True, default=uuid.uuid4)
+    value: float = ormar.Float()
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture()
+def queries(count_queries):
+    return count_queries(
+        base_ormar_config.database,
+        methods=["execute", "fetch_all"],
+        query_type=sqlalchemy.sql.Insert,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_are_batched(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            buffer = ormar.WriteBuffer(Metric, max_batch=20, max_delay_ms=10000)
+            metrics = await asyncio.gather(*(buffer.create(value=i) for i in range(20)))
+            assert len(queries) == 1
+            assert all(metric.saved for metric in metrics)
+            assert [metric.value for metric in metrics] == list(range(20))
+            assert await Metric.objects.count() == 20
+
+            await Event.objects.create(name="Existing")
+            queries.clear()
+            buffer = ormar.WriteBuffer(Event, max_batch=5, max_delay_ms=10000)
+            events = await asyncio.gather(
+                *(buffer.create(name=f"Event {i}") for i in range(5))
+            )
+            assert len(queries) == 1
+            assert all(event.saved and event.level == 1 for event in events)
+            assert all(event.source == "api" for event in events)
+            saved = await Event.objects.exclude(name="Existing").all()
+            assert {event.name: event.id for event in saved} == {
+                event.name: event.id for event in events
+            }
+
+
+def test_returned_rows_are_matched_by_unique_column():
+    buffer = ormar.WriteBuffer(Event)
+    writes = [
+        (event, event._prepare_insert_values(), None)
+        for event in [Event(name="First"), Event(name="Second")]
+    ]
+    assert buffer._get_unique_alias(writes) == "name"
+    assert buffer._get_unique_alias(writes + writes[:1]) is None
+    assert ormar.WriteBuffer(Metric)._get_unique_alias(writes) is None
+
+
+@pytest.mark.asyncio
+async def test_failed_rows_receive_own_errors():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Event.objects.create(name="Existing")
+            buffer = ormar.WriteBuffer(Event, max_batch=3, max_delay_ms=10000)
+            results = await asyncio.gather(
+                buffer.create(name="First"),
+                buffer.save(Event(name="Existing")),
+                buffer.create(name="Second", source="cli"),
+                return_exceptions=True,
+            )
+            assert isinstance(results[1], Exception)
+            assert results[0].saved and results[2].saved
+            assert results[2].source == "cli"
+            names = await Event.objects.order_by("name").values_list(
+                "name", flatten=True
+            )
+            assert names == ["Existing", "First", "Second"]
+
+
+@pytest.mark.asyncio
+async def test_flush_inserts_enqueued_models(queries):
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            async with ormar.WriteBuffer(Metric, max_delay_ms=10000) as buffer:
+                tasks = [
+                    asyncio.ensure_future(buffer.create(value=i)) for i in range(3)
+                ]
+                await asyncio.sleep(0)
+                assert queries == []
+            assert len(queries) == 1
+            assert all(task.done() for task in tasks)
+            assert await Metric.objects.count() == 3
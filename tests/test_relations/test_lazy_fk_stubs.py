@@ -0,0 +1,93 @@
+from typing import Optional
+
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    coauthor: Optional[Author] = ormar.ForeignKey(
+        Author, related_name="cowritten_books"
+    )
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_raw_pk_value_kept_until_accessed():
+    book = Book(title="Lazy", author=1)
+    assert book.__dict__["author"] == 1
+    assert not book._has_relations_manager()
+
+    assert book.model_dump() == {
+        "id": None,
+        "title": "Lazy",
+        "author": {"id": 1},
+        "coauthor": None,
+    }
+    assert book.model_dump(exclude_primary_keys=True) == {
+        "title": "Lazy",
+        "author": {},
+        "coauthor": None,
+    }
+    assert book.model_dump(exclude={"author": {"id"}})["author"] == {}
+    assert book.model_dump(include={"author": {"id"}}) == {"author": {"id": 1}}
+    assert not book._has_relations_manager()
+
+    author = book.author
+    assert isinstance(author, Author)
+    assert author.pk == 1
+    assert author.__pk_only__
+    assert book.__dict__["author"] == author
+    assert author.books[0] == book
+
+
+@pytest.mark.asyncio
+async def test_loaded_rows_keep_raw_fk_values():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Tolkien")
+            coauthor = await Author.objects.create(name="Lewis")
+            await Book.objects.create(title="Hobbit", author=author, coauthor=coauthor)
+
+            book = await Book.objects.get()
+            assert book.__dict__["author"] == author.pk
+            assert book.__dict__["coauthor"] == coauthor.pk
+            assert book.model_dump() == {
+                "id": book.id,
+                "title": "Hobbit",
+                "author": {"id": author.pk},
+                "coauthor": {"id": coauthor.pk},
+            }
+
+            book.title = "The Hobbit"
+            await book.update()
+            book = await Book.objects.select_related(["author", "coauthor"]).get()
+            assert book.title == "The Hobbit"
+            assert book.author.name == "Tolkien"
+            assert book.coauthor.name == "Lewis"
+
+            book = await Book.objects.get()
+            await book.author.load()
+            assert book.author.name == "Tolkien"
+            assert book.author.books[0] == book
+
+            book = await Book.objects.get()
+            assert book.model_dump_json().startswith('{"id":')
+            assert '"coauthor":{"id":' in book.model_dump_json()
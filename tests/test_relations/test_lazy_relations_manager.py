@@ -0,0 +1,75 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=40)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy()
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=200)
+    category: Optional[Category] = ormar.ForeignKey(Category, related_name="posts")
+    tags: Optional[List[Category]] = ormar.ManyToMany(
+        Category, related_name="tagged_posts"
+    )
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_relations_manager_not_created_without_relations():
+    category = Category(name="News")
+    assert not category._has_relations_manager()
+
+    assert category.model_dump() == {
+        "id": None,
+        "name": "News",
+        "posts": [],
+        "tagged_posts": [],
+    }
+    assert category.model_dump(exclude_list=True) == {"id": None, "name": "News"}
+    assert not category._has_relations_manager()
+
+
+def test_relations_created_on_first_access():
+    category = Category(name="News")
+    assert category.posts == []
+    assert category._has_relations_manager()
+    assert list(category._orm._relations.keys()) == ["posts"]
+    assert category.posts._queryset_proxy is None
+
+
+def test_registered_relations_are_visible_from_both_sides():
+    category = Category(name="News")
+    post = Post(title="Hello", category=category)
+    assert post._has_relations_manager()
+    assert category._has_relations_manager()
+    assert category.posts[0] == post
+    assert post.category == category
+    assert post.model_dump()["category"]["name"] == "News"
+
+
+@pytest.mark.asyncio
+async def test_queryset_proxy_created_on_first_query():
+    async with base_ormar_config.database:
+        category = await Category.objects.create(name="News")
+        await Post.objects.create(title="Hello", category=category)
+
+        category = await Category.objects.get()
+        assert not category._has_relations_manager()
+        posts = await category.posts.all()
+        assert len(posts) == 1
+        assert category.posts._queryset_proxy is not None
@@ -0,0 +1,127 @@
+from typing import List, Optional
+
+import ormar
+import pytest
+from ormar.exceptions import NoMatch, QueryDefinitionError
+
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Profile(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="profiles")
+
+    id: int = ormar.Integer(primary_key=True)
+    bio: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    profile: Optional[Profile] = ormar.ForeignKey(Profile)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags: List[Tag] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_sample_data():
+    for i in range(3):
+        profile = await Profile.objects.create(bio=f"Bio {i}")
+        author = await Author.objects.create(name=f"Author {i}", profile=profile)
+        for j in range(2):
+            await Book.objects.create(title=f"Book {i}-{j}", author=author)
+    await Book.objects.create(title="Anonymous")
+
+
+@pytest.mark.asyncio
+async def test_load_related_loads_all_levels_in_place():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            books = await Book.objects.order_by("id").all()
+            stubs = [book.author for book in books[:-1]]
+            assert all(stub.__pk_only__ and stub.name is None for stub in stubs)
+
+            assert await ormar.load_related(books, "author__profile") is books
+            assert [book.author.name for book in books[:-1]] == [
+                "Author 0",
+                "Author 0",
+                "Author 1",
+                "Author 1",
+                "Author 2",
+                "Author 2",
+            ]
+            assert [book.author for book in books[:-1]] == stubs
+            assert books[0].author is stubs[0]
+            assert books[-1].author is None
+            assert [book.author.profile.bio for book in books[:-1:2]] == [
+                "Bio 0",
+                "Bio 1",
+                "Bio 2",
+            ]
+            assert not books[0].author.__pk_only__
+            assert books[0].author.saved
+            assert books[0].model_dump()["author"]["profile"]["bio"] == "Bio 0"
+
+            books = await Book.objects.select_related("author").order_by("id").all()
+            await ormar.load_related(books, [Book.author.profile])
+            assert books[0].author.profile.bio == "Bio 0"
+
+            with pytest.raises(QueryDefinitionError):
+                await ormar.load_related(books, "tags")
+            with pytest.raises(QueryDefinitionError):
+                await ormar.load_related(books, "author__books")
+
+
+@pytest.mark.asyncio
+async def test_fetch_loads_siblings_from_result_set():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await create_sample_data()
+            books = await Book.objects.order_by("id").all()
+            author = await books[2].author.fetch()
+            assert author is books[2].author
+            assert author.name == "Author 1"
+            assert all(not book.author.__pk_only__ for book in books[:-1])
+            assert books[5].author.name == "Author 2"
+            assert books[5].author.profile.__pk_only__
+            await books[5].author.profile.fetch()
+            assert books[5].author.profile.bio == "Bio 2"
+            assert await author.fetch() is author
+
+            books = [book async for book in Book.objects.order_by("id").iterate()]
+            await books[0].author.fetch()
+            assert books[4].author.name == "Author 2"
+
+            book = await Book.objects.get(title="Book 0-0")
+            await book.author.fetch()
+            assert book.author.name == "Author 0"
+
+            author = Author(id=1, __pk_only__=True)
+            assert (await author.fetch()).name == "Author 0"
+            with pytest.raises(NoMatch):
+                await Author(id=100, __pk_only__=True).fetch()
+
+            book = await Book.objects.get(title="Book 1-0")
+            await book.author.load()
+            assert not book.author.__pk_only__